@@ -0,0 +1,64 @@
+"""Measure the time and the memory to load decoded vuln records as models and as columns, and the time to count the
+    vulns by severity from each.
+
+    python benchmarks/columnar.py [--records 100000]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io import columnar  # noqa: E402
+from tenable_io.api.models import VulnsExport  # noqa: E402
+from tenable_io.codec import loads  # noqa: E402
+
+
+def measure(load):
+    """
+    :return: The loaded value, the seconds spent and the number of bytes it holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    value = load()
+    elapsed = time.time() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure models against columns.')
+    parser.add_argument(u'--records', type=int, default=100000, help=u'Number of vulns to load.')
+    args = parser.parse_args()
+
+    records = loads(vulns_chunk(args.records))
+    vulns, models_seconds, models_size = measure(lambda: VulnsExport.from_list(records))
+    batch, columns_seconds, columns_size = measure(lambda: columnar.ColumnarBatch.from_records(records))
+
+    start = time.time()
+    Counter(vuln.severity for vuln in vulns)
+    models_count = time.time() - start
+    start = time.time()
+    severity = batch[u'severity']
+    if columnar.numpy is not None:
+        columnar.numpy.bincount(severity.to_numpy())
+    else:
+        Counter(severity.codes)
+    columns_count = time.time() - start
+
+    for name, seconds, size, count in [(u'models', models_seconds, models_size, models_count),
+                                       (u'columns', columns_seconds, columns_size, columns_count)]:
+        print(u'%-8s load %6.0fms  %5.0f bytes/record  count by severity %6.1fms' %
+              (name, seconds * 1000, float(size) / args.records, count * 1000))
+
+
+if __name__ == u'__main__':
+    main()
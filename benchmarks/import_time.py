@@ -0,0 +1,57 @@
+"""Measure the cold start of the SDK: importing the client, creating it and accessing a first api.
+
+Every sample runs in a fresh interpreter so that nothing is already imported. Run from the repository root:
+
+    python benchmarks/import_time.py [--samples 20]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = u'''
+import json, sys, time
+start = time.time()
+from tenable_io.client import TenableIOClient
+imported = time.time()
+client = TenableIOClient(access_key=u'', secret_key=u'')
+created = time.time()
+client.scans_api
+accessed = time.time()
+print(json.dumps({
+    u'import': imported - start,
+    u'create': created - imported,
+    u'first_api': accessed - created,
+    u'modules': len([m for m in sys.modules if m.startswith(u'tenable_io')]),
+}))
+'''
+
+
+def sample():
+    output = subprocess.check_output([sys.executable, u'-W', u'ignore', u'-c', SAMPLE], cwd=ROOT)
+    return json.loads(output.decode(u'utf-8'))
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure the cold start of the SDK.')
+    parser.add_argument(u'--samples', type=int, default=20, help=u'Number of fresh interpreters to run.')
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.samples)]
+    for key in [u'import', u'create', u'first_api']:
+        print(u'%-10s median %7.2fms  min %7.2fms' % (
+            key, median([s[key] for s in samples]) * 1000, min(s[key] for s in samples) * 1000))
+    print(u'%-10s %d tenable_io modules imported' % (u'modules', samples[0][u'modules']))
+
+
+if __name__ == u'__main__':
+    main()
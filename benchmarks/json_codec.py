@@ -0,0 +1,41 @@
+"""Compare the JSON backends of tenable_io.codec on an export chunk: raw decoding, and decoding into models.
+
+    python benchmarks/json_codec.py [--records 10000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io import codec  # noqa: E402
+from tenable_io.api.models import VulnsExport  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Compare the JSON backends on an export chunk.')
+    parser.add_argument(u'--records', type=int, default=10000, help=u'Number of vulns in the chunk.')
+    parser.add_argument(u'--repeat', type=int, default=5, help=u'Number of runs, the fastest is reported.')
+    args = parser.parse_args()
+
+    chunk = vulns_chunk(args.records)
+    print(u'chunk: %d vulns, %.1fMB' % (args.records, len(chunk) / 1e6))
+
+    baseline = {}
+    for name in codec.available_backends()[::-1]:
+        codec.set_backend(name)
+        results = {
+            u'loads': min(timeit.repeat(lambda: codec.loads(chunk), number=1, repeat=args.repeat)),
+            u'models': min(timeit.repeat(lambda: VulnsExport.from_json_list(chunk), number=1, repeat=args.repeat)),
+        }
+        baseline = baseline or results
+        print(u'%-7s loads %7.1fms (x%.1f)  from_json_list %7.1fms (x%.1f)' % (
+            name, results[u'loads'] * 1000, baseline[u'loads'] / results[u'loads'],
+            results[u'models'] * 1000, baseline[u'models'] / results[u'models']))
+    codec.set_backend()
+
+
+if __name__ == u'__main__':
+    main()
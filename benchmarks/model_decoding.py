@@ -0,0 +1,44 @@
+"""Measure the time to create export models from decoded vuln records, with the generated decoders of
+    BaseModel.from_dict and with setting every key as an attribute.
+
+    python benchmarks/model_decoding.py [--records 20000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io.api import models  # noqa: E402
+from tenable_io.api.models import VulnsExport  # noqa: E402
+from tenable_io.codec import loads  # noqa: E402
+
+
+def setattr_decoders():
+    """Replace the generated decoders of all models by setting every key as an attribute.
+    """
+    for name in dir(models):
+        cls = getattr(models, name)
+        if isinstance(cls, type) and issubclass(cls, models.BaseModel):
+            models._decoders[cls] = models.partial(models._from_dict, cls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure the time to create export models.')
+    parser.add_argument(u'--records', type=int, default=20000, help=u'Number of vulns to create.')
+    parser.add_argument(u'--repeat', type=int, default=5, help=u'Number of runs, the best one is reported.')
+    args = parser.parse_args()
+
+    records = loads(vulns_chunk(args.records))
+    generated = min(timeit.repeat(lambda: VulnsExport.from_list(records), number=1, repeat=args.repeat))
+    setattr_decoders()
+    setattr_ = min(timeit.repeat(lambda: VulnsExport.from_list(records), number=1, repeat=args.repeat))
+
+    for name, seconds in [(u'setattr', setattr_), (u'generated', generated)]:
+        print(u'%-10s %7.1fms  %7.0f records/s' % (name, seconds * 1000, args.records / seconds))
+
+
+if __name__ == u'__main__':
+    main()
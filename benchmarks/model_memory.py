@@ -0,0 +1,48 @@
+"""Measure the memory held per vuln record by the regular and the compact export models.
+
+    python benchmarks/model_memory.py [--records 20000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io.api.models import CompactVulnsExport, VulnsExport  # noqa: E402
+from tenable_io.codec import loads  # noqa: E402
+
+
+def footprint(decode):
+    """
+    :return: The number of bytes still allocated by the records returned by `decode`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    records = decode()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure the memory held per vuln record.')
+    parser.add_argument(u'--records', type=int, default=20000, help=u'Number of vulns to hold.')
+    args = parser.parse_args()
+
+    chunk = vulns_chunk(args.records)
+    results = [
+        (u'dicts', footprint(lambda: loads(chunk))),
+        (u'VulnsExport', footprint(lambda: VulnsExport.from_json_list(chunk))),
+        (u'CompactVulnsExport', footprint(lambda: CompactVulnsExport.from_json_list(chunk))),
+    ]
+    for name, size in results:
+        print(u'%-20s %7.0f bytes/record  %7.1fMB' % (name, float(size) / args.records, size / 1e6))
+
+
+if __name__ == u'__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Synthetic export chunks shaped like the records the exports endpoints return, for the benchmarks."""
+import json
+import random
+
+
+def vuln(i):
+    return {
+        u'asset': {
+            u'hostname': u'host-%d.example.com' % (i % 500),
+            u'uuid': u'5e2e3c6d-0000-4000-8000-%012d' % (i % 500),
+            u'ipv4': u'10.0.%d.%d' % (i % 500 // 250, i % 250),
+            u'last_unauthenticated_results': u'2018-01-01T00:00:00.000Z',
+            u'netbios_name': u'HOST-%d' % (i % 500),
+            u'tracked': True,
+        },
+        u'output': u'The remote service accepts connections encrypted using TLS 1.0. ' * random.randint(1, 8),
+        u'plugin': {
+            u'description': u'The remote service accepts connections encrypted using TLS 1.0. TLS 1.0 has a number of '
+                            u'cryptographic design flaws.',
+            u'family': u'Service detection',
+            u'family_id': 22,
+            u'has_patch': False,
+            u'id': 104743 + i % 2000,
+            u'name': u'TLS Version 1.0 Protocol Detection',
+            u'modification_date': u'2017-11-22T00:00:00Z',
+            u'publication_date': u'2017-11-22T00:00:00Z',
+            u'risk_factor': u'Medium',
+            u'solution': u'Enable support for TLS 1.1 and 1.2, and disable support for TLS 1.0.',
+            u'synopsis': u'The remote service encrypts traffic using an older version of TLS.',
+            u'type': u'remote',
+            u'version': u'1.5',
+        },
+        u'port': {u'port': 443, u'protocol': u'TCP', u'service': u'www'},
+        u'scan': {
+            u'completed_at': u'2018-01-01T00:00:00.000Z',
+            u'schedule_uuid': u'template-ad0e0ac4-0000-0000-0000-000000000000',
+            u'started_at': u'2018-01-01T00:00:00.000Z',
+            u'uuid': u'7c2f7d8e-0000-4000-8000-000000000000',
+        },
+        u'severity': u'medium',
+        u'severity_id': 2,
+        u'severity_default_id': 2,
+        u'severity_modification_type': u'NONE',
+        u'first_found': u'2018-01-01T00:00:00.000Z',
+        u'last_found': u'2018-01-01T00:00:00.000Z',
+        u'state': u'OPEN',
+    }
+
+
+def vulns_chunk(count=10000, seed=0):
+    """
+    :param count: The number of vulns in the chunk.
+    :return: The vulns chunk as JSON encoded bytes.
+    """
+    random.seed(seed)
+    return json.dumps([vuln(i) for i in range(count)]).encode(u'utf-8')
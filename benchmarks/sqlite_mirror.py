@@ -0,0 +1,57 @@
+"""Measure the time to load vuln records into a SQLite mirror and to look them up by plugin, severity and asset.
+
+    python benchmarks/sqlite_mirror.py [--records 100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io.api.models import VulnsExport  # noqa: E402
+from tenable_io.helpers.sync import SqliteSyncStore, SyncHelper  # noqa: E402
+
+
+def timed(f, repeat=1):
+    """
+    :return: The return value of the last call and the best time of a call in milliseconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        value = f()
+        elapsed = (time.time() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return value, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure SQLite mirror lookups.')
+    parser.add_argument(u'--records', type=int, default=100000, help=u'Number of vulns to load.')
+    args = parser.parse_args()
+
+    vulns = VulnsExport.from_json_list(vulns_chunk(args.records))
+    store = SqliteSyncStore()
+
+    def load():
+        for i in range(0, len(vulns), 1000):
+            store.upsert(u'default', SyncHelper.KIND_VULNS, vulns[i:i + 1000])
+        store.commit()
+
+    _, elapsed = timed(load)
+    print(u'load %d vulns: %.0fms' % (len(vulns), elapsed))
+
+    lookups = [
+        (u'plugin 104743', lambda: store.findings(plugin_id=104743)),
+        (u'open medium', lambda: store.findings(severity=u'medium', state=u'open')),
+        (u'asset', lambda: store.findings(asset_uuid=vulns[0].asset.uuid)),
+    ]
+    for name, lookup in lookups:
+        found, elapsed = timed(lookup, repeat=5)
+        print(u'%-16s %6d vulns: %8.1fms' % (name, len(found), elapsed))
+
+
+if __name__ == u'__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Measure the peak memory and the time to process an export chunk loaded whole and streamed, reading each vuln once
+    and dropping it.
+
+    python benchmarks/streaming_chunk.py [--records 20000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import vulns_chunk  # noqa: E402
+from tenable_io.api.exports import STREAM_READ_SIZE  # noqa: E402
+from tenable_io.api.models import VulnsExport  # noqa: E402
+
+
+def measure(process):
+    """
+    :return: The peak number of bytes allocated and the seconds spent by `process`.
+    """
+    tracemalloc.start()
+    start = time.time()
+    process()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure the peak memory of loaded and streamed chunks.')
+    parser.add_argument(u'--records', type=int, default=20000, help=u'Number of vulns in the chunk.')
+    args = parser.parse_args()
+
+    chunk = vulns_chunk(args.records)
+
+    def read_chunk():
+        # The response content is read from the socket in both cases.
+        return bytes(chunk)
+
+    def stream_chunk():
+        for i in range(0, len(chunk), STREAM_READ_SIZE):
+            yield chunk[i:i + STREAM_READ_SIZE]
+
+    def loaded():
+        for vuln in VulnsExport.from_json_list(read_chunk()):
+            vuln.asset.uuid
+
+    def streamed():
+        for vuln in VulnsExport.iter_json_list(stream_chunk()):
+            vuln.asset.uuid
+
+    print(u'chunk %.1fMB' % (len(chunk) / 1e6))
+    for name, process in [(u'loaded', loaded), (u'streamed', streamed)]:
+        peak, elapsed = measure(process)
+        print(u'%-10s peak %7.1fMB  %7.0fms' % (name, peak / 1e6, elapsed * 1000))
+
+
+if __name__ == u'__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Measure the memory held by the vulnerabilities of a synthetic Nessus report, as Vulnerability instances and as
+    Finding instances sharing a plugin table.
+
+    python benchmarks/workbench_memory.py [--hosts 1000] [--items 50]
+"""
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workbench_parser import write_report  # noqa: E402
+from tenable_io.helpers.workbench import Finding, PluginTable, Vulnerability  # noqa: E402
+from tenable_io.parser.workbenches import WorkbenchParser  # noqa: E402
+
+
+def measure(load):
+    """
+    :return: The loaded value and the number of bytes it holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    value = load()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure vulnerabilities against normalized findings.')
+    parser.add_argument(u'--hosts', type=int, default=1000, help=u'Number of hosts in the report.')
+    parser.add_argument(u'--items', type=int, default=50, help=u'Number of report items per host.')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, u'workbench.nessus')
+        write_report(path, args.hosts, args.items)
+
+        def vulnerabilities():
+            return [Vulnerability().from_report_item(item) for item in WorkbenchParser.parse(path, u'ReportItem')]
+
+        def findings():
+            plugins = PluginTable()
+            return [Finding().from_report_item(item, plugins) for item in WorkbenchParser.parse(path, u'ReportItem')]
+
+        for name, load in [(u'Vulnerability', vulnerabilities), (u'Finding', findings)]:
+            loaded, size = measure(load)
+            print(u'%-13s %d: %.1fMB, %d bytes/vulnerability' % (name, len(loaded), size / 1024.0 / 1024.0,
+                                                                 size // len(loaded)))
+            del loaded
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == u'__main__':
+    main()
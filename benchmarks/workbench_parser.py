@@ -0,0 +1,78 @@
+"""Measure the throughput of the WorkbenchParser backends, and of parse_parallel, on a synthetic Nessus report.
+
+    python benchmarks/workbench_parser.py [--hosts 2000] [--items 50] [--repeat 3] [--processes 4]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tenable_io.parser.workbenches import WorkbenchParser  # noqa: E402
+
+REPORT_ITEM = u'''<ReportItem port="443" svc_name="www" protocol="tcp" severity="2" pluginID="%(plugin_id)d"
+ pluginName="TLS Version 1.0 Protocol Detection" pluginFamily="Service detection">
+<cve>CVE-2011-3389</cve><cve>CVE-2015-0204</cve>
+<cvss_base_score>5.0</cvss_base_score><cvss_vector>CVSS2#AV:N/AC:L/Au:N/C:P/I:N/A:N</cvss_vector>
+<description>The remote service accepts connections encrypted using TLS 1.0. TLS 1.0 has a number of cryptographic
+design flaws.</description>
+<plugin_output>TLSv1 is enabled and the server supports at least one cipher.</plugin_output>
+<risk_factor>Medium</risk_factor><see_also>https://tools.ietf.org/html/draft-ietf-tls-oldversions-deprecate-00
+</see_also><solution>Enable support for TLS 1.2 and 1.3, and disable support for TLS 1.0.</solution>
+<synopsis>The remote service encrypts traffic using an older version of TLS.</synopsis>
+<xref>CWE:327</xref>
+</ReportItem>
+'''
+
+
+def write_report(path, hosts, items):
+    with open(path, 'wb') as fd:
+        fd.write(b'<?xml version="1.0" ?>\n<NessusClientData_v2>\n<Report name="Workbench">\n')
+        for host in range(hosts):
+            fd.write((
+                u'<ReportHost name="10.0.%d.%d"><HostProperties><tag name="host-ip">10.0.%d.%d</tag>'
+                u'<tag name="hostname">host-%d</tag><tag name="operating-system">Linux</tag></HostProperties>\n'
+                % (host // 250, host % 250, host // 250, host % 250, host)
+            ).encode(u'utf-8'))
+            fd.write(u''.join(REPORT_ITEM % {u'plugin_id': 104743 + item} for item in range(items)).encode(u'utf-8'))
+            fd.write(b'</ReportHost>\n')
+        fd.write(b'</Report>\n</NessusClientData_v2>\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=u'Measure WorkbenchParser backends.')
+    parser.add_argument(u'--hosts', type=int, default=2000, help=u'Number of hosts in the report.')
+    parser.add_argument(u'--items', type=int, default=50, help=u'Number of report items per host.')
+    parser.add_argument(u'--repeat', type=int, default=3, help=u'Number of runs per backend, the best is reported.')
+    parser.add_argument(u'--processes', type=int, default=None, help=u'Number of processes of parse_parallel. '
+                        u'Default to the number of CPUs.')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, u'workbench.nessus')
+        write_report(path, args.hosts, args.items)
+        size = os.path.getsize(path) / 1024.0 / 1024.0
+        print(u'report: %.0fMB, %d hosts, %d items' % (size, args.hosts, args.hosts * args.items))
+
+        runs = [(backend, lambda backend=backend: WorkbenchParser.parse(path, backend=backend))
+                for backend in WorkbenchParser.BACKENDS]
+        runs.append((u'parallel', lambda: WorkbenchParser.parse_parallel(
+            path, processes=args.processes, batch_size=1024 * 1024)))
+        for name, parse in runs:
+            best = None
+            for _ in range(args.repeat):
+                start = time.time()
+                count = sum(len(report[u'report_items']) for report in parse())
+                elapsed = time.time() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(u'%-8s %d items: %.2fs, %.1fMB/s' % (name, count, best, size / best))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == u'__main__':
+    main()
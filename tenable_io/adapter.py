@@ -0,0 +1,95 @@
+import socket
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+def tcp_keepalive_socket_options(idle=60, interval=20, count=5):
+    """
+    :param idle: The number of idle seconds before sending keep-alive probes, where supported. Default to 60.
+    :param interval: The number of seconds between keep-alive probes, where supported. Default to 20.
+    :param count: The number of unanswered probes before the connection is dropped, where supported. Default to 5.
+    :return: The socket options enabling TCP keep-alive, in addition to urllib3's default options.
+    """
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in [('TCP_KEEPIDLE', idle), ('TCP_KEEPINTVL', interval), ('TCP_KEEPCNT', count)]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class TenableIOHTTPAdapter(HTTPAdapter):
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, socket_options=None, **kwargs):
+        """HTTP adapter with configurable socket options and connection pool statistics.
+
+        :param socket_options: The socket options of new connections, as a list of `(level, option, value)`. Default
+            to None, for urllib3's default options.
+        :param kwargs: Keyword arguments of :class:`requests.adapters.HTTPAdapter`, i.e. `pool_connections`,
+            `pool_maxsize`, `pool_block` and `max_retries`.
+        """
+        self.socket_options = socket_options
+        super(TenableIOHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs['socket_options'] = self.socket_options
+        super(TenableIOHTTPAdapter, self).init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _StatsHTTPConnectionPool,
+            'https': _StatsHTTPSConnectionPool,
+        }
+
+    def stats(self):
+        """
+        :return: The statistics of the connection pools currently kept, as a dict of:
+            `pools`: The number of connection pools, one per host.
+            `requests`: The number of requests sent.
+            `connections`: The number of connections opened, i.e. pool misses.
+            `reused`: The number of requests sent on an already opened connection, i.e. pool hits.
+        """
+        pools = [self.poolmanager.pools.get(key) for key in self.poolmanager.pools.keys()]
+        pools = [pool for pool in pools if pool is not None]
+        requests = sum(pool.num_requests for pool in pools)
+        connections = sum(getattr(pool, 'num_connects', pool.num_connections) for pool in pools)
+        return {
+            u'pools': len(pools),
+            u'requests': requests,
+            u'connections': connections,
+            u'reused': max(requests - connections, 0),
+        }
+
+
+class _StatsConnectionPoolMixin(object):
+    """Counts the connections actually opened. urllib3's `num_connections` misses the connections reopened after the
+        server closed them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_StatsConnectionPoolMixin, self).__init__(*args, **kwargs)
+        self.num_connects = 0
+        self._num_connects_lock = threading.Lock()
+
+    def _new_conn(self):
+        conn = super(_StatsConnectionPoolMixin, self)._new_conn()
+        connect = conn.connect
+
+        def counting_connect(*args, **kwargs):
+            with self._num_connects_lock:
+                self.num_connects += 1
+            return connect(*args, **kwargs)
+
+        conn.connect = counting_connect
+        return conn
+
+
+class _StatsHTTPConnectionPool(_StatsConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _StatsHTTPSConnectionPool(_StatsConnectionPoolMixin, HTTPSConnectionPool):
+    pass
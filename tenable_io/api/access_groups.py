@@ -1,8 +1,7 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.base import BaseRequest
 from tenable_io.api.models import AccessGroup, AccessGroupList, AssetRule, AssetRuleFilter, AssetRulePrincipal, Filters
+from tenable_io.codec import loads
 
 
 class AccessGroupsApi(BaseApi):
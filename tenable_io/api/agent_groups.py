@@ -1,7 +1,6 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import AgentGroup, AgentGroupList, AgentList
+from tenable_io.codec import loads
 
 
 class AgentGroupsApi(BaseApi):
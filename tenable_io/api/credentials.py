@@ -1,7 +1,6 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import CredentialList, CredentialDetails, CredentialPermission, CredentialPrimitiveType
+from tenable_io.codec import loads
 
 
 class CredentialsApi(BaseApi):
@@ -1,9 +1,12 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
-from tenable_io.api.models import AssetsExport, ExportsAssetsStatus, ExportsVulnsStatus, VulnsExport
+from tenable_io.api.models import AssetsExport, CompactAssetsExport, CompactVulnsExport, ExportsAssetsStatus, \
+    ExportsVulnsStatus, VulnsExport
+from tenable_io.codec import loads
 from tenable_io.util import payload_filter
 
+# The size of the reads of a streamed chunk, bounding the memory held besides the record being decoded.
+STREAM_READ_SIZE = 64 * 1024
+
 
 class ExportsApi(BaseApi):
 
@@ -29,17 +32,27 @@ class ExportsApi(BaseApi):
                                     path_params={'export_uuid': export_uuid})
         return ExportsVulnsStatus.from_json(response.text)
 
-    def vulns_chunk(self, export_uuid, chunk_id):
+    def vulns_chunk(self, export_uuid, chunk_id, compact=False, lazy=False, stream=False):
         """Retrieve vulnerability chunk by ID.
 
         :param export_uuid: The export request UUID.
         :param chunk_id: The chunk ID.
+        :param compact: If True, return compact models using a fraction of the memory. Default to False.
+        :param lazy: If True, keep the asset, plugin, port and scan of the vulns as decoded JSON until they are first
+            read. Ignored if compact. Default to False.
+        :param stream: If True, return an iterator decoding the vulns one at a time while the chunk is downloaded,
+            holding about one vuln in memory. Default to False.
         :raise TenableIOApiException:  When API error is encountered.
-        :return: A list of :class:`tenable_io.api.models.VulnsExport` instances.
+        :return: A list of :class:`tenable_io.api.models.VulnsExport` instances, or of
+            :class:`tenable_io.api.models.CompactVulnsExport` instances if compact. An iterator of them if stream.
         """
         response = self._client.get('vulns/export/%(export_uuid)s/chunks/%(chunk_id)s',
-                                    path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id})
-        return VulnsExport.from_json_list(response.text)
+                                    path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id},
+                                    stream=stream)
+        model_class = CompactVulnsExport if compact else VulnsExport
+        if stream:
+            return _iter_response(response, model_class, lazy)
+        return model_class.from_json_list(response.content, lazy=lazy)
 
     def vulns_download_chunk(self, export_uuid, chunk_id, stream=True, chunk_size=1024):
         """Download vulnerability chunk by ID.
@@ -52,7 +65,7 @@ class ExportsApi(BaseApi):
         response = self._client.get('vulns/export/%(export_uuid)s/chunks/%(chunk_id)s',
                                     path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id},
                                     stream=stream)
-        return response.iter_content(chunk_size=chunk_size)
+        return _iter_content(response, chunk_size)
 
     def assets_request_export(self, exports_assets):
         """Exports all assets in your container that match the request criteria.
@@ -75,18 +88,26 @@ class ExportsApi(BaseApi):
                                     path_params={'export_uuid': export_uuid})
         return ExportsAssetsStatus.from_json(response.text)
 
-    def assets_chunk(self, export_uuid, chunk_id):
+    def assets_chunk(self, export_uuid, chunk_id, compact=False, stream=False):
         """Retrieve chunk by id. Chunks are available for export for up to 24 hours after they have been created. A
             404 is returned for expired chunks.
 
         :param export_uuid: The UUID for the export request.
         :param chunk_id: The ID of the asset chunk you want to export.
+        :param compact: If True, return compact models using a fraction of the memory. Default to False.
+        :param stream: If True, return an iterator decoding the assets one at a time while the chunk is downloaded,
+            holding about one asset in memory. Default to False.
         :raise TenableIOApiException:  When API error is encountered.
-        :return: A list of :class:`tenable_io.api.models.AssetsExport` instances.
+        :return: A list of :class:`tenable_io.api.models.AssetsExport` instances, or of
+            :class:`tenable_io.api.models.CompactAssetsExport` instances if compact. An iterator of them if stream.
         """
         response = self._client.get('assets/export/%(export_uuid)s/chunks/%(chunk_id)s',
-                                    path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id})
-        return AssetsExport.from_json_list(response.text)
+                                    path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id},
+                                    stream=stream)
+        model_class = CompactAssetsExport if compact else AssetsExport
+        if stream:
+            return _iter_response(response, model_class)
+        return model_class.from_json_list(response.content)
 
     def assets_download_chunk(self, export_uuid, chunk_id, stream=True, chunk_size=1024):
         """Download chunk by id. Chunks are available for download for up to 24 hours after they have been created. A
@@ -100,7 +121,33 @@ class ExportsApi(BaseApi):
         response = self._client.get('assets/export/%(export_uuid)s/chunks/%(chunk_id)s',
                                     path_params={'export_uuid': export_uuid, 'chunk_id': chunk_id},
                                     stream=stream)
-        return response.iter_content(chunk_size=chunk_size)
+        return _iter_content(response, chunk_size)
+
+
+def _iter_content(response, chunk_size):
+    """
+    :param response: The response of a chunk.
+    :param chunk_size: The size of the content chunks.
+    :return: Iterator that yields the content chunks, closing the response once exhausted or closed.
+    """
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            yield chunk
+    finally:
+        response.close()
+
+
+def _iter_response(response, model_class, lazy=False):
+    """
+    :param response: The streamed response of a chunk.
+    :param model_class: The class of the records.
+    :return: Iterator that yields the records decoded from the response, closed once exhausted or abandoned.
+    """
+    try:
+        for record in model_class.iter_json_list(response.iter_content(chunk_size=STREAM_READ_SIZE), lazy=lazy):
+            yield record
+    finally:
+        response.close()
 
 
 class ExportsAssetsRequest(BaseRequest):
@@ -1,8 +1,7 @@
 import os
 
-from json import loads
-
 from tenable_io.api.base import BaseApi
+from tenable_io.codec import loads
 
 
 class FileApi(BaseApi):
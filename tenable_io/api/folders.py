@@ -1,7 +1,6 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import FolderList
+from tenable_io.codec import loads
 
 
 class FoldersApi(BaseApi):
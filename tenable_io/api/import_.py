@@ -1,7 +1,6 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import ImportAsset, ImportAssetJob, ImportAssetJobs
+from tenable_io.codec import loads
 
 
 class ImportApi(BaseApi):
@@ -1,34 +1,75 @@
-from json import loads
+import six
 
+from functools import partial
+
+from tenable_io.codec import iter_array, loads
 from tenable_io.exceptions import TenableIOException
 from tenable_io.util import payload_filter
 
 
 class BaseModel(object):
 
+    # Empty so that subclasses declaring `__slots__`, i.e. CompactModel, have no per-instance dict.
+    __slots__ = ()
+
     @classmethod
-    def from_json(cls, json):
-        return cls.from_dict(loads(json))
+    def from_json(cls, json, lazy=False):
+        return cls.from_dict(loads(json), lazy=lazy)
 
     @classmethod
-    def from_dict(cls, dict_):
-        instance = cls()
-        for key in dict_:
-            setattr(instance, key, dict_[key])
-        return instance
+    def from_dict(cls, dict_, lazy=False):
+        """
+        :param dict_: The decoded JSON object.
+        :param lazy: Keep the nested models of the properties decorated with :meth:`_lazy` as decoded JSON until they
+            are first read. Default to False.
+        :return: An instance of the class.
+        """
+        # The decoders of each class are generated on first use, see _build_decoder.
+        decoder = (_lazy_decoders if lazy else _decoders).get(cls)
+        if decoder is None:
+            decoder = _decoder(cls, lazy)
+        return decoder(dict_)
 
     @classmethod
-    def from_list(cls, list_):
+    def from_list(cls, list_, lazy=False):
         model_list = None
         if list_ is not None:
-            model_list = []
-            for item in list_:
-                model_list.append(cls.from_dict(item))
+            from_dict = cls.from_dict
+            model_list = [from_dict(item, lazy=lazy) for item in list_]
         return model_list
 
     @classmethod
-    def from_json_list(cls, json_list):
-        return cls.from_list(loads(json_list))
+    def from_json_list(cls, json_list, lazy=False):
+        return cls.from_list(loads(json_list), lazy=lazy)
+
+    @classmethod
+    def iter_json_list(cls, chunks, lazy=False):
+        """Decode a JSON array incrementally, see :func:`tenable_io.codec.iter_array`.
+
+        :param chunks: An iterable of the JSON array as UTF-8 bytes or text chunks.
+        :param lazy: See :meth:`from_dict`. Default to False.
+        :return: Iterator that yields instances of the class.
+        """
+        from_dict = cls.from_dict
+        for item in iter_array(chunks):
+            yield from_dict(item, lazy=lazy)
+
+    @staticmethod
+    def _lazy(f):
+        """
+        :param f: The getter of a property decorated with :meth:`_model` or :meth:`_model_list`.
+        :return: A decorator that hydrates the value kept as decoded JSON by `from_dict(..., lazy=True)`, on first
+            read.
+        """
+        def wrapper(self):
+            value = f(self)
+            if type(value) is LazyValue:
+                # The property setter converts the decoded JSON.
+                setattr(self, value.name, value.value)
+                value = f(self)
+            return value
+        wrapper.lazy = True
+        return wrapper
 
     @staticmethod
     def _model_list(class_):
@@ -52,6 +93,7 @@ class BaseModel(object):
                     f(self, model_list)
                 else:
                     f(self, [])
+            wrapper.model_list_class = class_
             return wrapper
         return decorator
 
@@ -73,6 +115,7 @@ class BaseModel(object):
                     f(self, None)
                 else:
                     raise TenableIOException(u'Invalid value type.')
+            wrapper.model_class = class_
             return wrapper
         return decorator
 
@@ -80,6 +123,273 @@ class BaseModel(object):
         return payload_filter(self.__dict__, filter_)
 
 
+# Default values that instances can share, so decoders can assign them without calling the constructor.
+_IMMUTABLE_TYPES = (type(None), bool, float, tuple) + six.integer_types + six.string_types
+
+# The decoders of the model classes, built on first use by _decoder.
+_decoders = {}
+_lazy_decoders = {}
+
+
+class LazyValue(object):
+
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value):
+        """Decoded JSON of a nested model kept by `BaseModel.from_dict(..., lazy=True)`, until the property is read.
+
+        :param name: The property name.
+        :param value: The decoded JSON object or list.
+        """
+        self.name = name
+        self.value = value
+
+
+def _from_dict(cls, dict_):
+    instance = cls()
+    for key in dict_:
+        setattr(instance, key, dict_[key])
+    return instance
+
+
+def _decoder(cls, lazy=False, building=None):
+    """
+    :param cls: A subclass of :class:`BaseModel`.
+    :param lazy: Whether to return the lazy decoder.
+    :param building: The classes whose decoder is being built, for models nested in themselves.
+    :return: The decoder of `cls`, see :func:`_build_decoder`.
+    """
+    decoders = _lazy_decoders if lazy else _decoders
+    decoder = decoders.get(cls)
+    if decoder is None:
+        decoder = decoders[cls] = _build_decoder(cls, lazy, building if building is not None else set())
+    return decoder
+
+
+def _build_decoder(cls, lazy, building):
+    """Generate the function creating an instance of a model from a dict, equivalent to creating it with the default
+        constructor arguments then setting every key as an attribute, but without calling the constructor and the
+        property setters.
+
+    The attributes set by the constructor are found from a default instance. Keys of plain attributes are assigned
+    directly, and keys of properties decorated with :meth:`BaseModel._model` or :meth:`BaseModel._model_list` are
+    decoded with the decoder of their model class directly. Other keys are still set with `setattr`. Classes whose
+    constructor requires arguments or sets mutable attributes fall back to setting every key.
+
+    Lazy decoders keep the values of the properties whose getter is decorated with :meth:`BaseModel._lazy` as
+    instances of :class:`LazyValue` instead, and decode nested models eagerly.
+
+    :param cls: A subclass of :class:`BaseModel`.
+    :param lazy: Whether to generate the lazy decoder.
+    :param building: The classes whose decoder is being built.
+    :return: A function taking a dict and returning an instance of `cls`.
+    """
+    try:
+        defaults = vars(cls())
+    except Exception:
+        return partial(_from_dict, cls)
+
+    building.add(cls)
+    namespace = {u'cls': cls, u'new': object.__new__, u'setattr': setattr, u'LazyValue': LazyValue}
+    lines = []
+    known = set()
+    # Attributes are set in the order of the constructor, which keeps instances compact on Python 3.
+    for i, name in enumerate(defaults):
+        key = name[1:] if name.startswith(u'_') else None
+        property_ = _class_attribute(cls, key) if key else None
+        setter = getattr(property_, u'fset', None)
+        model_class = getattr(setter, u'model_class', None)
+        class_ = model_class or getattr(setter, u'model_list_class', None)
+
+        if class_ is not None:
+            if class_ in building or class_.from_dict.__func__ is not BaseModel.from_dict.__func__:
+                decode = class_.from_dict
+            else:
+                decode = _decoder(class_, building=building)
+            if model_class is not None:
+                convert = _model_converter(class_, decode)
+            else:
+                convert = _model_list_converter(class_, decode)
+            namespace[u'decode_%d' % i] = decode
+            namespace[u'convert_%d' % i] = convert
+
+            if defaults[name] == convert(None) and lazy and getattr(property_.fget, u'lazy', False):
+                lines.append(u'value = get(%r)' % key)
+                lines.append(u'instance.%s = convert_%d(value) if value is None else LazyValue(%r, value)' %
+                             (name, i, key))
+            elif defaults[name] == convert(None):
+                if model_class is not None:
+                    lines.append(u'value = get(%r)' % key)
+                    lines.append(u'instance.%s = decode_%d(value) if type(value) is dict else convert_%d(value)' %
+                                 (name, i, i))
+                else:
+                    lines.append(u'instance.%s = convert_%d(get(%r))' % (name, i, key))
+            elif defaults[name] is None:
+                # The constructor does not set the property.
+                lines.append(u'instance.%s = convert_%d(dict_[%r]) if %r in dict_ else None' % (name, i, key, key))
+            else:
+                return partial(_from_dict, cls)
+            known.add(key)
+        elif isinstance(defaults[name], _IMMUTABLE_TYPES) and \
+                not hasattr(_class_attribute(cls, name), u'__set__'):
+            if defaults[name] is None:
+                lines.append(u'instance.%s = get(%r)' % (name, name))
+            else:
+                namespace[u'default_%d' % i] = defaults[name]
+                lines.append(u'instance.%s = get(%r, default_%d)' % (name, name, i))
+            known.add(name)
+        else:
+            return partial(_from_dict, cls)
+
+    namespace[u'known'] = frozenset(known)
+    source = u'\n    '.join([
+        u'def decode(dict_):',
+        u'get = dict_.get',
+        u'instance = new(cls)',
+    ] + lines + [
+        u'if not known.issuperset(dict_):',
+        u'    for key in dict_:',
+        u'        if key not in known:',
+        u'            setattr(instance, key, dict_[key])',
+        u'return instance',
+    ])
+    six.exec_(source, namespace)
+    return namespace[u'decode']
+
+
+def _class_attribute(cls, name):
+    for class_ in cls.__mro__:
+        if name in class_.__dict__:
+            return class_.__dict__[name]
+    return None
+
+
+def _model_converter(class_, decode):
+    def convert_model(value):
+        if value is None or isinstance(value, class_):
+            return value
+        if isinstance(value, dict):
+            return decode(value)
+        raise TenableIOException(u'Invalid value type.')
+    return convert_model
+
+
+def _model_list_converter(class_, decode):
+    def convert_item(item):
+        if isinstance(item, class_):
+            return item
+        if isinstance(item, dict):
+            return decode(item)
+        raise TenableIOException(u'Invalid element type.')
+
+    def convert_list(list_):
+        if not isinstance(list_, list):
+            return []
+        return [decode(item) if type(item) is dict else convert_item(item) for item in list_]
+    return convert_list
+
+
+class CompactModel(BaseModel):
+    """Model storing its fields in `__slots__` rather than a per-instance dict, to hold large numbers of export records
+        in memory. Subclasses declare their fields as `__slots__`, and the classes of their nested models in `_models`
+        and `_model_lists`.
+
+    Keys that are not declared fields, i.e. added to the API after the model, are kept in the `extra` dict, None if
+    there are none, and are also readable as attributes like with other models.
+    """
+
+    __slots__ = ('extra',)
+
+    # Field name to the class of the nested model or of the elements of the nested list of models.
+    _models = {}
+    _model_lists = {}
+
+    def __init__(self, **kwargs):
+        for name in self._fields():
+            setattr(self, name, None)
+        self.extra = None
+        for name in kwargs:
+            setattr(self, name, kwargs[name])
+
+    def __getattr__(self, name):
+        # Only called when the attribute is not a field.
+        extra = self.extra if name != 'extra' else None
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    @classmethod
+    def _fields(cls):
+        """
+        :return: The field names, in declaration order.
+        """
+        fields = cls.__dict__.get('_field_names')
+        if fields is None:
+            fields = tuple(name for class_ in reversed(cls.__mro__) for name in class_.__dict__.get('__slots__', ())
+                           if name != 'extra')
+            cls._field_names = fields
+        return fields
+
+    @classmethod
+    def from_dict(cls, dict_, lazy=False, strings=None):
+        """
+        :param dict_: The decoded JSON object.
+        :param lazy: Ignored, compact models are always decoded eagerly.
+        :param strings: A dict used to share equal string values among the models created with it, instead of holding
+            a copy per model, i.e. the plugin descriptions of vulns. Default to None, for no sharing.
+        :return: An instance of the class.
+        """
+        instance = cls()
+        fields = cls._fields()
+        for key in dict_:
+            value = dict_[key]
+            if key not in fields:
+                if instance.extra is None:
+                    instance.extra = {}
+                instance.extra[key] = value
+                continue
+            if strings is not None and isinstance(value, six.string_types):
+                value = strings.setdefault(value, value)
+            elif key in cls._models and isinstance(value, dict):
+                value = cls._models[key].from_dict(value, strings=strings)
+            elif key in cls._model_lists and isinstance(value, list):
+                class_ = cls._model_lists[key]
+                value = [class_.from_dict(item, strings=strings) if isinstance(item, dict) else item for item in value]
+            setattr(instance, key, value)
+        return instance
+
+    @classmethod
+    def from_list(cls, list_, lazy=False):
+        if list_ is None:
+            return None
+        # Records of a same list, i.e. an export chunk, mostly repeat the same strings.
+        strings = {}
+        return [cls.from_dict(item, strings=strings) for item in list_]
+
+    @classmethod
+    def iter_json_list(cls, chunks, lazy=False):
+        strings = {}
+        for item in iter_array(chunks):
+            yield cls.from_dict(item, strings=strings)
+
+    def as_dict(self):
+        """
+        :return: The fields and the extra keys as a dict, nested models included.
+        """
+        dict_ = dict(self.extra) if self.extra else {}
+        for name in self._fields():
+            value = getattr(self, name)
+            if isinstance(value, CompactModel):
+                value = value.as_dict()
+            elif isinstance(value, list):
+                value = [item.as_dict() if isinstance(item, CompactModel) else item for item in value]
+            dict_[name] = value
+        return dict_
+
+    def as_payload(self, filter_=None):
+        return payload_filter(self.as_dict(), filter_)
+
+
 class Filter(BaseModel):
 
     def __init__(
@@ -1461,11 +1771,11 @@ class ScanInfo(BaseModel):
         self._agent_targets = agent_targets
 
     @classmethod
-    def from_dict(cls, dict_):
+    def from_dict(cls, dict_, lazy=False):
         # Because API uses "pci-can-upload" API uses "pci-can-upload" which is not a valid python attribute name.
         if 'pci-can-upload' in dict_:
             dict_['pci_can_upload'] = dict_.pop('pci-can-upload')
-        return super(ScanInfo, cls).from_dict(dict_)
+        return super(ScanInfo, cls).from_dict(dict_, lazy=lazy)
 
     def as_payload(self, filter_=None):
         # Because API uses "pci-can-upload" API uses "pci-can-upload" which is not a valid python attribute name.
@@ -1504,6 +1814,7 @@ class ScanDetails(BaseModel):
         self.filters = filters
 
     @property
+    @BaseModel._lazy
     def info(self):
         return self._info
 
@@ -1513,6 +1824,7 @@ class ScanDetails(BaseModel):
         self._info = info
 
     @property
+    @BaseModel._lazy
     def history(self):
         return self._history
 
@@ -1522,6 +1834,7 @@ class ScanDetails(BaseModel):
         self._history = history
 
     @property
+    @BaseModel._lazy
     def hosts(self):
         return self._hosts
 
@@ -2530,13 +2843,13 @@ class UserKeys(BaseModel):
         self.secret_key = secret_key
 
     @classmethod
-    def from_dict(cls, dict_):
+    def from_dict(cls, dict_, lazy=False):
         # Because API uses camelCase for some reason; normalize to underscore here.
         if 'accessKey' in dict_:
             dict_['access_key'] = dict_.pop('accessKey')
         if 'secretKey' in dict_:
             dict_['secret_key'] = dict_.pop('secretKey')
-        return super(UserKeys, cls).from_dict(dict_)
+        return super(UserKeys, cls).from_dict(dict_, lazy=lazy)
 
     def as_payload(self, filter_=None):
         # Because API uses camelCase for some reason; normalize to underscore here.
@@ -3127,7 +3440,11 @@ class AssetsAssetDetails(AssetsAsset):
 
 class ExportsAssetsStatus(BaseModel):
 
+    STATUS_QUEUED = u'QUEUED'
+    STATUS_PROCESSING = u'PROCESSING'
     STATUS_FINISHED = u'FINISHED'
+    STATUS_CANCELLED = u'CANCELLED'
+    STATUS_ERROR = u'ERROR'
 
     def __init__(
             self,
@@ -3281,7 +3598,11 @@ class AssetsExport(BaseModel):
 
 class ExportsVulnsStatus(BaseModel):
 
+    STATUS_QUEUED = u'QUEUED'
+    STATUS_PROCESSING = u'PROCESSING'
     STATUS_FINISHED = u'FINISHED'
+    STATUS_CANCELLED = u'CANCELLED'
+    STATUS_ERROR = u'ERROR'
 
     def __init__(
             self,
@@ -3410,6 +3731,7 @@ class VulnsExport(BaseModel):
         self.state = state
 
     @property
+    @BaseModel._lazy
     def asset(self):
         return self._asset
 
@@ -3419,6 +3741,7 @@ class VulnsExport(BaseModel):
         self._asset = asset
 
     @property
+    @BaseModel._lazy
     def plugin(self):
         return self._plugin
 
@@ -3428,6 +3751,7 @@ class VulnsExport(BaseModel):
         self._plugin = plugin
 
     @property
+    @BaseModel._lazy
     def port(self):
         return self._port
 
@@ -3437,6 +3761,7 @@ class VulnsExport(BaseModel):
         self._port = port
 
     @property
+    @BaseModel._lazy
     def scan(self):
         return self._scan
 
@@ -3446,6 +3771,67 @@ class VulnsExport(BaseModel):
         self._scan = scan
 
 
+class CompactAssetsAssetSource(CompactModel):
+    __slots__ = ('name', 'last_seen', 'first_seen')
+
+
+class CompactAssetTag(CompactModel):
+    __slots__ = ('uuid', 'key', 'value', 'added_by', 'added_at')
+
+
+class CompactAssetsExport(CompactModel):
+    """Compact :class:`AssetsExport`, see :class:`CompactModel`.
+    """
+
+    __slots__ = ('id', 'has_agent', 'has_plugin_results', 'created_at', 'terminated_at', 'terminated_by', 'updated_at',
+                 'deleted_at', 'deleted_by', 'first_seen', 'last_seen', 'first_scan_time', 'last_scan_time',
+                 'last_authenticated_scan_date', 'last_licensed_scan_date', 'azure_vm_id', 'azure_resource_id',
+                 'aws_ec2_instance_ami_id', 'aws_ec2_instance_id', 'agent_uuid', 'bios_uuid', 'environment_id',
+                 'aws_owner_id', 'aws_availability_zone', 'aws_region', 'aws_vpc_id', 'aws_ec2_instance_group_name',
+                 'aws_ec2_instance_state_name', 'aws_ec2_instance_type', 'aws_subnet_id', 'aws_ec2_product_code',
+                 'aws_ec2_name', 'mcafee_epo_guid', 'mcafee_epo_agent_guid', 'servicenow_sysid', 'agent_names',
+                 'ipv4s', 'ipv6s', 'fqdns', 'mac_addresses', 'netbios_names', 'operating_systems', 'system_types',
+                 'hostnames', 'ssh_fingerprints', 'qualys_asset_ids', 'qualys_host_ids', 'manufacturer_tpm_ids',
+                 'symantec_ep_hardware_keys', 'sources', 'tags', 'network_interfaces')
+
+    _model_lists = {
+        'sources': CompactAssetsAssetSource,
+        'tags': CompactAssetTag,
+    }
+
+
+class CompactVulnsAsset(CompactModel):
+    __slots__ = ('hostname', 'uuid', 'ipv4', 'last_unauthenticated_results', 'netbios_name', 'tracked')
+
+
+class CompactVulnsPlugin(CompactModel):
+    __slots__ = ('description', 'family', 'family_id', 'has_patch', 'id', 'name', 'modification_date',
+                 'publication_date', 'risk_factor', 'solution', 'synopsis', 'type', 'version')
+
+
+class CompactVulnsPort(CompactModel):
+    __slots__ = ('port', 'protocol')
+
+
+class CompactVulnsScan(CompactModel):
+    __slots__ = ('completed_at', 'schedule_uuid', 'started_at', 'uuid')
+
+
+class CompactVulnsExport(CompactModel):
+    """Compact :class:`VulnsExport`, see :class:`CompactModel`.
+    """
+
+    __slots__ = ('asset', 'output', 'plugin', 'port', 'scan', 'severity', 'severity_id', 'severity_default_id',
+                 'severity_modification_type', 'first_found', 'last_found', 'state')
+
+    _models = {
+        'asset': CompactVulnsAsset,
+        'plugin': CompactVulnsPlugin,
+        'port': CompactVulnsPort,
+        'scan': CompactVulnsScan,
+    }
+
+
 class Vulnerability(BaseModel):
 
     def __init_(
@@ -3722,7 +4108,7 @@ class TagValueFilters(BaseModel):
         }
 
     @classmethod
-    def from_dict(cls, dict_):
+    def from_dict(cls, dict_, lazy=False):
         inner = loads(list(dict_.values())[0])
         operator = list(inner.keys())[0]
         filters = [TagValueFilter.from_dict(f) for f in list(inner.values())[0]]
@@ -3774,11 +4160,11 @@ class TagValue(BaseModel):
         self._filters = filters
 
     @classmethod
-    def from_json(cls, json):
+    def from_json(cls, json, lazy=False):
         parsed = loads(json)
         if 'filters' in parsed:
             parsed['filters'] = TagValueFilters.from_dict(dict_=parsed['filters'])
-        return cls.from_dict(parsed)
+        return cls.from_dict(parsed, lazy=lazy)
 
 
 class TagValueList(BaseModel):
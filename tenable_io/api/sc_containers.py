@@ -1,7 +1,6 @@
-import json
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import ScContainer
+from tenable_io.codec import loads
 
 
 class ScContainersApi(BaseApi):
@@ -20,7 +19,7 @@ class ScContainersApi(BaseApi):
         uri = 'container-security/api/v1/container/%(repository_name)s/manifests/%%(sha256)s' % \
               {'repository_name': repository_name}
         response = self._client.delete(uri, path_params={'sha256': sha256})
-        return json.loads(response.text)
+        return loads(response.text)
 
     def list(self):
         """List container images stored.
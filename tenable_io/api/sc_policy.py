@@ -1,6 +1,5 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
+from tenable_io.codec import loads
 
 
 class ScPolicyApi(BaseApi):
@@ -1,7 +1,6 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi, BaseRequest
 from tenable_io.api.models import Scanner, ScannerAwsTargetList, ScannerList, ScannerScanList
+from tenable_io.codec import loads
 
 
 class ScannersApi(BaseApi):
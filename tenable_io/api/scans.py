@@ -1,9 +1,8 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import Scan, ScanCredentials, ScanDetails, ScanHistory, \
     ScanHostDetails, ScanList, ScanSettings
 from tenable_io.api.base import BaseRequest
+from tenable_io.codec import loads
 
 
 class ScansApi(BaseApi):
@@ -60,12 +59,14 @@ class ScansApi(BaseApi):
         self._client.delete('scans/%(scan_id)s', path_params={'scan_id': scan_id or schedule_uuid})
         return True
 
-    def details(self, scan_id=None, history_id=None, schedule_uuid=None):
+    def details(self, scan_id=None, history_id=None, schedule_uuid=None, lazy=False):
         """Return details of the given scan.
 
         :param scan_id: The scan ID.
         :param history_id: The historical data ID.
         :param schedule_uuid: The scan schedule UUID, this value will be used when specified and when scan_id is not present.
+        :param lazy: If True, keep the info, hosts and history as decoded JSON until they are first read. Default to
+            False.
         :raise TenableIOApiException:  When API error is encountered.
         :return: An instance of :class:`tenable_io.api.models.ScanDetails`.
         """
@@ -73,7 +74,7 @@ class ScansApi(BaseApi):
                                     path_params={'scan_id': scan_id or schedule_uuid},
                                     params={'history_id': history_id} if history_id else None)
 
-        return ScanDetails.from_json(response.text)
+        return ScanDetails.from_json(response.text, lazy=lazy)
 
     def export_download(self, scan_id=None, file_id=None, stream=True, chunk_size=1024, is_was=False, schedule_uuid=None):
         """Download an exported scan.
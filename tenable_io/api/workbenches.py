@@ -1,8 +1,7 @@
-from json import loads
-
 from tenable_io.api.base import BaseApi
 from tenable_io.api.models import AssetActivityList, AssetsAssetList, AssetList, AssetInfo, VulnerabilityList, \
     VulnerabilityOutputList
+from tenable_io.codec import loads
 
 
 class WorkbenchesApi(BaseApi):
@@ -0,0 +1,155 @@
+import functools
+import sys
+
+from tenable_io.client import TenableIOClient
+from tenable_io.exceptions import TenableIOException
+
+try:
+    import asyncio
+    from collections.abc import Iterator
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2
+    asyncio = None
+    Iterator = None
+    ThreadPoolExecutor = None
+
+
+class AsyncTenableIOClient(object):
+
+    DEFAULT_MAX_WORKERS = 64
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, loop=None, **kwargs):
+        """Asyncio facade of :class:`TenableIOClient` exposing the same `*_api` and `*_helper` attributes, whose methods
+            return awaitables instead of results.
+
+        Requires Python 3.5+. This is not a non-blocking transport: concurrency is bounded by the thread pool. Every
+        call runs the blocking :class:`TenableIOClient` call on one of `max_workers` threads sharing its connection
+        pool, so retries and errors behave exactly the same. At most `max_workers` requests are in flight at once, each
+        holding a thread and a pooled connection, and further calls wait for a free worker. Keeping hundreds of
+        requests in flight takes as many threads, i.e. `max_workers=200`.
+
+        Objects bound to the client returned by the calls, like :class:`tenable_io.helpers.scan.ScanRef`, are wrapped
+        so their methods also run in the pool, and returned iterators are wrapped into asynchronous iterators fetching
+        each item in the pool.
+
+        :param max_workers: The number of worker threads, that is the maximum number of requests in flight. Default to
+            DEFAULT_MAX_WORKERS.
+        :param loop: The event loop to schedule the calls on. Default to the current event loop at call time.
+        :param kwargs: Keyword arguments of :class:`TenableIOClient`. `pool_maxsize` defaults to `max_workers`, so that
+            every worker keeps its connection open.
+        """
+        if asyncio is None or sys.version_info < (3, 5):
+            raise TenableIOException(u'AsyncTenableIOClient requires Python 3.5+.')
+        if max_workers is None:
+            max_workers = AsyncTenableIOClient.DEFAULT_MAX_WORKERS
+
+        # Keep one pooled connection per worker instead of reopening connections above the default pool size.
+        if kwargs.get('pool_maxsize') is None:
+            kwargs['pool_maxsize'] = max_workers
+
+        self._client = TenableIOClient(**kwargs)
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._loop = loop
+
+    def __getattr__(self, name):
+        # Only called for attributes not found, i.e. the first access of an api or a helper.
+        if name.startswith(u'_') or not (name.endswith(u'_api') or name.endswith(u'_helper')):
+            raise AttributeError(name)
+        proxy = _AsyncProxy(self, getattr(self._client, name))
+        setattr(self, name, proxy)
+        return proxy
+
+    @property
+    def client(self):
+        """
+        :return: The underlying :class:`TenableIOClient`.
+        """
+        return self._client
+
+    def run(self, f, *args, **kwargs):
+        """Call a blocking function in the worker pool.
+
+        :param f: The function to call.
+        :return: An awaitable that resolves to the return value of `f`.
+        """
+        loop = self._loop if self._loop is not None else asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor, functools.partial(f, *args, **kwargs))
+
+    def get(self, uri, path_params=None, **kwargs):
+        return self.run(self._client.get, uri, path_params, **kwargs)
+
+    def post(self, uri, payload=None, path_params=None, **kwargs):
+        return self.run(self._client.post, uri, payload, path_params, **kwargs)
+
+    def put(self, uri, payload=None, path_params=None, **kwargs):
+        return self.run(self._client.put, uri, payload, path_params, **kwargs)
+
+    def delete(self, uri, path_params=None, **kwargs):
+        return self.run(self._client.delete, uri, path_params, **kwargs)
+
+    def close(self):
+        """Wait for the pending calls and release the worker pool and the connections.
+        """
+        self._executor.shutdown(wait=True)
+        self._client._session.close()
+
+
+class _AsyncProxy(object):
+
+    def __init__(self, async_client, target):
+        self._async_client = async_client
+        self._target = target
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if name.startswith(u'_') or not callable(attribute) or isinstance(attribute, type):
+            return attribute
+
+        @functools.wraps(attribute)
+        def wrapper(*args, **kwargs):
+            return self._async_client.run(_call, self._async_client, attribute, args, kwargs)
+        setattr(self, name, wrapper)
+        return wrapper
+
+
+class _AsyncIterator(object):
+
+    def __init__(self, async_client, iterator):
+        self._async_client = async_client
+        self._iterator = iterator
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self._async_client.run(self._next)
+
+    def _next(self):
+        try:
+            return _wrap(self._async_client, next(self._iterator))
+        except StopIteration:
+            # A StopIteration cannot be set on a future.
+            raise StopAsyncIteration()
+
+    def close(self):
+        """Close the iterator, e.g. to release its connection when it is not consumed to the end.
+
+        :return: An awaitable that resolves once the iterator is closed.
+        """
+        return self._async_client.run(getattr(self._iterator, u'close', lambda: None))
+
+
+def _call(async_client, f, args, kwargs):
+    return _wrap(async_client, f(*args, **kwargs))
+
+
+def _wrap(async_client, value):
+    """Wrap the values whose methods block on requests, so they run in the worker pool too.
+    """
+    if isinstance(value, list):
+        return [_wrap(async_client, item) for item in value]
+    if isinstance(value, Iterator):
+        return _AsyncIterator(async_client, value)
+    if getattr(value, u'_client', None) is async_client.client:
+        return _AsyncProxy(async_client, value)
+    return value
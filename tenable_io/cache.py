@@ -0,0 +1,235 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from six.moves.urllib.parse import urlparse
+
+# os.replace is not available on Python 2, where os.rename already overwrites on POSIX.
+_replace = getattr(os, 'replace', os.rename)
+
+
+class ResponseCache(object):
+
+    # Read-mostly endpoints, as glob patterns of the request path, and the number of seconds their responses are fresh.
+    DEFAULT_TTLS = {
+        u'credentials/types': 3600,
+        u'editor/*/templates': 3600,
+        u'editor/*/templates/*': 3600,
+        u'filters/*': 3600,
+        u'plugins/families': 3600,
+        u'plugins/families/*': 3600,
+        u'plugins/plugin/*': 3600,
+        u'scanners': 300,
+        u'server/properties': 300,
+    }
+
+    def __init__(self, backend=None, ttls=None):
+        """Cache of the responses of GET requests, to pass to :class:`tenable_io.client.TenableIOClient`. Only the
+            endpoints with a TTL are cached. Once a response is stale, it is revalidated with a conditional request if
+            the server sent an `ETag` or a `Last-Modified` header, and fetched again otherwise.
+
+        The cache is not invalidated by the requests modifying the cached resources, call :meth:`clear` after such
+        changes if they must be seen right away.
+
+        :param backend: An instance of :class:`CacheBackend`. Default to a :class:`MemoryCacheBackend`.
+        :param ttls: The TTLs in seconds by glob pattern of request path, i.e. {u'scanners/*/key': 60}. A TTL of 0
+            always revalidates. Default to DEFAULT_TTLS.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = ttls if ttls is not None else ResponseCache.DEFAULT_TTLS
+        self._stats = {u'hits': 0, u'misses': 0, u'revalidated': 0}
+        self._lock = threading.Lock()
+
+    def ttl(self, uri):
+        """
+        :param uri: The request URI.
+        :return: The TTL of the URI in seconds, None if it is not cached.
+        """
+        path = urlparse(uri).path.strip(u'/')
+        ttls = [ttl for pattern, ttl in self.ttls.items() if fnmatchcase(path, pattern)]
+        return min(ttls) if ttls else None
+
+    def fetch(self, send, scope, uri, params=None, headers=None, **kwargs):
+        """Return a cached response, or send the request and cache its response.
+
+        :param send: The function sending the request, called with `uri`, `params`, `headers` and `kwargs`.
+        :param scope: The identity the response is cached for, so that clients of different users do not share it.
+        :param uri: The request URI.
+        :param params: The query params.
+        :param headers: The request headers.
+        :return: An instance of :class:`requests.Response`.
+        """
+        ttl = self.ttl(uri)
+        if ttl is None:
+            return send(uri, params=params, headers=headers, **kwargs)
+
+        key = _key(scope, uri, params)
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is not None and now < entry[u'expires_at']:
+            self._count(u'hits')
+            return _response(entry)
+
+        headers = dict(headers or {})
+        if entry is not None:
+            validators = CaseInsensitiveDict(entry[u'headers'])
+            if validators.get(u'ETag'):
+                headers[u'If-None-Match'] = validators[u'ETag']
+            if validators.get(u'Last-Modified'):
+                headers[u'If-Modified-Since'] = validators[u'Last-Modified']
+
+        response = send(uri, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._count(u'revalidated')
+            entry[u'expires_at'] = now + ttl
+            self.backend.set(key, entry)
+            return _response(entry)
+
+        self._count(u'misses')
+        if response.status_code == 200:
+            self.backend.set(key, {
+                u'expires_at': now + ttl,
+                u'url': response.url,
+                u'headers': dict(response.headers),
+                u'encoding': response.encoding,
+                u'content': response.content,
+            })
+        return response
+
+    def clear(self):
+        """Remove all cached responses.
+        """
+        self.backend.clear()
+
+    def stats(self):
+        """
+        :return: The cache statistics, as a dict of:
+            `hits`: The number of responses served from the cache without request.
+            `revalidated`: The number of stale responses served from the cache after a 304 response.
+            `misses`: The number of responses fetched from the server.
+            `hit_rate`: The ratio of responses served from the cache, with or without revalidation.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats[u'hits'] + stats[u'revalidated'] + stats[u'misses']
+        stats[u'hit_rate'] = float(stats[u'hits'] + stats[u'revalidated']) / total if total else 0.0
+        return stats
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+
+class CacheBackend(object):
+    """Storage of :class:`ResponseCache` entries. Entries are dicts of plain values. Implementations must be safe to
+        share among threads.
+    """
+
+    def get(self, key):
+        """
+        :return: The entry, None if not cached.
+        """
+        raise NotImplementedError()
+
+    def set(self, key, entry):
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+
+class MemoryCacheBackend(CacheBackend):
+
+    def __init__(self, max_entries=1000):
+        """Keeps entries in memory, evicting the least recently used ones.
+
+        :param max_entries: The maximum number of entries kept. Default to 1000.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return dict(entry) if entry is not None else None
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = dict(entry)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheBackend(CacheBackend):
+
+    def __init__(self, path):
+        """Keeps entries as JSON files in a directory, so they survive the process and can be shared among processes.
+            Files that cannot be decoded are cache misses.
+
+        :param path: The directory path, created if missing.
+        """
+        self.path = path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def get(self, key):
+        # JSON rather than pickle, so a file written by someone else in the directory cannot run code when loaded.
+        try:
+            with open(self._file(key), 'rb') as fd:
+                entry = json.loads(fd.read().decode(u'utf-8'))
+            entry[u'content'] = base64.b64decode(entry[u'content'].encode(u'ascii'))
+            return entry
+        except (IOError, OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def set(self, key, entry):
+        entry = dict(entry, content=base64.b64encode(entry[u'content']).decode(u'ascii'))
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=u'.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(entry).encode(u'utf-8'))
+        _replace(temp_path, self._file(key))
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.endswith(u'.cache'):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+
+    def _file(self, key):
+        return os.path.join(self.path, key + u'.cache')
+
+
+def _key(scope, uri, params):
+    if isinstance(params, dict):
+        params = sorted((u'%s' % k, u'%s' % v) for k, v in params.items())
+    return hashlib.sha1(repr((scope, uri, params)).encode(u'utf-8')).hexdigest()
+
+
+def _response(entry):
+    response = Response()
+    response.status_code = 200
+    response.url = entry[u'url']
+    response.headers = CaseInsensitiveDict(entry[u'headers'])
+    response.encoding = entry[u'encoding']
+    response._content = entry[u'content']
+    return response
@@ -1,52 +1,20 @@
+import importlib
 import requests
 import sys
-from time import sleep
+from functools import partial, wraps
+from time import sleep, time
 
 from requests.utils import quote
 
 from tenable_io import __version__
+from tenable_io.adapter import TenableIOHTTPAdapter
 from tenable_io.config import TenableIOConfig
-from tenable_io.exceptions import TenableIOApiException, TenableIORetryableApiException
-from tenable_io.api.access_groups import AccessGroupsApi
-from tenable_io.api.agent_exclusions import AgentExclusionsApi
-from tenable_io.api.agent_config import AgentConfigApi
-from tenable_io.api.agent_groups import AgentGroupsApi
-from tenable_io.api.agents import AgentsApi
-from tenable_io.api.assets import AssetsApi
+from tenable_io.exceptions import TenableIOApiException, TenableIODeadlineExceededException, \
+    TenableIORetryableApiException
 from tenable_io.api.base import BaseRequest
-from tenable_io.api.bulk_operations import BulkOperationsApi
-from tenable_io.api.credentials import CredentialsApi
-from tenable_io.api.editor import EditorApi
-from tenable_io.api.exclusions import ExclusionApi
-from tenable_io.api.exports import ExportsApi
-from tenable_io.api.file import FileApi
-from tenable_io.api.filters import FiltersApi
-from tenable_io.api.folders import FoldersApi
-from tenable_io.api.groups import GroupsApi
-from tenable_io.api.import_ import ImportApi
-from tenable_io.api.networks import NetworksApi
-from tenable_io.api.plugins import PluginsApi
-from tenable_io.api.policies import PoliciesApi
-from tenable_io.api.scans import ScansApi
-from tenable_io.api.scanners import ScannersApi
-from tenable_io.api.sc_containers import ScContainersApi
-from tenable_io.api.sc_policy import ScPolicyApi
-from tenable_io.api.sc_reports import ScReportsApi
-from tenable_io.api.sc_test_jobs import ScTestJobsApi
-from tenable_io.api.server import ServerApi
-from tenable_io.api.session import SessionApi
-from tenable_io.api.tags import TagsApi
-from tenable_io.api.target_groups import TargetGroupsApi
-from tenable_io.api.users import UsersApi
-from tenable_io.api.workbenches import WorkbenchesApi
-from tenable_io.helpers.export import ExportHelper
-from tenable_io.helpers.file import FileHelper
-from tenable_io.helpers.folder import FolderHelper
-from tenable_io.helpers.permissions import PermissionsHelper
-from tenable_io.helpers.policy import PolicyHelper
-from tenable_io.helpers.scan import ScanHelper
-from tenable_io.helpers.workbench import WorkbenchHelper
 from tenable_io.log import format_request, logging
+from tenable_io.retry import LinearBackoffRetryPolicy
+from tenable_io.util import current_deadline, deadline_scope
 
 DEFAULT_PROXIES = {
     proto: proxy for proto, proxy in {
@@ -57,6 +25,30 @@ DEFAULT_PROXIES = {
 }
 
 
+class _LazyAttribute(object):
+
+    def __init__(self, name, module, class_name):
+        """Client attribute holding an instance of `module.class_name` created with the client on first access. The
+            module is only imported then.
+
+        :param name: The attribute name the instance is cached under.
+        :param module: The module of the class, relative to the tenable_io package.
+        :param class_name: The class name.
+        """
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+
+    def __get__(self, client, owner):
+        if client is None:
+            return self
+        instance = getattr(importlib.import_module(self.module, 'tenable_io'), self.class_name)(client)
+        # Shadow the descriptor, so next accesses are plain attribute lookups. Concurrent first accesses may create
+        # more than one instance, which is harmless as api and helpers only hold the client.
+        client.__dict__[self.name] = instance
+        return instance
+
+
 class TenableIOClient(object):
 
     _MAX_RETRIES = TenableIOConfig.get('max_retries')
@@ -64,6 +56,49 @@ class TenableIOClient(object):
     _RETRY_STATUS_CODES = {429, 500, 501, 502, 503, 504}
     _RETRY_SLEEP_MILLISECONDS = TenableIOConfig.get('retry_sleep_milliseconds')
 
+    # The api and helpers are only imported and created on first access, so that importing and creating the client
+    # stays cheap for short-lived processes that only call a few endpoints.
+    access_groups_api = _LazyAttribute('access_groups_api', '.api.access_groups', 'AccessGroupsApi')
+    agent_exclusions_api = _LazyAttribute('agent_exclusions_api', '.api.agent_exclusions', 'AgentExclusionsApi')
+    agent_config_api = _LazyAttribute('agent_config_api', '.api.agent_config', 'AgentConfigApi')
+    agent_groups_api = _LazyAttribute('agent_groups_api', '.api.agent_groups', 'AgentGroupsApi')
+    agents_api = _LazyAttribute('agents_api', '.api.agents', 'AgentsApi')
+    assets_api = _LazyAttribute('assets_api', '.api.assets', 'AssetsApi')
+    bulk_operations_api = _LazyAttribute('bulk_operations_api', '.api.bulk_operations', 'BulkOperationsApi')
+    credentials_api = _LazyAttribute('credentials_api', '.api.credentials', 'CredentialsApi')
+    editor_api = _LazyAttribute('editor_api', '.api.editor', 'EditorApi')
+    exclusions_api = _LazyAttribute('exclusions_api', '.api.exclusions', 'ExclusionApi')
+    exports_api = _LazyAttribute('exports_api', '.api.exports', 'ExportsApi')
+    file_api = _LazyAttribute('file_api', '.api.file', 'FileApi')
+    filters_api = _LazyAttribute('filters_api', '.api.filters', 'FiltersApi')
+    folders_api = _LazyAttribute('folders_api', '.api.folders', 'FoldersApi')
+    groups_api = _LazyAttribute('groups_api', '.api.groups', 'GroupsApi')
+    import_api = _LazyAttribute('import_api', '.api.import_', 'ImportApi')
+    networks_api = _LazyAttribute('networks_api', '.api.networks', 'NetworksApi')
+    plugins_api = _LazyAttribute('plugins_api', '.api.plugins', 'PluginsApi')
+    policies_api = _LazyAttribute('policies_api', '.api.policies', 'PoliciesApi')
+    scans_api = _LazyAttribute('scans_api', '.api.scans', 'ScansApi')
+    scanners_api = _LazyAttribute('scanners_api', '.api.scanners', 'ScannersApi')
+    sc_containers_api = _LazyAttribute('sc_containers_api', '.api.sc_containers', 'ScContainersApi')
+    sc_policy_api = _LazyAttribute('sc_policy_api', '.api.sc_policy', 'ScPolicyApi')
+    sc_reports_api = _LazyAttribute('sc_reports_api', '.api.sc_reports', 'ScReportsApi')
+    sc_test_jobs_api = _LazyAttribute('sc_test_jobs_api', '.api.sc_test_jobs', 'ScTestJobsApi')
+    server_api = _LazyAttribute('server_api', '.api.server', 'ServerApi')
+    session_api = _LazyAttribute('session_api', '.api.session', 'SessionApi')
+    tags_api = _LazyAttribute('tags_api', '.api.tags', 'TagsApi')
+    target_groups_api = _LazyAttribute('target_groups_api', '.api.target_groups', 'TargetGroupsApi')
+    users_api = _LazyAttribute('users_api', '.api.users', 'UsersApi')
+    workbenches_api = _LazyAttribute('workbenches_api', '.api.workbenches', 'WorkbenchesApi')
+
+    export_helper = _LazyAttribute('export_helper', '.helpers.export', 'ExportHelper')
+    file_helper = _LazyAttribute('file_helper', '.helpers.file', 'FileHelper')
+    folder_helper = _LazyAttribute('folder_helper', '.helpers.folder', 'FolderHelper')
+    permissions_helper = _LazyAttribute('permissions_helper', '.helpers.permissions', 'PermissionsHelper')
+    policy_helper = _LazyAttribute('policy_helper', '.helpers.policy', 'PolicyHelper')
+    scan_helper = _LazyAttribute('scan_helper', '.helpers.scan', 'ScanHelper')
+    sync_helper = _LazyAttribute('sync_helper', '.helpers.sync', 'SyncHelper')
+    workbench_helper = _LazyAttribute('workbench_helper', '.helpers.workbench', 'WorkbenchHelper')
+
     def __init__(
             self,
             access_key=TenableIOConfig.get('access_key'),
@@ -71,16 +106,68 @@ class TenableIOClient(object):
             endpoint=TenableIOConfig.get('endpoint'),
             proxies=DEFAULT_PROXIES,
             impersonate=None,
+            rate_limiter=None,
+            retry_policy=None,
+            pool_connections=TenableIOConfig.get('pool_connections'),
+            pool_maxsize=TenableIOConfig.get('pool_maxsize'),
+            pool_block=False,
+            keep_alive=True,
+            socket_options=None,
+            connect_timeout=TenableIOConfig.get('connect_timeout'),
+            read_timeout=TenableIOConfig.get('read_timeout'),
+            cache=None,
+            single_flight=None,
     ):
+        """
+        :param access_key: The API access key. Default to the `access_key` config.
+        :param secret_key: The API secret key. Default to the `secret_key` config.
+        :param endpoint: The API endpoint. Default to the `endpoint` config.
+        :param proxies: The proxies by protocol. Default to the `http_proxy` and `https_proxy` configs.
+        :param impersonate: The username to impersonate. Default to None.
+        :param rate_limiter: An instance of :class:`tenable_io.rate_limit.RateLimiter` to hold requests with, it can be
+            shared among clients. Default to None, for no rate limiting.
+        :param retry_policy: An instance of :class:`tenable_io.retry.RetryPolicy` deciding whether and when to retry
+            requests. Default to a :class:`tenable_io.retry.LinearBackoffRetryPolicy` configured by the `max_retries`
+            and `retry_sleep_milliseconds` configs.
+        :param pool_connections: The number of hosts to keep connection pools for. Default to the `pool_connections`
+            config.
+        :param pool_maxsize: The maximum number of connections kept open per host. It should be at least the number of
+            threads sharing the client. Default to the `pool_maxsize` config.
+        :param pool_block: If True, requests wait for a pooled connection to be free instead of opening a connection
+            that is discarded afterward when the pool is full. Default to False.
+        :param keep_alive: If False, connections are closed after every request. Default to True.
+        :param socket_options: The socket options of new connections, as a list of `(level, option, value)`, i.e.
+            :func:`tenable_io.adapter.tcp_keepalive_socket_options`. Default to None, for urllib3's default options.
+        :param connect_timeout: The number of seconds to wait for a connection to be established, None or empty for
+            no timeout. Default to the `connect_timeout` config.
+        :param read_timeout: The number of seconds to wait for the server to send data, None or empty for no timeout.
+            Default to the `read_timeout` config.
+        :param cache: An instance of :class:`tenable_io.cache.ResponseCache` to cache the responses of read-mostly
+            endpoints in, it can be shared among clients. Default to None, for no caching.
+        :param single_flight: An instance of :class:`tenable_io.single_flight.SingleFlight` collapsing concurrent
+            identical GET requests into one and sharing its response, it can be shared among clients. Default to None,
+            for no coalescing.
+        """
         self._access_key = access_key
         self._secret_key = secret_key
         self._endpoint = endpoint
         self._proxies = proxies
         self._impersonate = impersonate
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else self._default_retry_policy()
+        self._pool_connections = int(pool_connections)
+        self._pool_maxsize = int(pool_maxsize)
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._socket_options = socket_options
+        self._timeout = (
+            float(connect_timeout) if connect_timeout else None,
+            float(read_timeout) if read_timeout else None
+        )
+        self._cache = cache
+        self._single_flight = single_flight
 
         self._init_session()
-        self._init_api()
-        self._init_helpers()
 
     def _init_session(self):
         """
@@ -101,53 +188,37 @@ class TenableIOClient(object):
                 u'X-Impersonate': u'username=%s' % self._impersonate
             })
 
-    def _init_api(self):
-        """
-        Initializes all api.
+        if not self._keep_alive:
+            self._session.headers.update({u'Connection': u'close'})
+
+        self._adapter = TenableIOHTTPAdapter(
+            socket_options=self._socket_options,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block
+        )
+        self._session.mount(u'https://', self._adapter)
+        self._session.mount(u'http://', self._adapter)
+
+    def pool_stats(self):
         """
-        self.access_groups_api = AccessGroupsApi(self)
-        self.agent_exclusions_api = AgentExclusionsApi(self)
-        self.agent_config_api = AgentConfigApi(self)
-        self.agent_groups_api = AgentGroupsApi(self)
-        self.agents_api = AgentsApi(self)
-        self.assets_api = AssetsApi(self)
-        self.bulk_operations_api = BulkOperationsApi(self)
-        self.credentials_api = CredentialsApi(self)
-        self.editor_api = EditorApi(self)
-        self.exclusions_api = ExclusionApi(self)
-        self.exports_api = ExportsApi(self)
-        self.file_api = FileApi(self)
-        self.filters_api = FiltersApi(self)
-        self.folders_api = FoldersApi(self)
-        self.groups_api = GroupsApi(self)
-        self.import_api = ImportApi(self)
-        self.networks_api = NetworksApi(self)
-        self.plugins_api = PluginsApi(self)
-        self.policies_api = PoliciesApi(self)
-        self.scans_api = ScansApi(self)
-        self.scanners_api = ScannersApi(self)
-        self.sc_containers_api = ScContainersApi(self)
-        self.sc_policy_api = ScPolicyApi(self)
-        self.sc_reports_api = ScReportsApi(self)
-        self.sc_test_jobs_api = ScTestJobsApi(self)
-        self.server_api = ServerApi(self)
-        self.session_api = SessionApi(self)
-        self.tags_api = TagsApi(self)
-        self.target_groups_api = TargetGroupsApi(self)
-        self.users_api = UsersApi(self)
-        self.workbenches_api = WorkbenchesApi(self)
-
-    def _init_helpers(self):
+        :return: The connection pool statistics. See :meth:`tenable_io.adapter.TenableIOHTTPAdapter.stats`.
         """
-        Initializes all helpers.
+        return self._adapter.stats()
+
+    @staticmethod
+    def deadline(seconds):
+        """Context manager setting a deadline shared by all the requests, polls and downloads made on the current thread
+            within its block, i.e. `with client.deadline(60): client.scan_helper.id(scan_id).download(path)`.
+
+        Request timeouts are capped to the time remaining, requests are not retried past the deadline, and
+        :class:`tenable_io.exceptions.TenableIODeadlineExceededException` is raised once it expires. Nested deadlines
+        cannot extend the outer ones.
+
+        :param seconds: The number of seconds or the :class:`tenable_io.util.Deadline` the block expires after.
+        :return: The :class:`tenable_io.util.Deadline` in effect.
         """
-        self.export_helper = ExportHelper(self)
-        self.file_helper = FileHelper(self)
-        self.folder_helper = FolderHelper(self)
-        self.permissions_helper = PermissionsHelper(self)
-        self.policy_helper = PolicyHelper(self)
-        self.scan_helper = ScanHelper(self)
-        self.workbench_helper = WorkbenchHelper(self)
+        return deadline_scope(seconds)
 
     def _retry(f):
         """
@@ -157,13 +228,16 @@ class TenableIOClient(object):
         TenableIORetryableException is caught.
         """
         def wrapper(*args, **kwargs):
-            total_retries = int(TenableIOClient._TOTAL_RETRIES)
+            client = args[0] if args and isinstance(args[0], TenableIOClient) else None
+            policy = client._retry_policy if client is not None else TenableIOClient._default_retry_policy()
+            method = getattr(f, '__name__', u'').upper() or None
             count = 0
-            sleep_ms = 0
+            start = time()
             if 'headers' not in kwargs or not kwargs['headers']:
                 kwargs['headers'] = {}
 
-            while count <= total_retries:
+            policy.on_request()
+            while True:
                 # Set retry count header
                 if count > 0:
                     kwargs['headers'].update({u'X-Tio-Retry-Count': str(count)})
@@ -172,20 +246,32 @@ class TenableIOClient(object):
                 try:
                     return f(*args, **kwargs)
                 except TenableIORetryableApiException as exception:
-                    if count > total_retries:
+                    delay = policy.next_delay(count, method, exception.response, time() - start)
+                    if delay is None:
                         raise TenableIOApiException(exception.response)
-                    sleep_ms += count * int(TenableIOClient._RETRY_SLEEP_MILLISECONDS)
-                    sleep(sleep_ms / 1000.0)
+                    deadline = current_deadline()
+                    if deadline is not None and delay >= deadline.remaining():
+                        raise TenableIODeadlineExceededException(
+                            u'Deadline of %ss exceeded before retrying: %s' % (deadline.seconds, exception.message))
+                    sleep(delay)
                     logging.warning(u'RETRY(%d/%d)AFTER(%dms):%s' %
-                                 (count, total_retries, sleep_ms, format_request(exception.response)))
+                                 (count, policy.max_retries, delay * 1000, format_request(exception.response)))
         return wrapper
 
+    @staticmethod
+    def _default_retry_policy():
+        return LinearBackoffRetryPolicy(
+            max_retries=int(TenableIOClient._TOTAL_RETRIES),
+            sleep_milliseconds=int(TenableIOClient._RETRY_SLEEP_MILLISECONDS)
+        )
+
     def _error_handler(f):
         """
         Decorator to handle response error.
         :param f: Response returning method.
         :return: A Response returning method that raises TenableIOException for error in response.
         """
+        @wraps(f)
         def wrapper(*args, **kwargs):
             response = f(*args, **kwargs)
             if response.status_code in TenableIOClient._RETRY_STATUS_CODES:
@@ -207,22 +293,37 @@ class TenableIOClient(object):
     @_retry
     @_error_handler
     def post(self, uri, payload=None, path_params=None, **kwargs):
-        if isinstance(payload, BaseRequest):
-            payload = payload.as_payload()
-        return self._request('POST', uri, path_params, json=payload, **kwargs)
+        return self._request('POST', uri, path_params, **self._json_body(payload, kwargs))
 
     @_retry
     @_error_handler
     def put(self, uri, payload=None, path_params=None, **kwargs):
-        if isinstance(payload, BaseRequest):
-            payload = payload.as_payload()
-        return self._request('PUT', uri, path_params, json=payload, **kwargs)
+        return self._request('PUT', uri, path_params, **self._json_body(payload, kwargs))
 
     @_retry
     @_error_handler
     def delete(self, uri, path_params=None, **kwargs):
         return self._request('DELETE', uri, path_params, **kwargs)
 
+    @staticmethod
+    def _json_body(payload, kwargs):
+        """
+        Encode the payload with the JSON codec rather than letting requests encode it with the stdlib.
+        :param payload: The payload, an instance of BaseRequest, or a JSON serializable value.
+        :param kwargs: The request keyword arguments.
+        :return: The request keyword arguments with the encoded body.
+        """
+        # Imported on first use, so that importing the client does not import the JSON backends.
+        from tenable_io.codec import dumps
+
+        if isinstance(payload, BaseRequest):
+            payload = payload.as_payload()
+        if payload is None:
+            return kwargs
+        headers = dict(kwargs.get('headers') or {})
+        headers[u'Content-Type'] = u'application/json'
+        return dict(kwargs, data=dumps(payload).encode(u'utf-8'), headers=headers)
+
     @classmethod
     def _flatten_param(cls, params):
         """
@@ -254,7 +355,43 @@ class TenableIOClient(object):
 
         full_uri = self._endpoint + uri
 
-        response = self._session.request(method, full_uri, **kwargs)
+        if method == 'GET' and not kwargs.get('stream'):
+            send = self._send if self._single_flight is None else self._send_coalesced
+            if self._cache is not None:
+                # Responses are cached per user, as they depend on the user permissions.
+                return self._cache.fetch(partial(send, method), (self._access_key, self._impersonate), full_uri,
+                                         **kwargs)
+            return send(method, full_uri, **kwargs)
+        return self._send(method, full_uri, **kwargs)
+
+    def _send_coalesced(self, method, full_uri, params=None, headers=None, **kwargs):
+        # The retry count header differs between the attempts of otherwise identical requests.
+        key = (self._access_key, self._impersonate, method, full_uri,
+               repr(sorted(params.items()) if isinstance(params, dict) else params),
+               repr(sorted((k, v) for k, v in (headers or {}).items() if k != u'X-Tio-Retry-Count')))
+        return self._single_flight.do(key, partial(self._send, method, full_uri, params=params, headers=headers,
+                                                   **kwargs))
+
+    def _send(self, method, full_uri, **kwargs):
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        timeout = kwargs.pop('timeout', self._timeout)
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+            timeout = deadline.timeout(timeout)
+
+        try:
+            response = self._session.request(method, full_uri, timeout=timeout, **kwargs)
+        except requests.exceptions.Timeout:
+            if deadline is not None and deadline.expired():
+                raise TenableIODeadlineExceededException(u'Deadline of %ss exceeded: %s %s' % (
+                    deadline.seconds, method, full_uri))
+            raise
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.update(response)
         log_message = format_request(response)
 
         logging.info(log_message)
@@ -0,0 +1,183 @@
+import codecs
+import json
+import re
+import sys
+
+import six
+
+from tenable_io.config import TenableIOConfig
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+BACKEND_ORJSON = u'orjson'
+BACKEND_UJSON = u'ujson'
+BACKEND_STDLIB = u'json'
+BACKENDS = [BACKEND_ORJSON, BACKEND_UJSON, BACKEND_STDLIB]
+
+# json.loads only accepts bytes since Python 3.6.
+_STDLIB_LOADS_BYTES = sys.version_info < (3, 0) or sys.version_info >= (3, 6)
+
+# Decodes one value at an index of a string, used by iter_array whatever the selected backend.
+_raw_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+
+
+def _stdlib_loads(s):
+    if not _STDLIB_LOADS_BYTES and isinstance(s, (bytes, bytearray)):
+        s = s.decode(u'utf-8')
+    return json.loads(s)
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj)
+
+
+def _orjson_dumps(obj):
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode(u'utf-8')
+    except TypeError:
+        # i.e. integers over 64 bits, or types the stdlib encodes differently.
+        return json.dumps(obj)
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj, ensure_ascii=False)
+
+
+def available_backends():
+    """
+    :return: The names of the installed JSON backends, fastest first.
+    """
+    installed = {BACKEND_ORJSON: orjson is not None, BACKEND_UJSON: ujson is not None, BACKEND_STDLIB: True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+def set_backend(name=None):
+    """Select the JSON backend of :func:`loads` and :func:`dumps`.
+
+    The standard library is the default, as the faster backends do not decode the same: orjson decodes integers over
+    64 bits as floats and rejects NaN and Infinity, ujson rejects integers over 64 bits.
+
+    :param name: One of BACKENDS. Default to None, for the standard library.
+    :raise ValueError: When the backend is not installed.
+    """
+    global _backend, _loads, _dumps
+
+    if not name:
+        name = BACKEND_STDLIB
+    if name not in available_backends():
+        raise ValueError(u'JSON backend %s is not installed, available backends: %s.' %
+                         (name, u', '.join(available_backends())))
+
+    _backend = name
+    if name == BACKEND_ORJSON:
+        _loads, _dumps = orjson.loads, _orjson_dumps
+    elif name == BACKEND_UJSON:
+        _loads, _dumps = ujson.loads, _ujson_dumps
+    else:
+        _loads, _dumps = _stdlib_loads, _stdlib_dumps
+
+
+def backend():
+    """
+    :return: The name of the selected JSON backend.
+    """
+    return _backend
+
+
+def loads(s):
+    """Decode JSON with the selected backend.
+
+    :param s: The JSON document, as text or UTF-8 bytes.
+    :return: The decoded value.
+    """
+    return _loads(s)
+
+
+def dumps(obj):
+    """Encode JSON with the selected backend.
+
+    :param obj: The value to encode.
+    :return: The JSON document as text.
+    """
+    return _dumps(obj)
+
+
+def iter_array(chunks):
+    """Decode a JSON array incrementally, yielding its elements as soon as they are read, so that only the current
+        element and the unread part of the current chunk are held in memory whatever the size of the array.
+
+    Elements are decoded with the standard library, which parses a value at an index of a string in place, whatever
+    the selected backend.
+
+    :param chunks: An iterable of the JSON document as UTF-8 bytes or text chunks, i.e. `response.iter_content()`.
+    :raise ValueError: When the document is not a JSON array.
+    :return: Iterator that yields the decoded elements.
+    """
+    decoder = codecs.getincrementaldecoder(u'utf-8')()
+    chunks = iter(chunks)
+    buffer = u''
+    position = 0
+    # Whether the array opened, and whether a value or a separator is expected next.
+    opened = False
+    expect_value = True
+    first = True
+    end_of_stream = False
+
+    while True:
+        position = _whitespace.match(buffer, position).end()
+        if position < len(buffer):
+            char = buffer[position]
+            if not opened:
+                if char != u'[':
+                    raise ValueError(u'Expected a JSON array.')
+                opened = True
+                position += 1
+                continue
+            if not expect_value:
+                if char == u']':
+                    return
+                if char != u',':
+                    raise ValueError(u'Expected "," or "]" at position %d of the chunk.' % position)
+                expect_value = True
+                first = False
+                position += 1
+                continue
+            if char == u']' and first:
+                return
+            try:
+                value, end = _raw_decoder.raw_decode(buffer, position)
+            except ValueError:
+                # The element is incomplete, unless the stream ended.
+                if end_of_stream:
+                    raise
+                end = None
+            # A number or a literal is complete once followed by a delimiter, it may continue in the next chunk.
+            if end is not None and (end_of_stream or char in u'{["' or
+                                    end < len(buffer) and buffer[end] in u' \t\n\r,]'):
+                yield value
+                position = end
+                expect_value = False
+                continue
+        elif end_of_stream:
+            raise ValueError(u'Incomplete JSON array.')
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            end_of_stream = True
+            chunk = decoder.decode(b'', True)
+        elif not isinstance(chunk, six.text_type):
+            chunk = decoder.decode(chunk)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+set_backend(TenableIOConfig.get('json_backend'))
@@ -0,0 +1,249 @@
+import array
+
+from collections import OrderedDict
+
+from tenable_io.exceptions import TenableIOException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TYPE_INT = u'int'
+TYPE_FLOAT = u'float'
+TYPE_STRING = u'string'
+TYPE_BOOL = u'bool'
+
+# The 64 bits integer type code is not available on Python 2, where long is 64 bits on 64 bits POSIX platforms.
+_INT_TYPECODE = 'q' if 'q' in getattr(array, 'typecodes', '') else 'l'
+
+# The columns of ExportHelper.vulns_batch, as (name, path of the field in the vuln record, type).
+VULNS_COLUMNS = [
+    (u'asset_uuid', (u'asset', u'uuid'), TYPE_STRING),
+    (u'asset_hostname', (u'asset', u'hostname'), TYPE_STRING),
+    (u'asset_ipv4', (u'asset', u'ipv4'), TYPE_STRING),
+    (u'plugin_id', (u'plugin', u'id'), TYPE_INT),
+    (u'plugin_name', (u'plugin', u'name'), TYPE_STRING),
+    (u'plugin_family', (u'plugin', u'family'), TYPE_STRING),
+    (u'cvss_base_score', (u'plugin', u'cvss_base_score'), TYPE_FLOAT),
+    (u'cvss3_base_score', (u'plugin', u'cvss3_base_score'), TYPE_FLOAT),
+    (u'port', (u'port', u'port'), TYPE_INT),
+    (u'protocol', (u'port', u'protocol'), TYPE_STRING),
+    (u'severity', (u'severity',), TYPE_STRING),
+    (u'severity_id', (u'severity_id',), TYPE_INT),
+    (u'state', (u'state',), TYPE_STRING),
+    (u'first_found', (u'first_found',), TYPE_STRING),
+    (u'last_found', (u'last_found',), TYPE_STRING),
+]
+
+
+class Column(object):
+    """Values of one field of a batch of records, held in an array rather than as Python objects.
+    """
+
+    def append(self, value):
+        raise NotImplementedError()
+
+    def to_list(self):
+        """
+        :return: The values as a list, None for missing values.
+        """
+        raise NotImplementedError()
+
+    def to_numpy(self):
+        """
+        :raise TenableIOException: When NumPy is not installed.
+        :return: The values as a NumPy array.
+        """
+        raise NotImplementedError()
+
+    def __len__(self):
+        raise NotImplementedError()
+
+
+class NumberColumn(Column):
+
+    def __init__(self, typecode, type_=None):
+        """Numbers held in an :class:`array.array`, along with a validity mask for missing values.
+
+        :param typecode: The array type code, i.e. 'q' for integers or 'd' for floats.
+        :param type_: The type values are converted with, i.e. float for values sent as strings. Default to None, for
+            no conversion.
+        """
+        self.values = array.array(typecode)
+        self.valid = bytearray()
+        self._type = type_
+
+    def append(self, value):
+        if value is None:
+            self.values.append(0)
+            self.valid.append(0)
+        else:
+            self.values.append(self._type(value) if self._type is not None else value)
+            self.valid.append(1)
+
+    def to_list(self):
+        # Booleans are held as integers.
+        convert = bool if self._type is bool else (lambda value: value)
+        return [convert(value) if valid else None for value, valid in zip(self.values, self.valid)]
+
+    def to_numpy(self):
+        """
+        :raise TenableIOException: When NumPy is not installed.
+        :return: The values as a NumPy array. Missing floats are NaN, and integers with missing values are returned as
+            a masked array.
+        """
+        _require_numpy()
+        values = numpy.frombuffer(self.values, dtype=numpy.dtype(self.values.typecode)).copy()
+        if self._type is bool:
+            values = values.astype(bool)
+        valid = numpy.frombuffer(bytes(self.valid), dtype=numpy.uint8).astype(bool)
+        if valid.all():
+            return values
+        if values.dtype.kind == u'f':
+            values[~valid] = numpy.nan
+            return values
+        return numpy.ma.masked_array(values, mask=~valid)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class DictionaryColumn(Column):
+
+    def __init__(self):
+        """Strings dictionary-encoded: every distinct string is held once in `dictionary`, and the values are their
+            index in the dictionary, -1 for missing values, held in the `codes` array.
+        """
+        self.dictionary = []
+        self.codes = array.array('i')
+        self._index = {}
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        self.codes.append(code)
+
+    def code(self, value):
+        """
+        :param value: A string.
+        :return: The code of the string, -1 if no value is the string, to filter on the codes.
+        """
+        return self._index.get(value, -1)
+
+    def to_list(self):
+        dictionary = self.dictionary
+        return [dictionary[code] if code >= 0 else None for code in self.codes]
+
+    def to_numpy(self):
+        """
+        :raise TenableIOException: When NumPy is not installed.
+        :return: The codes as a NumPy array of int32, the strings being `dictionary[code]`.
+        """
+        _require_numpy()
+        return numpy.frombuffer(self.codes, dtype=numpy.int32).copy()
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class ColumnarBatch(object):
+
+    def __init__(self, columns=None):
+        """Records held as columns, one array per field, to filter and group large numbers of records with vectorized
+            operations, i.e. with NumPy, instead of loops over models.
+
+        :param columns: The columns, as a list of (name, path, type), the path being the sequence of keys or attributes
+            leading to the field in a record and the type one of TYPE_INT, TYPE_FLOAT, TYPE_BOOL or TYPE_STRING.
+            Default to VULNS_COLUMNS.
+        """
+        self.columns = OrderedDict()
+        self._fields = []
+        for name, path, type_ in columns if columns is not None else VULNS_COLUMNS:
+            column = self.columns[name] = _column(type_)
+            self._fields.append((column.append, tuple(path)))
+
+    @classmethod
+    def from_records(cls, records, columns=None):
+        """
+        :param records: An iterable of records, as decoded JSON objects or models.
+        :param columns: See :meth:`__init__`.
+        :return: An instance of :class:`ColumnarBatch` holding the records.
+        """
+        batch = cls(columns)
+        batch.extend(records)
+        return batch
+
+    def append(self, record):
+        """
+        :param record: A record, as a decoded JSON object or a model. Missing fields are held as missing values.
+        """
+        for append, path in self._fields:
+            append(field(record, path))
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def column(self, name):
+        """
+        :param name: The column name.
+        :return: An instance of :class:`Column`.
+        """
+        return self.columns[name]
+
+    def to_numpy(self):
+        """
+        :raise TenableIOException: When NumPy is not installed.
+        :return: A dict of the columns as NumPy arrays by name, see :meth:`Column.to_numpy`.
+        """
+        return OrderedDict((name, column.to_numpy()) for name, column in self.columns.items())
+
+    def to_dicts(self):
+        """
+        :return: The records as a list of dicts of the column values by name.
+        """
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*[column.to_list() for column in self.columns.values()])]
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+
+def field(record, path):
+    """
+    :param record: A record, as a decoded JSON object or a model.
+    :param path: The sequence of keys or attributes leading to the field in the record.
+    :return: The value of the field, None if it or one of its parents is missing.
+    """
+    value = record
+    for key in path:
+        if value is None:
+            return None
+        value = value.get(key) if isinstance(value, dict) else getattr(value, key, None)
+    return value
+
+
+def _column(type_):
+    if type_ == TYPE_INT:
+        return NumberColumn(_INT_TYPECODE, int)
+    if type_ == TYPE_FLOAT:
+        return NumberColumn('d', float)
+    if type_ == TYPE_BOOL:
+        return NumberColumn('b', bool)
+    if type_ == TYPE_STRING:
+        return DictionaryColumn()
+    raise TenableIOException(u'Invalid column type %s.' % type_)
+
+
+def _require_numpy():
+    if numpy is None:
+        raise TenableIOException(u'Converting columns to NumPy arrays requires NumPy.')
@@ -17,6 +17,11 @@ base_config = {
     'retry_sleep_milliseconds': environ.get('TENABLEIO_RETRY_SLEEP_MILLISECONDS', '500'),
     'http_proxy': environ.get('TENABLEIO_HTTP_PROXY', ''),
     'https_proxy': environ.get('TENABLEIO_HTTPS_PROXY', ''),
+    'pool_connections': environ.get('TENABLEIO_POOL_CONNECTIONS', '10'),
+    'pool_maxsize': environ.get('TENABLEIO_POOL_MAXSIZE', '10'),
+    'connect_timeout': environ.get('TENABLEIO_CONNECT_TIMEOUT', '10'),
+    'read_timeout': environ.get('TENABLEIO_READ_TIMEOUT', '300'),
+    'json_backend': environ.get('TENABLEIO_JSON_BACKEND', ''),
 }
 
 # Read tenable_io.ini config. Default to environment variables if exist.
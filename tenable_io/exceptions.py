@@ -30,6 +30,12 @@ class TenableIOTimeoutApiException (TenableIOApiException):
     pass
 
 
+class TenableIODeadlineExceededException(TenableIOException):
+
+    def __init__(self, message=None):
+        super(TenableIODeadlineExceededException, self).__init__(message, TenableIOErrorCode.DEADLINE_EXCEEDED)
+
+
 class ErrorCode(object):
 
     _HTTP_CODES = {}
@@ -51,6 +57,7 @@ class ErrorCode(object):
 class TenableIOErrorCode(ErrorCode):
 
     GENERIC = ErrorCode("Generic")
+    DEADLINE_EXCEEDED = ErrorCode("Deadline Exceeded")
 
     CONTINUE = ErrorCode("Continue", 100)
     SWITCHING_PROTOCOLS = ErrorCode("Switching Protocols", 101)
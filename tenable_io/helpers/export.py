@@ -1,6 +1,20 @@
+import json
+import os
+import threading
+import time
+
+from functools import partial
+from multiprocessing.pool import ThreadPool
+
 import tenable_io.util as util
-from tenable_io.api.exports import ExportsAssetsRequest, ExportsVulnsRequest
+from tenable_io.api.exports import STREAM_READ_SIZE, ExportsAssetsRequest, ExportsVulnsRequest
 from tenable_io.api.models import ExportsAssetsStatus, ExportsVulnsStatus
+from tenable_io.codec import iter_array
+from tenable_io.columnar import ColumnarBatch
+from tenable_io.exceptions import TenableIOApiException, TenableIOErrorCode, TenableIOException
+
+# os.replace is not available on Python 2, where os.rename already overwrites on POSIX.
+_replace = getattr(os, 'replace', os.rename)
 
 
 class ExportHelper(object):
@@ -10,7 +24,8 @@ class ExportHelper(object):
 
     def download_vulns(self, path=None, num_assets=50, severity=None, state=None, plugin_family=None, since=None,
                        tags=None, cidr_range=None, first_found=None, last_found=None, last_fixed=None,
-                       file_open_mode='wb'):
+                       file_open_mode='wb', max_workers=None, manifest=None, deadline=None, compact=False,
+                       lazy=False):
         """Request the vulns export chunks, poll for status, and download them to disk or load to memory when it's
             available. The chunks will be retrieved in no particular order.
 
@@ -36,57 +51,67 @@ class ExportHelper(object):
         :param last_fixed: 	The start date (in Unix time) for the range of vulnerability data you want to export,
             based on when the vulnerability state was changed to fixed.
         :param file_open_mode: The open mode to the file output. Default to "wb".
-        :return: The list of `chunk_id`s.
+        :param max_workers: The maximum number of chunks to download concurrently. Default to None, which downloads the
+            chunks one at a time.
+        :param manifest: The file path of a checkpoint manifest, only supported along with `path`. When the manifest
+            exists and was recorded for the same request, the export is resumed and only the missing chunks are
+            downloaded. The manifest is removed once all chunks are downloaded. Default to None.
+        :param deadline: The number of seconds or the :class:`tenable_io.util.Deadline` to give up the export after.
+            Default to None, for the current deadline if any.
+        :param compact: If True and path is `None`, load compact models using a fraction of the memory, see
+            :class:`tenable_io.api.models.CompactModel`. Default to False.
+        :param lazy: If True and path is `None`, keep the nested models of the vulns as decoded JSON until they are
+            first read. Default to False.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :raise TenableIODeadlineExceededException: When the deadline expires.
+        :return: The list of exported vulns if path is `None` else the list of `chunk_id`s.
         """
-        # If not parameterized for chunk ID.
-        if path is not None and path % {'chunk_id': 1} == path:
-            path += '_%(chunk_id)s'
+        with util.deadline_scope(deadline):
+            # If not parameterized for chunk ID.
+            if path is not None and path % {'chunk_id': 1} == path:
+                path += '_%(chunk_id)s'
 
-        filters = {
-                    u'severity': severity,
-                    u'state': state,
-                    u'plugin_family': plugin_family,
-                    u'since': since,
-                    u'cidr_range': cidr_range,
-                    u'first_found': first_found,
-                    u'last_found': last_found,
-                    u'last_fixed': last_fixed
-                }
+            filters = self._vulns_filters(severity, state, plugin_family, since, tags, cidr_range, first_found,
+                                          last_found, last_fixed)
 
-        # Parse tag filters
-        if tags is not None:
-            tags = {u'tag.{}'.format(k): v for k, v in tags.items()}
-            filters.update(tags)
+            assert manifest is None or path is not None, u'Manifest is only supported when downloading to disk.'
 
-        export_uuid = self._client.exports_api.vulns_request_export(
-            ExportsVulnsRequest(
-                num_assets=num_assets,
-                filters=filters
+            export_manifest = ExportManifest(manifest) if manifest is not None else None
+
+            export_uuid = self._request_export(
+                ExportsVulnsRequest(
+                    num_assets=num_assets,
+                    filters=filters
+                ),
+                self._client.exports_api.vulns_request_export,
+                self._client.exports_api.vulns_export_status,
+                export_manifest
             )
-        )
 
-        util.wait_until(
-            lambda: self._client.exports_api.vulns_export_status(export_uuid).status ==
-            ExportsVulnsStatus.STATUS_FINISHED)
+            self._wait_finished(export_uuid, self._client.exports_api.vulns_export_status, ExportsVulnsStatus,
+                                export_manifest)
 
-        status = self._client.exports_api.vulns_export_status(export_uuid)
+            status = self._client.exports_api.vulns_export_status(export_uuid)
 
-        # Retrieve chunks
-        vulns = []
-        for chunk_id in status.chunks_available:
-            if path is None:
-                vulns += self._client.exports_api.vulns_chunk(export_uuid, chunk_id)
-            else:
-                iter_content = self._client.exports_api.vulns_download_chunk(export_uuid, chunk_id)
-                with open(path % {'chunk_id': chunk_id}, file_open_mode) as fd:
-                    for chunk in iter_content:
-                        fd.write(chunk)
+            # Retrieve chunks
+            vulns = self._download_chunks(
+                export_uuid,
+                [chunk_id for chunk_id in status.chunks_available
+                 if export_manifest is None or chunk_id not in export_manifest.chunks_completed],
+                partial(self._client.exports_api.vulns_chunk, compact=compact, lazy=lazy),
+                self._client.exports_api.vulns_download_chunk,
+                path,
+                file_open_mode,
+                max_workers,
+                export_manifest
+            )
 
-        return vulns if path is None else status.chunks_available
+            return vulns if path is None else status.chunks_available
 
     def download_assets(self, path=None, chunk_size=100, created_at=None, updated_at=None, terminated_at=None,
                         deleted_at=None, first_scan_time=None, last_authenticated_scan_time=None, last_assessed=None,
-                        servicenow_sysid=None,  sources=None, has_plugin_results=None, tags=None, file_open_mode='wb'):
+                        servicenow_sysid=None,  sources=None, has_plugin_results=None, tags=None, file_open_mode='wb',
+                        max_workers=None, manifest=None, deadline=None, compact=False):
         """Request the vulns export chunks, poll for status, and download them when it's available. The chunks will be
             retrieved in no particular order.
 
@@ -119,12 +144,225 @@ class ExportHelper(object):
         :param tags: Returns all assets with the specified tags. The filter is defined as a dict with catgeory name as
             the key and a list of values as the value. Ex: {tag_category_name:[tag_value(s)]}
         :param file_open_mode: The open mode to the file output. Default to "wb".
+        :param max_workers: The maximum number of chunks to download concurrently. Default to None, which downloads the
+            chunks one at a time.
+        :param manifest: The file path of a checkpoint manifest, only supported along with `path`. When the manifest
+            exists and was recorded for the same request, the export is resumed and only the missing chunks are
+            downloaded. The manifest is removed once all chunks are downloaded. Default to None.
+        :param deadline: The number of seconds or the :class:`tenable_io.util.Deadline` to give up the export after.
+            Default to None, for the current deadline if any.
+        :param compact: If True and path is `None`, load compact models using a fraction of the memory, see
+            :class:`tenable_io.api.models.CompactModel`. Default to False.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :raise TenableIODeadlineExceededException: When the deadline expires.
         :return: The list of exported assets if path is `None` else the list of `chunk_id`s.
         """
-        # If not parameterized for chunk ID.
-        if path is not None and path % {'chunk_id': 1} == path:
-            path += '_%(chunk_id)s'
+        with util.deadline_scope(deadline):
+            # If not parameterized for chunk ID.
+            if path is not None and path % {'chunk_id': 1} == path:
+                path += '_%(chunk_id)s'
+
+            filters = self._assets_filters(created_at, updated_at, terminated_at, deleted_at, first_scan_time,
+                                           last_authenticated_scan_time, last_assessed, servicenow_sysid, sources,
+                                           has_plugin_results, tags)
+
+            assert manifest is None or path is not None, u'Manifest is only supported when downloading to disk.'
+
+            export_manifest = ExportManifest(manifest) if manifest is not None else None
+
+            export_uuid = self._request_export(
+                ExportsAssetsRequest(
+                    chunk_size=chunk_size,
+                    filters=filters
+                ),
+                self._client.exports_api.assets_request_export,
+                self._client.exports_api.assets_export_status,
+                export_manifest
+            )
+
+            self._wait_finished(export_uuid, self._client.exports_api.assets_export_status, ExportsAssetsStatus,
+                                export_manifest)
+
+            status = self._client.exports_api.assets_export_status(export_uuid)
+
+            # Download chunks
+            assets = self._download_chunks(
+                export_uuid,
+                [chunk_id for chunk_id in status.chunks_available
+                 if export_manifest is None or chunk_id not in export_manifest.chunks_completed],
+                partial(self._client.exports_api.assets_chunk, compact=compact),
+                self._client.exports_api.assets_download_chunk,
+                path,
+                file_open_mode,
+                max_workers,
+                export_manifest
+            )
+
+            return assets if path is None else status.chunks_available
+
+    def iter_vulns(self, num_assets=50, severity=None, state=None, plugin_family=None, since=None, tags=None,
+                   cidr_range=None, first_found=None, last_found=None, last_fixed=None, compact=False, lazy=False,
+                   raw=False):
+        """Request the vulns export and yield the exported vulns while the export is still processing. The status is
+            polled and every chunk is retrieved as soon as it becomes available, and decoded while it is downloaded.
+            The chunks will be retrieved in no particular order.
+
+        :param num_assets: Specifies the number of assets per exported chunk. Default is 50. Range is 50-5000.
+        :param severity, state, plugin_family, since, tags, cidr_range, first_found, last_found, last_fixed: The export
+            filters, same as :meth:`download_vulns`.
+        :param compact: If True, yield :class:`tenable_io.api.models.CompactVulnsExport` instances. Default to False.
+        :param lazy: If True, keep the nested models of the vulns as decoded JSON until they are first read. Default to
+            False.
+        :param raw: If True, yield the decoded JSON objects instead of models. Default to False.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :raise TenableIOApiException: When a chunk request fails. A chunk download failing after its first records were
+            yielded is not retried and its error is raised, as a retry would yield these records again.
+        :return: Iterator that yields :class:`tenable_io.api.models.VulnsExport` instances.
+        """
+        filters = self._vulns_filters(severity, state, plugin_family, since, tags, cidr_range, first_found, last_found,
+                                      last_fixed)
+
+        export_uuid = self._client.exports_api.vulns_request_export(
+            ExportsVulnsRequest(
+                num_assets=num_assets,
+                filters=filters
+            )
+        )
+
+        if raw:
+            load_chunk = partial(self._iter_raw_chunk, self._client.exports_api.vulns_download_chunk)
+        else:
+            load_chunk = partial(self._client.exports_api.vulns_chunk, compact=compact, lazy=lazy, stream=True)
+
+        return self._iter_chunks(
+            export_uuid,
+            self._client.exports_api.vulns_export_status,
+            load_chunk,
+            ExportsVulnsStatus
+        )
+
+    def vulns_batch(self, num_assets=50, severity=None, state=None, plugin_family=None, since=None, tags=None,
+                    cidr_range=None, first_found=None, last_found=None, last_fixed=None, columns=None):
+        """Request the vulns export and load the exported vulns into columns, without creating models, to filter and
+            group them with vectorized operations.
+
+        :param num_assets: Specifies the number of assets per exported chunk. Default is 50. Range is 50-5000.
+        :param severity, state, plugin_family, since, tags, cidr_range, first_found, last_found, last_fixed: The export
+            filters, same as :meth:`download_vulns`.
+        :param columns: The columns to load, see :class:`tenable_io.columnar.ColumnarBatch`. Default to None, for
+            :data:`tenable_io.columnar.VULNS_COLUMNS`.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :return: An instance of :class:`tenable_io.columnar.ColumnarBatch`.
+        """
+        return ColumnarBatch.from_records(
+            self.iter_vulns(num_assets, severity, state, plugin_family, since, tags, cidr_range, first_found,
+                            last_found, last_fixed, raw=True),
+            columns
+        )
+
+    def iter_assets(self, chunk_size=100, created_at=None, updated_at=None, terminated_at=None, deleted_at=None,
+                    first_scan_time=None, last_authenticated_scan_time=None, last_assessed=None, servicenow_sysid=None,
+                    sources=None, has_plugin_results=None, tags=None, compact=False, raw=False):
+        """Request the assets export and yield the exported assets while the export is still processing. The status is
+            polled and every chunk is retrieved as soon as it becomes available, and decoded while it is downloaded.
+
+        :param chunk_size: Specifies the number of assets per exported chunk. Default is 100. Range is 100-10000.
+        :param created_at, updated_at, terminated_at, deleted_at, first_scan_time, last_authenticated_scan_time,
+            last_assessed, servicenow_sysid, sources, has_plugin_results, tags: The export filters, same as
+            :meth:`download_assets`.
+        :param compact: If True, yield :class:`tenable_io.api.models.CompactAssetsExport` instances. Default to False.
+        :param raw: If True, yield the decoded JSON objects instead of models. Default to False.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :raise TenableIOApiException: When a chunk request fails. A chunk download failing after its first records were
+            yielded is not retried and its error is raised, as a retry would yield these records again.
+        :return: Iterator that yields :class:`tenable_io.api.models.AssetsExport` instances.
+        """
+        filters = self._assets_filters(created_at, updated_at, terminated_at, deleted_at, first_scan_time,
+                                       last_authenticated_scan_time, last_assessed, servicenow_sysid, sources,
+                                       has_plugin_results, tags)
+
+        export_uuid = self._client.exports_api.assets_request_export(
+            ExportsAssetsRequest(
+                chunk_size=chunk_size,
+                filters=filters
+            )
+        )
+
+        if raw:
+            load_chunk = partial(self._iter_raw_chunk, self._client.exports_api.assets_download_chunk)
+        else:
+            load_chunk = partial(self._client.exports_api.assets_chunk, compact=compact, stream=True)
+
+        return self._iter_chunks(
+            export_uuid,
+            self._client.exports_api.assets_export_status,
+            load_chunk,
+            ExportsAssetsStatus
+        )
+
+    def write_vulns(self, sink, num_assets=50, severity=None, state=None, plugin_family=None, since=None, tags=None,
+                    cidr_range=None, first_found=None, last_found=None, last_fixed=None):
+        """Request the vulns export and write the exported vulns to a sink while they are downloaded, without creating
+            models. The sink is closed once the export is written.
+
+        :param sink: An instance of :class:`tenable_io.sinks.ColumnarFileSink`, i.e. with
+            :data:`tenable_io.sinks.VULNS_SCHEMA` columns.
+        :param num_assets: Specifies the number of assets per exported chunk. Default is 50. Range is 50-5000.
+        :param severity, state, plugin_family, since, tags, cidr_range, first_found, last_found, last_fixed: The export
+            filters, same as :meth:`download_vulns`.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :return: The paths of the written files.
+        """
+        with sink:
+            sink.write_all(self.iter_vulns(num_assets, severity, state, plugin_family, since, tags, cidr_range,
+                                           first_found, last_found, last_fixed, raw=True))
+        return sink.files
+
+    def write_assets(self, sink, chunk_size=100, created_at=None, updated_at=None, terminated_at=None,
+                     deleted_at=None, first_scan_time=None, last_authenticated_scan_time=None, last_assessed=None,
+                     servicenow_sysid=None, sources=None, has_plugin_results=None, tags=None):
+        """Request the assets export and write the exported assets to a sink while they are downloaded, without
+            creating models. The sink is closed once the export is written.
 
+        :param sink: An instance of :class:`tenable_io.sinks.ColumnarFileSink`, i.e. with
+            :data:`tenable_io.sinks.ASSETS_SCHEMA` columns.
+        :param chunk_size: Specifies the number of assets per exported chunk. Default is 100. Range is 100-10000.
+        :param created_at, updated_at, terminated_at, deleted_at, first_scan_time, last_authenticated_scan_time,
+            last_assessed, servicenow_sysid, sources, has_plugin_results, tags: The export filters, same as
+            :meth:`download_assets`.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :return: The paths of the written files.
+        """
+        with sink:
+            sink.write_all(self.iter_assets(chunk_size, created_at, updated_at, terminated_at, deleted_at,
+                                            first_scan_time, last_authenticated_scan_time, last_assessed,
+                                            servicenow_sysid, sources, has_plugin_results, tags, raw=True))
+        return sink.files
+
+    @staticmethod
+    def _vulns_filters(severity, state, plugin_family, since, tags, cidr_range, first_found, last_found, last_fixed):
+        filters = {
+                    u'severity': severity,
+                    u'state': state,
+                    u'plugin_family': plugin_family,
+                    u'since': since,
+                    u'cidr_range': cidr_range,
+                    u'first_found': first_found,
+                    u'last_found': last_found,
+                    u'last_fixed': last_fixed
+                }
+
+        # Parse tag filters
+        if tags is not None:
+            tags = {u'tag.{}'.format(k): v for k, v in tags.items()}
+            filters.update(tags)
+
+        return filters
+
+    @staticmethod
+    def _assets_filters(created_at, updated_at, terminated_at, deleted_at, first_scan_time,
+                        last_authenticated_scan_time, last_assessed, servicenow_sysid, sources, has_plugin_results,
+                        tags):
         filters = {
                     u'created_at': created_at,
                     u'updated_at': updated_at,
@@ -143,28 +381,240 @@ class ExportHelper(object):
             tags = {u'tag.{}'.format(k): v for k, v in tags.items()}
             filters.update(tags)
 
-        export_uuid = self._client.exports_api.assets_request_export(
-            ExportsAssetsRequest(
-                chunk_size=chunk_size,
-                filters=filters
-            )
-        )
+        return filters
+
+    @staticmethod
+    def _iter_raw_chunk(download_chunk, export_uuid, chunk_id):
+        """
+        :param download_chunk: The API method downloading a chunk, i.e. `ExportsApi.vulns_download_chunk`.
+        :return: Iterator that yields the decoded JSON objects of the chunk while it is downloaded.
+        """
+        chunks = download_chunk(export_uuid, chunk_id, chunk_size=STREAM_READ_SIZE)
+        try:
+            for record in iter_array(chunks):
+                yield record
+        finally:
+            _close(chunks)
+
+    @staticmethod
+    def _iter_chunks(export_uuid, export_status, load_chunk, status_class):
+        """Poll the export status and yield the records of every chunk as soon as it becomes available.
+
+        :param export_uuid: The export UUID.
+        :param export_status: The API method returning the export status, i.e. `ExportsApi.vulns_export_status`.
+        :param load_chunk: The API method loading a chunk to memory, i.e. `ExportsApi.vulns_chunk`.
+        :param status_class: The status model class, i.e. `ExportsVulnsStatus`.
+        :raise TenableIOException: When the export errors or is cancelled.
+        :return: Iterator that yields the records of the chunks.
+        """
+        retrieved = set()
+        interval = util.POLLING_INTERVAL
+        count = 0
+        while True:
+            status = export_status(export_uuid)
+
+            if status.status in [status_class.STATUS_ERROR, status_class.STATUS_CANCELLED]:
+                raise TenableIOException(u'Export %s ended with status %s.' % (export_uuid, status.status))
+
+            # The chunks available are final once the export is finished.
+            finished = status.status == status_class.STATUS_FINISHED
 
-        util.wait_until(
-            lambda: self._client.exports_api.assets_export_status(export_uuid).status ==
-            ExportsAssetsStatus.STATUS_FINISHED)
+            pending = [chunk_id for chunk_id in status.chunks_available or [] if chunk_id not in retrieved]
+            for chunk_id in pending:
+                records = iter(load_chunk(export_uuid, chunk_id))
+                try:
+                    for record in records:
+                        yield record
+                finally:
+                    # Release the connection of the chunk right away when the iteration is abandoned.
+                    _close(records)
+                retrieved.add(chunk_id)
 
-        status = self._client.exports_api.assets_export_status(export_uuid)
+            if finished:
+                return
 
-        # Download chunks
-        assets = []
-        for chunk_id in status.chunks_available:
-            if path is None:
-                assets += self._client.exports_api.assets_chunk(export_uuid, chunk_id)
+            # Poll again right away if chunks were retrieved in the meantime, otherwise back off.
+            if not pending:
+                count += 1
+                util.sleep(min(interval, util.MAX_POLLING_INTERVAL))
+                interval += count * 10
             else:
-                iter_content = self._client.exports_api.assets_download_chunk(export_uuid, chunk_id)
+                interval = util.POLLING_INTERVAL
+                count = 0
+
+    @staticmethod
+    def _request_export(request, request_export, export_status, manifest=None):
+        """Request an export, or resume the export recorded in the manifest if it was recorded for the same request
+            and is still available.
+
+        :param request: An instance of :class:`ExportsVulnsRequest` or :class:`ExportsAssetsRequest`.
+        :param request_export: The API method requesting the export, i.e. `ExportsApi.vulns_request_export`.
+        :param export_status: The API method returning the export status, i.e. `ExportsApi.vulns_export_status`.
+        :param manifest: An instance of :class:`ExportManifest`, or None.
+        :return: The export UUID.
+        """
+        payload = request.as_payload()
+
+        if manifest is not None and manifest.matches(payload):
+            try:
+                export_status(manifest.export_uuid)
+                return manifest.export_uuid
+            except TenableIOApiException as e:
+                # Chunks expire, so start over when the recorded export is no longer available.
+                if e.code is not TenableIOErrorCode.NOT_FOUND:
+                    raise
+
+        export_uuid = request_export(request)
+        if manifest is not None:
+            manifest.start(export_uuid, payload)
+        return export_uuid
+
+    @staticmethod
+    def _wait_finished(export_uuid, export_status, status_class, manifest=None):
+        """Poll the export status until the export is finished.
+
+        :param export_uuid: The export UUID.
+        :param export_status: The API method returning the export status, i.e. `ExportsApi.vulns_export_status`.
+        :param status_class: The status model class, i.e. `ExportsVulnsStatus`.
+        :param manifest: An instance of :class:`ExportManifest`, or None. It is removed when the export errors or is
+            cancelled, as the export cannot be resumed.
+        :raise TenableIOException: When the export errors or is cancelled.
+        """
+        def finished():
+            status = export_status(export_uuid).status
+            if status in [status_class.STATUS_ERROR, status_class.STATUS_CANCELLED]:
+                if manifest is not None:
+                    manifest.remove()
+                raise TenableIOException(u'Export %s ended with status %s.' % (export_uuid, status))
+            return status == status_class.STATUS_FINISHED
+        util.wait_until(finished)
+
+    @staticmethod
+    def _download_chunks(export_uuid, chunk_ids, load_chunk, download_chunk, path, file_open_mode, max_workers,
+                         manifest=None):
+        """Download the export chunks to disk or load them to memory, using a bounded pool of worker threads when
+            `max_workers` is greater than 1. Every chunk request goes through the client, so it is retried individually.
+
+        :param export_uuid: The export UUID.
+        :param chunk_ids: The IDs of the chunks to retrieve.
+        :param load_chunk: The API method loading a chunk to memory, i.e. `ExportsApi.vulns_chunk`.
+        :param download_chunk: The API method streaming a chunk, i.e. `ExportsApi.vulns_download_chunk`.
+        :param path: The parameterized file path to save the chunks to. Will load to memory if equals `None`.
+        :param file_open_mode: The open mode to the file output.
+        :param max_workers: The maximum number of chunks to retrieve concurrently.
+        :param manifest: An instance of :class:`ExportManifest` to record completed chunks to, or None.
+        :return: The records of all chunks, in the order of `chunk_ids`, if path is `None` else an empty list.
+        """
+        # Worker threads do not inherit the deadline of the calling thread.
+        deadline = util.current_deadline()
+
+        def retrieve(chunk_id):
+            with util.deadline_scope(deadline):
+                if path is None:
+                    return load_chunk(export_uuid, chunk_id)
+                iter_content = download_chunk(export_uuid, chunk_id)
                 with open(path % {'chunk_id': chunk_id}, file_open_mode) as fd:
                     for chunk in iter_content:
+                        util.check_deadline()
                         fd.write(chunk)
+                if manifest is not None:
+                    manifest.complete(chunk_id)
+                return []
+
+        if max_workers and max_workers > 1 and len(chunk_ids) > 1:
+            pool = ThreadPool(min(max_workers, len(chunk_ids)))
+            try:
+                # One chunk per task so slow chunks do not hold back a whole batch of pending ones.
+                results = pool.map(retrieve, chunk_ids, 1)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [retrieve(chunk_id) for chunk_id in chunk_ids]
+
+        if manifest is not None:
+            manifest.remove()
+
+        records = []
+        for result in results:
+            records += result
+        return records
+
+
+class ExportManifest(object):
+
+    def __init__(self, path):
+        """Checkpoint of an export download, persisted as a JSON file so that an interrupted download can be resumed
+            while the export chunks are still available.
+
+        :param path: The file path of the manifest. It is loaded if it exists.
+        """
+        self.path = path
+        self.export_uuid = None
+        self.request = None
+        self.chunks_completed = set()
+        self._lock = threading.Lock()
+
+        if os.path.isfile(path):
+            with open(path, 'r') as fd:
+                manifest = json.load(fd)
+            self.export_uuid = manifest.get(u'export_uuid')
+            self.request = manifest.get(u'request')
+            self.chunks_completed = set(manifest.get(u'chunks_completed', []))
+
+    def matches(self, request):
+        """
+        :param request: The export request payload.
+        :return: True if the manifest was recorded for an export of the same request.
+        """
+        return self.export_uuid is not None and self.request == self._normalize(request)
+
+    def start(self, export_uuid, request):
+        """Record a new export, discarding any previously completed chunks.
+
+        :param export_uuid: The export UUID.
+        :param request: The export request payload.
+        """
+        with self._lock:
+            self.export_uuid = export_uuid
+            self.request = self._normalize(request)
+            self.chunks_completed = set()
+            self._save()
+
+    def complete(self, chunk_id):
+        """Record a downloaded chunk. Safe to call from multiple threads.
+
+        :param chunk_id: The chunk ID.
+        """
+        with self._lock:
+            self.chunks_completed.add(chunk_id)
+            self._save()
+
+    def remove(self):
+        """Remove the manifest file once the export is fully downloaded.
+        """
+        with self._lock:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+
+    @staticmethod
+    def _normalize(request):
+        # Compare requests the way they are read back from the manifest file.
+        return json.loads(json.dumps(request))
+
+    def _save(self):
+        # Write to a temporary file first so an interruption never leaves a truncated manifest behind.
+        temp_path = self.path + u'.tmp'
+        with open(temp_path, 'w') as fd:
+            json.dump({
+                u'export_uuid': self.export_uuid,
+                u'request': self.request,
+                u'chunks_completed': sorted(self.chunks_completed),
+            }, fd)
+        _replace(temp_path, self.path)
+
 
-        return assets if path is None else status.chunks_available
+def _close(iterator):
+    close = getattr(iterator, u'close', None)
+    if close is not None:
+        close()
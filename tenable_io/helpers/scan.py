@@ -300,7 +300,7 @@ class ScanHelper(object):
 
         # Look up history_id for each history_uuid
         for scan_id, activities_by_history_uuid in activities_by_scan_history.items():
-            details = self._client.scans_api.details(scan_id)
+            details = self._client.scans_api.details(scan_id, lazy=True)
             for history in details.history:
                 if history.uuid in activities_by_history_uuid:
                     for a in activities_by_history_uuid[history.uuid]:
@@ -329,13 +329,14 @@ class ScanHelper(object):
             for s in scans.scans:
                 # Find the corresponding history.
                 history = None
-                for h in self._client.scans_api.details(scan_id=s.scan_id).history:
+                for h in self._client.scans_api.details(scan_id=s.scan_id, lazy=True).history:
                     if s.id == h.uuid:
                         history = h
                         break
                 assert history, u'There should be history with the matching ID returned by the scanner.'
 
-                details = self._client.scans_api.details(scan_id=s.scan_id, history_id=history.history_id)
+                details = self._client.scans_api.details(scan_id=s.scan_id, history_id=history.history_id,
+                                                         lazy=True)
 
                 # Check if this scan has matching targets.
                 if details.info.targets:
@@ -406,15 +407,18 @@ class ScanRef(object):
         self._client.scans_api.delete(schedule_uuid=self.id)
         return self
 
-    def details(self, history_id=None):
+    def details(self, history_id=None, lazy=False):
         """Get the scan detail.
 
+        :param history_id: The scan history to get details for, None for most recent. Default to None.
+        :param lazy: If True, keep the info, hosts and history as decoded JSON until they are first read. Default to
+            False.
         :return: An instance of :class:`tenable_io.api.models.ScanDetails`.
         """
-        return self._client.scans_api.details(schedule_uuid=self.uuid, history_id=history_id)
+        return self._client.scans_api.details(schedule_uuid=self.uuid, history_id=history_id, lazy=lazy)
 
     def download(self, path, history_id=None, format=ScanExportRequest.FORMAT_PDF,
-                 chapter=ScanExportRequest.CHAPTER_EXECUTIVE_SUMMARY, file_open_mode='wb', is_was=False):
+                 chapter=ScanExportRequest.CHAPTER_EXECUTIVE_SUMMARY, file_open_mode='wb', is_was=False, deadline=None):
         """Download a scan report.
 
         :param path: The file path to save the report to.
@@ -425,28 +429,35 @@ class ScanRef(object):
         :param history_id: A specific scan history ID, None for the most recent scan history. default to None.
         :param is_was: A flag that specifies that the scan is a WAS type scan, which requires additional changes to the
         export request.
+        :param deadline: The number of seconds or the :class:`tenable_io.util.Deadline` to give up waiting for the scan
+            and downloading the report after. Default to None, for the current deadline if any.
+        :raise TenableIODeadlineExceededException: When the deadline expires.
         :return: The same ScanRef instance.
         """
-        self.wait_until_stopped(history_id=history_id)
-
-        if format in [ScanExportRequest.FORMAT_HTML, ScanExportRequest.FORMAT_PDF]:
-            export_request = ScanExportRequest(format=format, chapters=chapter)
-        else:
-            export_request = ScanExportRequest(format=format)
-
-        file_id = self._client.scans_api.export_request(
-            scan_export=export_request,
-            history_id=history_id,
-            is_was=is_was,
-            schedule_uuid=self.uuid
-        )
-        util.wait_until(
-            lambda: self._client.scans_api.export_status(file_id=file_id, is_was=is_was, schedule_uuid=self.uuid) == ScansApi.STATUS_EXPORT_READY)
-
-        iter_content = self._client.scans_api.export_download(file_id=file_id, is_was=is_was, schedule_uuid=self.uuid)
-        with open(path, file_open_mode) as fd:
-            for chunk in iter_content:
-                fd.write(chunk)
+        with util.deadline_scope(deadline):
+            self.wait_until_stopped(history_id=history_id)
+
+            if format in [ScanExportRequest.FORMAT_HTML, ScanExportRequest.FORMAT_PDF]:
+                export_request = ScanExportRequest(format=format, chapters=chapter)
+            else:
+                export_request = ScanExportRequest(format=format)
+
+            file_id = self._client.scans_api.export_request(
+                scan_export=export_request,
+                history_id=history_id,
+                is_was=is_was,
+                schedule_uuid=self.uuid
+            )
+            util.wait_until(
+                lambda: self._client.scans_api.export_status(file_id=file_id, is_was=is_was, schedule_uuid=self.uuid) ==
+                ScansApi.STATUS_EXPORT_READY)
+
+            iter_content = self._client.scans_api.export_download(file_id=file_id, is_was=is_was,
+                                                                  schedule_uuid=self.uuid)
+            with open(path, file_open_mode) as fd:
+                for chunk in iter_content:
+                    util.check_deadline()
+                    fd.write(chunk)
         return self
 
     def histories(self, since=None):
@@ -456,7 +467,7 @@ class ScanRef(object):
         If defined, only scan histories after this are returned.
         :return: A list of :class:`tenable_io.api.models.ScanDetailsHistory`.
         """
-        histories = self.details().history
+        histories = self.details(lazy=True).history
         if since:
             assert isinstance(since, datetime), '`since` parameter should be an instance of datetime.'
             ts = time.mktime(since.timetuple())
@@ -497,7 +508,7 @@ class ScanRef(object):
         :param history_id: The scan history to get name for, None for most recent. Default to None.
         :return: The name.
         """
-        return self.details(history_id=history_id).info.name
+        return self.details(history_id=history_id, lazy=True).info.name
 
     def folder(self, history_id=None):
         """Get the folder the scan is in.
@@ -506,7 +517,7 @@ class ScanRef(object):
         :return: An instance of FolderRef.
         """
         from tenable_io.helpers.folder import FolderRef
-        return FolderRef(self._client, self.details(history_id=history_id).info.folder_id)
+        return FolderRef(self._client, self.details(history_id=history_id, lazy=True).info.folder_id)
 
     def move_to(self, folder):
         """Move the scan to a folder.
@@ -595,11 +606,14 @@ class ScanRef(object):
             self.stop()
         return self
 
-    def wait_until_stopped(self, history_id=None):
+    def wait_until_stopped(self, history_id=None, deadline=None):
         """Blocks until the scan is stopped.
 
         :param history_id: The scan history to wait for, None for most recent. Default to None.
+        :param deadline: The number of seconds or the :class:`tenable_io.util.Deadline` to give up waiting after.
+            Default to None, for the current deadline if any.
+        :raise TenableIODeadlineExceededException: When the deadline expires before the scan is stopped.
         :return: The same ScanRef instance.
         """
-        util.wait_until(lambda: self.stopped(history_id=history_id))
+        util.wait_until(lambda: self.stopped(history_id=history_id), deadline=deadline)
         return self
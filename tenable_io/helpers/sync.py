@@ -0,0 +1,503 @@
+import json
+import os
+import sqlite3
+import time
+
+import six
+
+from tenable_io.api.models import BaseModel, CompactModel, LazyValue
+from tenable_io.codec import dumps, loads
+
+# os.replace is not available on Python 2, where os.rename already overwrites on POSIX.
+_replace = getattr(os, 'replace', os.rename)
+
+
+class SyncHelper(object):
+
+    KIND_ASSETS = u'assets'
+    KIND_VULNS = u'vulns'
+
+    VULNS_STATE_FIXED = u'fixed'
+    VULNS_STATES_ACTIVE = [u'open', u'reopened']
+    VULNS_STATES = VULNS_STATES_ACTIVE + [VULNS_STATE_FIXED]
+
+    def __init__(self, client):
+        self._client = client
+
+    def sync(self, store, tenant=u'default'):
+        """Synchronize both assets and vulns to the local store. See :meth:`sync_assets` and :meth:`sync_vulns`.
+
+        :param store: An instance of :class:`SyncStore`.
+        :param tenant: The tenant name the watermarks and records are kept under. Default to "default".
+        :return: A list of :class:`SyncResult`, one per kind.
+        """
+        return [self.sync_assets(store, tenant), self.sync_vulns(store, tenant)]
+
+    def sync_assets(self, store, tenant=u'default'):
+        """Synchronize assets to the local store. The first sync exports all assets, the next ones only export the
+            assets updated, deleted or terminated since the watermark of the previous sync.
+
+        :param store: An instance of :class:`SyncStore`.
+        :param tenant: The tenant name the watermark and records are kept under. Default to "default".
+        :raise TenableIOApiException: When API error is encountered.
+        :return: An instance of :class:`SyncResult`.
+        """
+        since = store.watermark(tenant, SyncHelper.KIND_ASSETS)
+        # Taken before requesting the exports, so changes made during the sync are picked up by the next one.
+        watermark = int(time.time())
+        result = SyncResult(tenant, SyncHelper.KIND_ASSETS, since, watermark)
+
+        if since is None:
+            self._apply(store, result, self._client.export_helper.iter_assets())
+        else:
+            self._apply(store, result, self._client.export_helper.iter_assets(updated_at=since))
+            self._apply(store, result, self._client.export_helper.iter_assets(deleted_at=since))
+            self._apply(store, result, self._client.export_helper.iter_assets(terminated_at=since))
+
+        store.set_watermark(tenant, SyncHelper.KIND_ASSETS, watermark)
+        store.commit()
+        return result
+
+    def sync_vulns(self, store, tenant=u'default'):
+        """Synchronize vulns to the local store. The first sync exports all vulns, the next ones only export the vulns
+            found or updated since the watermark of the previous sync. The first sync only exports the open and
+            reopened vulns, the next ones also export the fixed vulns to remove them from the store.
+
+        :param store: An instance of :class:`SyncStore`.
+        :param tenant: The tenant name the watermark and records are kept under. Default to "default".
+        :raise TenableIOApiException: When API error is encountered.
+        :return: An instance of :class:`SyncResult`.
+        """
+        since = store.watermark(tenant, SyncHelper.KIND_VULNS)
+        watermark = int(time.time())
+        result = SyncResult(tenant, SyncHelper.KIND_VULNS, since, watermark)
+
+        # The fixed vulns of a full export would only be removed again.
+        states = SyncHelper.VULNS_STATES_ACTIVE if since is None else SyncHelper.VULNS_STATES
+        self._apply(store, result, self._client.export_helper.iter_vulns(state=states, since=since))
+
+        store.set_watermark(tenant, SyncHelper.KIND_VULNS, watermark)
+        store.commit()
+        return result
+
+    @staticmethod
+    def _apply(store, result, records, batch_size=1000):
+        upserts = []
+        deletes = []
+        for record in records:
+            key = record_key(result.kind, record)
+            if is_tombstone(result.kind, record):
+                deletes.append(key)
+            else:
+                upserts.append(record)
+                result.upserted.append(key)
+
+            if len(upserts) >= batch_size:
+                store.upsert(result.tenant, result.kind, upserts)
+                upserts = []
+            if len(deletes) >= batch_size:
+                result.deleted += store.delete(result.tenant, result.kind, deletes)
+                deletes = []
+
+        if upserts:
+            store.upsert(result.tenant, result.kind, upserts)
+        if deletes:
+            result.deleted += store.delete(result.tenant, result.kind, deletes)
+
+
+def record_key(kind, record):
+    """
+    :param kind: SyncHelper.KIND_ASSETS or SyncHelper.KIND_VULNS.
+    :param record: An instance of :class:`tenable_io.api.models.AssetsExport` or
+        :class:`tenable_io.api.models.VulnsExport`.
+    :return: The key identifying the record in the store. A vuln is identified by its asset, plugin and port.
+    """
+    if kind == SyncHelper.KIND_ASSETS:
+        return record.id
+    port = record.port
+    return u'%s:%s:%s:%s' % (
+        record.asset.uuid if record.asset else None,
+        record.plugin.id if record.plugin else None,
+        port.port if port else None,
+        port.protocol if port else None,
+    )
+
+
+def is_tombstone(kind, record):
+    """
+    :param kind: SyncHelper.KIND_ASSETS or SyncHelper.KIND_VULNS.
+    :param record: An instance of :class:`tenable_io.api.models.AssetsExport` or
+        :class:`tenable_io.api.models.VulnsExport`.
+    :return: True if the record should be removed from the store, i.e. a deleted or terminated asset, or a fixed vuln.
+    """
+    if kind == SyncHelper.KIND_ASSETS:
+        return bool(record.deleted_at or record.terminated_at)
+    return (record.state or u'').lower() == SyncHelper.VULNS_STATE_FIXED
+
+
+class SyncResult(object):
+
+    def __init__(
+            self,
+            tenant=None,
+            kind=None,
+            since=None,
+            watermark=None,
+            upserted=None,
+            deleted=None,
+    ):
+        """What changed in the store during a sync.
+
+        :param tenant: The tenant name.
+        :param kind: SyncHelper.KIND_ASSETS or SyncHelper.KIND_VULNS.
+        :param since: The watermark the delta was exported from, None for a full sync.
+        :param watermark: The new watermark.
+        :param upserted: The keys of the inserted or updated records.
+        :param deleted: The keys of the removed records.
+        """
+        self.tenant = tenant
+        self.kind = kind
+        self.since = since
+        self.watermark = watermark
+        self.upserted = upserted if upserted is not None else []
+        self.deleted = deleted if deleted is not None else []
+
+
+class SyncStore(object):
+    """Local store synchronized by :class:`SyncHelper`. Subclasses implement the storage of the records and watermarks.
+    """
+
+    def watermark(self, tenant, kind):
+        """
+        :return: The Unix time of the last sync of that kind for the tenant, None if it was never synchronized.
+        """
+        raise NotImplementedError()
+
+    def set_watermark(self, tenant, kind, watermark):
+        raise NotImplementedError()
+
+    def upsert(self, tenant, kind, records):
+        """Insert or update records.
+
+        :param records: A list of :class:`tenable_io.api.models.AssetsExport` or
+            :class:`tenable_io.api.models.VulnsExport`.
+        """
+        raise NotImplementedError()
+
+    def delete(self, tenant, kind, keys):
+        """Remove records.
+
+        :param keys: A list of keys as returned by :func:`record_key`.
+        :return: The list of keys that were actually removed.
+        """
+        raise NotImplementedError()
+
+    def commit(self):
+        """Persist the changes. Called at the end of every sync.
+        """
+        pass
+
+
+class MemorySyncStore(SyncStore):
+
+    def __init__(self, path=None):
+        """Store keeping records as dicts in memory, optionally persisted to a JSON file.
+
+        :param path: The JSON file path to load from and commit to. Default to None, for memory only.
+        """
+        self.path = path
+        self.watermarks = {}
+        self.records = {}
+
+        if path is not None and os.path.isfile(path):
+            with open(path, 'r') as fd:
+                data = json.load(fd)
+            self.watermarks = data.get(u'watermarks', {})
+            self.records = data.get(u'records', {})
+
+    def watermark(self, tenant, kind):
+        return self.watermarks.get(tenant, {}).get(kind)
+
+    def set_watermark(self, tenant, kind, watermark):
+        self.watermarks.setdefault(tenant, {})[kind] = watermark
+
+    def upsert(self, tenant, kind, records):
+        store = self.records.setdefault(tenant, {}).setdefault(kind, {})
+        for record in records:
+            store[record_key(kind, record)] = as_dict(record)
+
+    def delete(self, tenant, kind, keys):
+        """Remove records. Removing an asset removes its vulns as well.
+
+        :param keys: A list of keys as returned by :func:`record_key`.
+        :return: The list of keys that were actually removed.
+        """
+        records = self.records.setdefault(tenant, {})
+        store = records.setdefault(kind, {})
+        deleted = [key for key in keys if store.pop(key, None) is not None]
+        if kind == SyncHelper.KIND_ASSETS:
+            # The vulns of a removed asset go with it.
+            assets = set(keys)
+            vulns = records.get(SyncHelper.KIND_VULNS, {})
+            for key in [key for key, vuln in vulns.items() if (vuln.get(u'asset') or {}).get(u'uuid') in assets]:
+                del vulns[key]
+        return deleted
+
+    def commit(self):
+        if self.path is None:
+            return
+        temp_path = self.path + u'.tmp'
+        with open(temp_path, 'w') as fd:
+            json.dump({u'watermarks': self.watermarks, u'records': self.records}, fd)
+        _replace(temp_path, self.path)
+
+
+class SqliteSyncStore(SyncStore):
+
+    # The number of values per IN clause, under the default limit of 999 SQLite variables.
+    MAX_VARIABLES = 500
+
+    SCHEMA = [
+        u'CREATE TABLE IF NOT EXISTS watermarks (tenant TEXT NOT NULL, kind TEXT NOT NULL, watermark INTEGER, '
+        u'PRIMARY KEY (tenant, kind))',
+        u'CREATE TABLE IF NOT EXISTS assets (tenant TEXT NOT NULL, uuid TEXT NOT NULL, hostname TEXT, ipv4 TEXT, '
+        u'last_seen TEXT, data TEXT NOT NULL, PRIMARY KEY (tenant, uuid))',
+        u'CREATE TABLE IF NOT EXISTS asset_tags (tenant TEXT NOT NULL, asset_uuid TEXT NOT NULL, key TEXT, value TEXT)',
+        u'CREATE INDEX IF NOT EXISTS asset_tags_asset ON asset_tags (tenant, asset_uuid)',
+        u'CREATE INDEX IF NOT EXISTS asset_tags_tag ON asset_tags (tenant, key, value)',
+        u'CREATE TABLE IF NOT EXISTS plugins (tenant TEXT NOT NULL, id INTEGER NOT NULL, name TEXT, family TEXT, '
+        u'data TEXT NOT NULL, PRIMARY KEY (tenant, id))',
+        u'CREATE TABLE IF NOT EXISTS plugin_cves (tenant TEXT NOT NULL, plugin_id INTEGER NOT NULL, cve TEXT NOT NULL, '
+        u'PRIMARY KEY (tenant, plugin_id, cve))',
+        u'CREATE INDEX IF NOT EXISTS plugin_cves_cve ON plugin_cves (tenant, cve)',
+        u'CREATE TABLE IF NOT EXISTS findings (tenant TEXT NOT NULL, key TEXT NOT NULL, asset_uuid TEXT, '
+        u'plugin_id INTEGER, port INTEGER, protocol TEXT, severity TEXT, state TEXT, first_found TEXT, '
+        u'last_found TEXT, data TEXT NOT NULL, PRIMARY KEY (tenant, key))',
+        u'CREATE INDEX IF NOT EXISTS findings_asset ON findings (tenant, asset_uuid)',
+        u'CREATE INDEX IF NOT EXISTS findings_plugin ON findings (tenant, plugin_id)',
+        u'CREATE INDEX IF NOT EXISTS findings_severity ON findings (tenant, severity, state)',
+        u'CREATE INDEX IF NOT EXISTS findings_state ON findings (tenant, state)',
+    ]
+
+    def __init__(self, path=u':memory:'):
+        """Store keeping records in a SQLite database, to look up assets and vulns locally instead of exporting them
+            again. Assets are kept in an asset table, vulns in a finding table and the plugins of the vulns, held once,
+            in a plugin table. The tables are indexed on asset UUID, plugin ID, CVE, severity and state, as well as on
+            asset tags.
+
+        :param path: The database file path, created if missing. Default to ":memory:", for memory only.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        for statement in SqliteSyncStore.SCHEMA:
+            self._connection.execute(statement)
+        self._connection.commit()
+
+    def watermark(self, tenant, kind):
+        row = self._connection.execute(u'SELECT watermark FROM watermarks WHERE tenant = ? AND kind = ?',
+                                       (tenant, kind)).fetchone()
+        return row[0] if row is not None else None
+
+    def set_watermark(self, tenant, kind, watermark):
+        self._connection.execute(u'INSERT OR REPLACE INTO watermarks (tenant, kind, watermark) VALUES (?, ?, ?)',
+                                 (tenant, kind, watermark))
+
+    def upsert(self, tenant, kind, records):
+        if kind == SyncHelper.KIND_ASSETS:
+            self._upsert_assets(tenant, records)
+        else:
+            self._upsert_vulns(tenant, records)
+
+    def delete(self, tenant, kind, keys):
+        """Remove records. Removing an asset removes its findings as well.
+
+        :param keys: A list of keys as returned by :func:`record_key`.
+        :return: The list of keys that were actually removed.
+        """
+        deleted = []
+        for key in keys:
+            if kind == SyncHelper.KIND_ASSETS:
+                cursor = self._connection.execute(u'DELETE FROM assets WHERE tenant = ? AND uuid = ?', (tenant, key))
+                # The findings of a removed asset go with it.
+                for table in [u'asset_tags', u'findings']:
+                    self._connection.execute(u'DELETE FROM %s WHERE tenant = ? AND asset_uuid = ?' % table,
+                                             (tenant, key))
+            else:
+                cursor = self._connection.execute(u'DELETE FROM findings WHERE tenant = ? AND key = ?', (tenant, key))
+            if cursor.rowcount > 0:
+                deleted.append(key)
+        return deleted
+
+    def commit(self):
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def assets(self, tenant=u'default', uuid=None, tag=None, plugin_id=None):
+        """Look up assets. The filters are combined, a list matching any of its values.
+
+        :param tenant: The tenant name. Default to "default".
+        :param uuid: The asset UUID, or a list of them.
+        :param tag: The tag, as a (key, value) tuple, i.e. (u'Location', u'Paris').
+        :param plugin_id: The ID of a plugin the assets have a finding of, or a list of them.
+        :return: The assets, as dicts.
+        """
+        where, params = [u'a.tenant = ?'], [tenant]
+        _filter(where, params, u'a.uuid', uuid)
+        if tag is not None:
+            where.append(u'a.uuid IN (SELECT asset_uuid FROM asset_tags WHERE tenant = ? AND key = ? AND value = ?)')
+            params.extend([tenant, tag[0], tag[1]])
+        if plugin_id is not None:
+            sub_where, sub_params = [u'tenant = ?'], [tenant]
+            _filter(sub_where, sub_params, u'plugin_id', plugin_id)
+            where.append(u'a.uuid IN (SELECT asset_uuid FROM findings WHERE %s)' % u' AND '.join(sub_where))
+            params.extend(sub_params)
+        rows = self._connection.execute(u'SELECT a.data FROM assets a WHERE %s' % u' AND '.join(where), params)
+        return [loads(data) for data, in rows]
+
+    def findings(self, tenant=u'default', asset_uuid=None, plugin_id=None, cve=None, severity=None, state=None,
+                 tag=None):
+        """Look up vulns. The filters are combined, a list matching any of its values.
+
+        :param tenant: The tenant name. Default to "default".
+        :param asset_uuid: The asset UUID, or a list of them.
+        :param plugin_id: The plugin ID, or a list of them.
+        :param cve: The CVE ID of the plugin, or a list of them, i.e. u'CVE-2014-0160'.
+        :param severity: The severity, or a list of them, i.e. u'critical'. Case insensitive.
+        :param state: The state, or a list of them, i.e. u'open'. Case insensitive.
+        :param tag: The tag of the asset, as a (key, value) tuple. Requires the assets to be synchronized as well.
+        :return: The vulns, as dicts with their plugin.
+        """
+        where, params = [u'f.tenant = ?'], [tenant]
+        _filter(where, params, u'f.asset_uuid', asset_uuid)
+        _filter(where, params, u'f.plugin_id', plugin_id)
+        _filter(where, params, u'f.severity', _lower(severity))
+        _filter(where, params, u'f.state', _lower(state))
+        if cve is not None:
+            sub_where, sub_params = [u'tenant = ?'], [tenant]
+            _filter(sub_where, sub_params, u'cve', cve)
+            where.append(u'f.plugin_id IN (SELECT plugin_id FROM plugin_cves WHERE %s)' % u' AND '.join(sub_where))
+            params.extend(sub_params)
+        if tag is not None:
+            where.append(u'f.asset_uuid IN (SELECT asset_uuid FROM asset_tags WHERE tenant = ? AND key = ? '
+                         u'AND value = ?)')
+            params.extend([tenant, tag[0], tag[1]])
+        rows = self._connection.execute(
+            u'SELECT f.data, p.data FROM findings f LEFT JOIN plugins p ON p.tenant = f.tenant AND p.id = f.plugin_id '
+            u'WHERE %s' % u' AND '.join(where),
+            params
+        )
+        findings = []
+        for data, plugin_data in rows:
+            finding = loads(data)
+            if plugin_data is not None:
+                finding[u'plugin'] = loads(plugin_data)
+            findings.append(finding)
+        return findings
+
+    def plugin(self, plugin_id, tenant=u'default'):
+        """
+        :param plugin_id: The plugin ID.
+        :param tenant: The tenant name. Default to "default".
+        :return: The plugin of the synchronized vulns, as a dict, None if no vuln has it.
+        """
+        row = self._connection.execute(u'SELECT data FROM plugins WHERE tenant = ? AND id = ?',
+                                       (tenant, plugin_id)).fetchone()
+        return loads(row[0]) if row is not None else None
+
+    def _upsert_assets(self, tenant, records):
+        assets = []
+        tags = []
+        for record in records:
+            asset = as_dict(record)
+            uuid = record_key(SyncHelper.KIND_ASSETS, record)
+            ipv4s = asset.get(u'ipv4s') or [None]
+            hostnames = asset.get(u'hostnames') or [None]
+            assets.append((tenant, uuid, hostnames[0], ipv4s[0], asset.get(u'last_seen'), dumps(asset)))
+            tags.extend((tenant, uuid, tag.get(u'key'), tag.get(u'value')) for tag in asset.get(u'tags') or []
+                        if isinstance(tag, dict))
+
+        self._execute_in(u'DELETE FROM asset_tags WHERE tenant = ? AND asset_uuid IN (%s)', tenant,
+                         [asset[1] for asset in assets])
+        self._connection.executemany(u'INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?)', assets)
+        self._connection.executemany(u'INSERT INTO asset_tags VALUES (?, ?, ?, ?)', tags)
+
+    def _upsert_vulns(self, tenant, records):
+        findings = []
+        plugins = {}
+        for record in records:
+            vuln = as_dict(record)
+            # The plugin is held once in the plugin table rather than in every finding.
+            plugin = vuln.pop(u'plugin', None) or {}
+            asset = vuln.get(u'asset') or {}
+            port = vuln.get(u'port') or {}
+            plugin_id = plugin.get(u'id')
+            if plugin_id is not None:
+                plugins[plugin_id] = plugin
+            findings.append((
+                tenant,
+                record_key(SyncHelper.KIND_VULNS, record),
+                asset.get(u'uuid'),
+                plugin_id,
+                port.get(u'port'),
+                port.get(u'protocol'),
+                _lower(vuln.get(u'severity')),
+                _lower(vuln.get(u'state')),
+                vuln.get(u'first_found'),
+                vuln.get(u'last_found'),
+                dumps(vuln),
+            ))
+
+        self._execute_in(u'DELETE FROM plugin_cves WHERE tenant = ? AND plugin_id IN (%s)', tenant, list(plugins))
+        self._connection.executemany(
+            u'INSERT OR REPLACE INTO plugins VALUES (?, ?, ?, ?, ?)',
+            [(tenant, id_, plugin.get(u'name'), plugin.get(u'family'), dumps(plugin))
+             for id_, plugin in plugins.items()]
+        )
+        self._connection.executemany(
+            u'INSERT OR IGNORE INTO plugin_cves VALUES (?, ?, ?)',
+            [(tenant, id_, cve) for id_, plugin in plugins.items() for cve in plugin.get(u'cve') or []]
+        )
+        self._connection.executemany(u'INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                     findings)
+
+    def _execute_in(self, statement, tenant, values):
+        for i in range(0, len(values), SqliteSyncStore.MAX_VARIABLES):
+            batch = values[i:i + SqliteSyncStore.MAX_VARIABLES]
+            self._connection.execute(statement % u', '.join([u'?'] * len(batch)), [tenant] + batch)
+
+
+def _filter(where, params, column, value):
+    if value is None:
+        return
+    if isinstance(value, (list, tuple, set)):
+        where.append(u'%s IN (%s)' % (column, u', '.join([u'?'] * len(value))))
+        params.extend(value)
+    else:
+        where.append(u'%s = ?' % column)
+        params.append(value)
+
+
+def _lower(value):
+    if isinstance(value, six.string_types):
+        return value.lower()
+    if isinstance(value, (list, tuple, set)):
+        return [_lower(item) for item in value]
+    return value
+
+
+def as_dict(value):
+    """
+    :param value: A model, a list of models or a plain value.
+    :return: The value as plain dicts and lists, with model properties under their public names.
+    """
+    if isinstance(value, CompactModel):
+        return value.as_dict()
+    if isinstance(value, LazyValue):
+        return value.value
+    if isinstance(value, BaseModel):
+        return {k.lstrip(u'_'): as_dict(v) for k, v in vars(value).items()}
+    if isinstance(value, list):
+        return [as_dict(v) for v in value]
+    return value
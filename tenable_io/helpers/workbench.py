@@ -1,8 +1,9 @@
 import tempfile
 
+from tenable_io.api.exports import STREAM_READ_SIZE
 from tenable_io.api.workbenches import WorkbenchesApi
 from tenable_io.parser.workbenches import WorkbenchParser
-from tenable_io.util import wait_until
+from tenable_io.util import check_deadline, deadline_scope, wait_until, Prefetcher
 
 
 class WorkbenchHelper(object):
@@ -12,17 +13,21 @@ class WorkbenchHelper(object):
     def __init__(self, client):
         self._client = client
 
-    def assets(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def assets(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE, processes=None, plugins=None,
+               prefetch=0, max_page_size=None):
         """Retrieve recorded assets.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param plugin_id: If specified, returns only assets with vulnerabilities found by the plugin identified by
             plugin_id, default to None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param processes: The number of processes to parse the report with, see :meth:`assets_parse`.
+        :param plugins: The plugin table to normalize the vulnerabilities with, see :meth:`assets_parse`.
+        :param prefetch, max_page_size: The prefetching of the pages, see :meth:`assets_parse`.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`AssetVulnerabilities`.
         """
-        return self.assets_parse(date_range, plugin_id, page_size)
+        return self.assets_parse(date_range, plugin_id, page_size, processes, plugins, prefetch, max_page_size)
 
     def assets_api(self, date_range=1, plugin_id=None):
         """Retrieve recorded assets.
@@ -62,13 +67,25 @@ class WorkbenchHelper(object):
 
         return vulnerability_assets_ids
 
-    def assets_parse(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def assets_parse(self, date_range=1, plugin_id=None, page_size=DEFAULT_PAGE_SIZE, processes=None, plugins=None,
+                     prefetch=0, max_page_size=None):
         """Retrieve recorded assets from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param plugin_id: If specified, returns only assets with vulnerabilities found by the plugin identified by
             plugin_id, default to None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param processes: The number of processes to parse the report with. Default to None, to parse the report in
+            this process while it is downloaded. Otherwise the report is downloaded to a temporary file first, and
+            parsed in parallel with :meth:`WorkbenchParser.parse_parallel`, 0 for the number of CPUs.
+        :param plugins: An instance of :class:`PluginTable`. If specified, the vulnerabilities are :class:`Finding`
+            instances holding the fields of the vulnerability instance only, and sharing the :class:`Plugin` of the
+            table for the plugin fields. Default to None, for :class:`Vulnerability` instances.
+        :param prefetch: The number of pages to parse ahead in a background thread while the pages are consumed.
+            Default to 0, to parse the pages when they are requested.
+        :param max_page_size: If specified with `prefetch`, the page size adapts between `page_size` and
+            `max_page_size`: it doubles while the pages are consumed slower than they are parsed, and halves while the
+            consumer waits for them. Default to None, for pages of `page_size`.
         :raise TenableIOApiException:  When API error is encountered.
         :return: Iterator that yields pages of :class:`AssetVulnerabilities`.
         """
@@ -87,41 +104,29 @@ class WorkbenchHelper(object):
 
         wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
 
-        iter_content = self._client.workbenches_api.export_download(file_id)
+        iter_content = self._client.workbenches_api.export_download(file_id, chunk_size=STREAM_READ_SIZE)
 
-        with tempfile.NamedTemporaryFile() as temp:
+        assets = (AssetVulnerabilities().from_report(report, plugins)
+                  for report in self._parse(iter_content, WorkbenchParser.REPORT_HOST, processes))
+        for page in self._pages(assets, page_size, prefetch, max_page_size):
+            yield page
 
-            for chunk in iter_content:
-                temp.write(chunk)
-                temp.flush()
-
-            assets = []
-            try:
-                gen = WorkbenchParser.parse(temp.name)
-                while True:
-                    report = next(gen)
-                    assets.append(AssetVulnerabilities().from_report(report))
-                    if page_size and len(assets) >= page_size:
-                        yield assets
-                        assets = []
-                pass
-            except StopIteration:
-                pass
-
-        if len(assets) > 0:
-            yield assets
-
-    def vulnerabilities(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def vulnerabilities(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE, processes=None, plugins=None,
+                        prefetch=0, max_page_size=None):
         """Retrieve recorded vulnerabilities from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param asset_id: If specified, returns only vulnerabilities for the asset identified by asset_id, default to
             None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param processes: The number of processes to parse the report with, see :meth:`assets_parse`.
+        :param plugins: The plugin table to normalize the vulnerabilities with, see :meth:`assets_parse`.
+        :param prefetch, max_page_size: The prefetching of the pages, see :meth:`assets_parse`.
         :raise TenableIOApiException:  When API error is encountered.
-        :return: Iterator that yields pages of :class:`Vulnerability`.
+        :return: Iterator that yields pages of :class:`Vulnerability`, or :class:`Finding` with `plugins`.
         """
-        return self.vulnerabilities_parse(date_range, asset_id, page_size)
+        return self.vulnerabilities_parse(date_range, asset_id, page_size, processes, plugins, prefetch,
+                                          max_page_size)
 
     def vulnerabilities_api(self, date_range=1, asset_id=None):
         """Retrieve recorded vulnerabilities.
@@ -139,15 +144,19 @@ class WorkbenchHelper(object):
             vulnerabilities = self._client.workbenches_api.vulnerabilities(date_range=date_range).vulnerabilities
         return vulnerabilities
 
-    def vulnerabilities_parse(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE):
+    def vulnerabilities_parse(self, date_range=1, asset_id=None, page_size=DEFAULT_PAGE_SIZE, processes=None,
+                              plugins=None, prefetch=0, max_page_size=None):
         """Retrieve recorded vulnerabilities from the workbench nessus report.
 
         :param date_range: The number of days of data prior to today to return, default to 1.
         :param asset_id: If specified, returns only vulnerabilities for the asset identified by asset_id, default to
             None.
         :param page_size: The page size of the pages returns by the iterator, default to DEFAULT_PAGE_SIZE.
+        :param processes: The number of processes to parse the report with, see :meth:`assets_parse`.
+        :param plugins: The plugin table to normalize the vulnerabilities with, see :meth:`assets_parse`.
+        :param prefetch, max_page_size: The prefetching of the pages, see :meth:`assets_parse`.
         :raise TenableIOApiException:  When API error is encountered.
-        :return: Iterator that yields pages of :class:`Vulnerability`.
+        :return: Iterator that yields pages of :class:`Vulnerability`, or :class:`Finding` with `plugins`.
         """
         file_id = self._client.workbenches_api.export_request(
             WorkbenchesApi.FORMAT_NESSUS,
@@ -164,29 +173,45 @@ class WorkbenchHelper(object):
 
         wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
 
-        iter_content = self._client.workbenches_api.export_download(file_id)
+        iter_content = self._client.workbenches_api.export_download(file_id, chunk_size=STREAM_READ_SIZE)
 
-        with tempfile.NamedTemporaryFile() as temp:
+        vulnerabilities = (_vulnerability(report_item, plugins)
+                           for report_item in self._parse(iter_content, WorkbenchParser.REPORT_ITEM, processes))
+        for page in self._pages(vulnerabilities, page_size, prefetch, max_page_size):
+            yield page
+
+    @staticmethod
+    def _pages(results, page_size, prefetch, max_page_size):
+        if not prefetch:
+            for page in _paginate(results, page_size):
+                yield page
+            return
 
+        # The page size adapts to the number of pages waiting in the queue of the prefetcher.
+        prefetcher = Prefetcher(
+            _paginate(results, page_size, max_page_size, lambda: prefetcher.backlog(), prefetch),
+            prefetch
+        )
+        try:
+            for page in prefetcher:
+                yield page
+        finally:
+            prefetcher.close()
+
+    @staticmethod
+    def _parse(iter_content, tag, processes):
+        if processes is None:
+            # The report is parsed while it is downloaded.
+            for result in WorkbenchParser.parse_stream(iter_content, tag):
+                yield result
+            return
+
+        with tempfile.NamedTemporaryFile() as temp:
             for chunk in iter_content:
                 temp.write(chunk)
-                temp.flush()
-
-            vulnerabilities = []
-            try:
-                gen = WorkbenchParser.parse(temp.name, tag=WorkbenchParser.REPORT_ITEM)
-                while True:
-                    report_item = next(gen)
-                    vulnerabilities.append(Vulnerability().from_report_item(report_item))
-                    if page_size and len(vulnerabilities) >= page_size:
-                        yield vulnerabilities
-                        vulnerabilities = []
-                pass
-            except StopIteration:
-                pass
-
-        if len(vulnerabilities) > 0:
-            yield vulnerabilities
+            temp.flush()
+            for result in WorkbenchParser.parse_parallel(temp.name, tag, processes or None):
+                yield result
 
     def export(
             self,
@@ -195,6 +220,7 @@ class WorkbenchHelper(object):
             report=WorkbenchesApi.REPORT_VULNERABILITIES,
             chapter=WorkbenchesApi.CHAPTER_VULN_BY_ASSET,
             file_open_mode='wb',
+            deadline=None,
             **kwargs
     ):
         """Download a workbench report.
@@ -203,23 +229,29 @@ class WorkbenchHelper(object):
         :param report: The type of workbench report. Default to WorkbenchesApi.REPORT_VULNERABILITIES.
         :param chapter: Chapter to include. Default to WorkbenchesApi.CHAPTER_VULN_BY_ASSET.
         :param file_open_mode: Chapter to include, WorkbenchesApi.CHAPTER_VULN_BY_ASSET.
+        :param deadline: The number of seconds or the :class:`tenable_io.util.Deadline` to give up the export after.
+            Default to None, for the current deadline if any.
         :param **kwargs: Additional keyword arguments are the same as
             :class:`tenable_io.api.workbenches.WorkbenchesApi.export_request`
+        :raise TenableIODeadlineExceededException: When the deadline expires.
         :return: The same WorkbenchHelper instance.
         """
-        file_id = self._client.workbenches_api.export_request(
-            format,
-            report,
-            chapter,
-            **kwargs
-        )
-
-        wait_until(lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
-
-        iter_content = self._client.workbenches_api.export_download(file_id)
-        with open(path, file_open_mode) as fd:
-            for chunk in iter_content:
-                fd.write(chunk)
+        with deadline_scope(deadline):
+            file_id = self._client.workbenches_api.export_request(
+                format,
+                report,
+                chapter,
+                **kwargs
+            )
+
+            wait_until(
+                lambda: self._client.workbenches_api.export_status(file_id) == WorkbenchesApi.STATUS_EXPORT_READY)
+
+            iter_content = self._client.workbenches_api.export_download(file_id)
+            with open(path, file_open_mode) as fd:
+                for chunk in iter_content:
+                    check_deadline()
+                    fd.write(chunk)
 
         return self
 
@@ -236,10 +268,15 @@ class AssetVulnerabilities(object):
         self.asset = asset
         self.vulnerabilities = vulnerabilities
 
-    def from_report(self, report):
+    def from_report(self, report, plugins=None):
+        """
+        :param report: A report parsed by :meth:`WorkbenchParser.parse`.
+        :param plugins: An instance of :class:`PluginTable` to normalize the vulnerabilities with. Default to None, for
+            :class:`Vulnerability` instances.
+        """
         self.name = report['report_host'].get('name')
         self.asset = Asset().host_properties(report['host_properties'])
-        self.vulnerabilities = [Vulnerability().from_report_item(item) for item in report['report_items']]
+        self.vulnerabilities = [_vulnerability(item, plugins) for item in report['report_items']]
         return self
 
 
@@ -403,6 +440,195 @@ class Vulnerability(object):
         return self
 
 
+class Plugin(object):
+
+    # The plugin fields of the vulnerabilities, as (attribute, report item key).
+    FIELDS = [
+        ('plugin_family', 'pluginFamily'),
+        ('plugin_name', 'pluginName'),
+        ('plugin_id', 'pluginID'),
+        ('bid', 'bid'),
+        ('canvas_package', 'canvas_package'),
+        ('cve', 'cve'),
+        ('cvss_base_score', 'cvss_base_score'),
+        ('cvss_temporal_score', 'cvss_temporal_score'),
+        ('cvss_temporal_vector', 'cvss_temporal_vector'),
+        ('cvss_vector', 'cvss_vector'),
+        ('cvss3_base_score', 'cvss3_base_score'),
+        ('cvss3_temporal_score', 'cvss3_temporal_score'),
+        ('cvss3_temporal_vector', 'cvss3_temporal_vector'),
+        ('cvss3_vector', 'cvss3_vector'),
+        ('d2_elliot_name', 'd2_elliot_name'),
+        ('description', 'description'),
+        ('exploit_available', 'exploit_available'),
+        ('exploited_by_nessus', 'exploited_by_nessus'),
+        ('exploit_framework_canvas', 'exploit_framework_canvas'),
+        ('exploit_framework_core', 'exploit_framework_core'),
+        ('exploit_framework_exploithub', 'exploit_framework_exploithub'),
+        ('exploit_framework_metasploit', 'exploit_framework_metasploit'),
+        ('exploit_framework_d2_elliot', 'exploit_framework_d2_elliot'),
+        ('exploited_by_malware', 'exploited_by_malware'),
+        ('has_patch', 'has_patch'),
+        ('in_the_news', 'in_the_news'),
+        ('malware', 'malware'),
+        ('metasploit_name', 'metasploit_name'),
+        ('patch_publication_date', 'patch_publication_date'),
+        ('plugin_modification_date', 'plugin_modification_date'),
+        ('plugin_publication_date', 'plugin_publication_date'),
+        ('plugin_type', 'plugin_type'),
+        ('plugin_version', 'plugin_version'),
+        ('risk_factor', 'risk_factor'),
+        ('solution', 'solution'),
+        ('synopsis', 'synopsis'),
+        ('unsupported_by_vendor', 'unsupported_by_vendor'),
+        ('vuln_publication_date', 'vuln_publication_date'),
+        ('xref', 'xref'),
+        ('see_also', 'see_also'),
+    ]
+    ATTRIBUTES = frozenset(attribute for attribute, _ in FIELDS)
+
+    def __init__(self, **kwargs):
+        """The fields of a plugin, shared by the :class:`Finding` instances of the plugin.
+
+        :param kwargs: The fields, by attribute name. See FIELDS.
+        """
+        for attribute, _ in Plugin.FIELDS:
+            setattr(self, attribute, kwargs.get(attribute))
+
+    def from_report_item(self, report_item):
+        for attribute, key in Plugin.FIELDS:
+            setattr(self, attribute, report_item.get(key))
+        return self
+
+
+class PluginTable(object):
+
+    def __init__(self):
+        """The plugins of the findings of a workbench report, each held once whatever its number of findings.
+        """
+        self.plugins = {}
+
+    def plugin(self, report_item):
+        """
+        :param report_item: A report item parsed by :meth:`WorkbenchParser.parse`.
+        :return: The :class:`Plugin` of the report item, created on the first report item of the plugin.
+        """
+        plugin_id = report_item.get('pluginID')
+        plugin = self.plugins.get(plugin_id)
+        if plugin is None:
+            plugin = self.plugins[plugin_id] = Plugin().from_report_item(report_item)
+        return plugin
+
+    def __len__(self):
+        return len(self.plugins)
+
+    def __getitem__(self, plugin_id):
+        return self.plugins[plugin_id]
+
+
+class Finding(object):
+    """A vulnerability instance holding its own fields only, the plugin fields are read from its shared
+        :class:`Plugin`, i.e. `finding.description` is `finding.plugin.description`. Same attributes as
+        :class:`Vulnerability`.
+    """
+
+    __slots__ = (
+        'plugin',
+        'severity',
+        'protocol',
+        'svc_name',
+        'port',
+        'plugin_output',
+        'first_found',
+        'last_found',
+        'last_fixed',
+        'vulnerability_state',
+    )
+
+    def __init__(
+            self,
+            plugin=None,
+            severity=None,
+            protocol=None,
+            svc_name=None,
+            port=None,
+            plugin_output=None,
+            first_found=None,
+            last_found=None,
+            last_fixed=None,
+            vulnerability_state=None,
+    ):
+        self.plugin = plugin
+        self.severity = severity
+        self.protocol = protocol
+        self.svc_name = svc_name
+        self.port = port
+        self.plugin_output = plugin_output
+        self.first_found = first_found
+        self.last_found = last_found
+        self.last_fixed = last_fixed
+        self.vulnerability_state = vulnerability_state
+
+    def from_report_item(self, report_item, plugins):
+        """
+        :param report_item: A report item parsed by :meth:`WorkbenchParser.parse`.
+        :param plugins: The :class:`PluginTable` holding the plugin of the finding.
+        """
+        self.plugin = plugins.plugin(report_item)
+        self.severity = report_item.get('severity')
+        self.protocol = report_item.get('protocol')
+        self.svc_name = report_item.get('svc_name')
+        self.port = report_item.get('port')
+        self.plugin_output = report_item.get('plugin_output')
+        self.first_found = report_item.get('first_found')
+        self.last_found = report_item.get('last_found')
+        self.last_fixed = report_item.get('last_fixed')
+        self.vulnerability_state = report_item.get('vulnerability_state')
+        return self
+
+    def __getattr__(self, name):
+        # Only called for the attributes that are not slots.
+        if name in Plugin.ATTRIBUTES:
+            return getattr(self.plugin, name, None)
+        raise AttributeError(name)
+
+
+def _paginate(results, page_size, max_page_size=None, backlog=None, capacity=None):
+    """
+    :param results: The iterable of the results to page.
+    :param page_size: The page size, None or 0 for one page of all the results.
+    :param max_page_size: The maximum page size, if the page size adapts to the backlog. Default to None, for pages of
+        `page_size`.
+    :param backlog: Function returning the number of pages waiting for the consumer.
+    :param capacity: The maximum number of pages waiting for the consumer.
+    :return: Iterator that yields the pages, as lists.
+    """
+    size = page_size
+    page = []
+    for result in results:
+        page.append(result)
+        if size and len(page) >= size:
+            yield page
+            page = []
+            if max_page_size and backlog is not None:
+                waiting = backlog()
+                if waiting >= capacity:
+                    # The consumer is slower than the parser, fewer larger pages cut its per page work.
+                    size = min(size * 2, max_page_size)
+                elif waiting == 0:
+                    # The consumer waits for the parser, smaller pages reach it sooner.
+                    size = max(size // 2, page_size)
+
+    if len(page) > 0:
+        yield page
+
+
+def _vulnerability(report_item, plugins):
+    if plugins is None:
+        return Vulnerability().from_report_item(report_item)
+    return Finding().from_report_item(report_item, plugins)
+
+
 class Asset(object):
 
     def __init__(
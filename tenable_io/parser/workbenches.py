@@ -1,8 +1,19 @@
+import io
+import mmap
+import re
 import xml.etree.cElementTree as ET
 
+from multiprocessing import Pool
+from xml.parsers import expat
+
+import six
+
 from tenable_io.exceptions import TenableIOException
 from tenable_io.log import logging
 
+# Matches the character ending the name of a tag.
+_NAME_END = re.compile(br'[\s/>]')
+
 
 class WorkbenchParser(object):
 
@@ -10,49 +21,188 @@ class WorkbenchParser(object):
     REPORT_HOST = 'ReportHost'
     REPORT_ITEM = 'ReportItem'
 
+    # The children of ReportItem that can be repeated, parsed as lists.
+    LIST_TAGS = ['bid', 'cve', 'xref', 'see_also']
+
+    BACKEND_EXPAT = u'expat'
+    BACKEND_ETREE = u'etree'
+    BACKENDS = [BACKEND_EXPAT, BACKEND_ETREE]
+
+    # The number of bytes fed to expat at once.
+    READ_SIZE = 64 * 1024
+
+    # The minimum number of bytes of the ranges of hosts parsed by one process in parse_parallel.
+    PARALLEL_BATCH_SIZE = 8 * 1024 * 1024
+
+    @staticmethod
+    def parse_stream(chunks, tag=REPORT_HOST, backend=BACKEND_ETREE):
+        """Parse Nessus XML export from Workbench API into dicts while it is downloaded, without writing it to a file.
+
+        :param chunks: An iterable of the XML document as bytes chunks, i.e. `WorkbenchesApi.export_download`.
+        :param tag: The XML tag to iterate on. It should be WorkbenchParser.REPORT_HOST or WorkbenchParser.REPORT_ITEM.
+        :param backend: The parser backend, see :meth:`parse`. Default to WorkbenchParser.BACKEND_ETREE.
+        """
+        return WorkbenchParser.parse(_ChunksReader(chunks), tag, backend)
+
     @staticmethod
-    def parse(path, tag=REPORT_HOST):
+    def parse(path, tag=REPORT_HOST, backend=BACKEND_ETREE):
         """Parse Nessus XML export from Workbench API into dicts.
 
+        :param path: The file path, or a file object opened in binary mode.
+        :param tag: The XML tag to iterate on. It should be WorkbenchParser.REPORT_HOST or WorkbenchParser.REPORT_ITEM.
+        :param backend: The parser backend, one of WorkbenchParser.BACKENDS. Both give the same dicts. BACKEND_ETREE
+            builds ElementTree elements in C and converts them, the fastest on CPython. BACKEND_EXPAT builds the dicts
+            from the expat callbacks without elements. See benchmarks/workbench_parser.py to compare them. Default to
+            WorkbenchParser.BACKEND_ETREE.
+        """
+        assert tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM], u'Valid tag for parsing.'
+        assert backend in WorkbenchParser.BACKENDS, u'Valid parser backend.'
+
+        if backend == WorkbenchParser.BACKEND_EXPAT:
+            return WorkbenchParser._parse_expat(path, tag)
+        return WorkbenchParser._parse_etree(path, tag)
+
+    @staticmethod
+    def parse_parallel(path, tag=REPORT_HOST, processes=None, ordered=True, backend=BACKEND_ETREE,
+                       batch_size=PARALLEL_BATCH_SIZE):
+        """Parse Nessus XML export from Workbench API into dicts with a pool of processes. The memory-mapped file is
+            scanned for the offsets of the ReportHost elements, and the ranges of hosts are parsed in parallel.
+
+        The ReportHost and Report tags must not appear in comments or CDATA sections, which the Workbench API does not
+            return. Every range is parsed within copies of the start tags of the root and Report elements, so the
+            namespaces they declare apply. A host without HostProperties gets the ones of the previous host only within
+            a range, unlike with :meth:`parse`.
+
         :param path: The file path.
         :param tag: The XML tag to iterate on. It should be WorkbenchParser.REPORT_HOST or WorkbenchParser.REPORT_ITEM.
+        :param processes: The number of processes. Default to None, for the number of CPUs.
+        :param ordered: If True, yield the results in the file order, otherwise as soon as their range is parsed.
+            Default to True.
+        :param backend: The parser backend, see :meth:`parse`. Default to WorkbenchParser.BACKEND_ETREE.
+        :param batch_size: The minimum number of bytes of a range of hosts parsed by one task. Default to 8MB.
         """
         assert tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM], u'Valid tag for parsing.'
+        assert backend in WorkbenchParser.BACKENDS, u'Valid parser backend.'
+
+        head, tail, ranges = WorkbenchParser._host_ranges(path, batch_size)
+        if not ranges:
+            # Nothing to split, i.e. an empty report or malformed XML, parsed as is for the same results.
+            for result in WorkbenchParser.parse(path, tag, backend):
+                yield result
+            return
+
+        pool = Pool(processes)
+        try:
+            tasks = [(path, start, end, head, tail, tag, backend) for start, end in ranges]
+            imap = pool.imap if ordered else pool.imap_unordered
+            for results in imap(_parse_range, tasks):
+                for result in results:
+                    yield result
+        finally:
+            # Also stops the pending tasks when the iteration is not completed.
+            pool.terminate()
+            pool.join()
+
+    @staticmethod
+    def _host_ranges(path, batch_size):
+        """
+        :return: The start and the end of the document wrapping the ReportHost elements, and the (start, end) offsets
+            of the ranges of ReportHost elements, every range holding complete elements only.
+        """
+        with open(path, 'rb') as fd:
+            fd.seek(0, io.SEEK_END)
+            if fd.tell() == 0:
+                return b'', b'', []
+            data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            end = data.rfind(b'</ReportHost>')
+            first = _find_tag(data, b'ReportHost', 0, end) if end >= 0 else -1
+            if first < 0:
+                return b'', b'', []
+            end += len(b'</ReportHost>')
+
+            ranges = []
+            start = position = first
+            while position >= 0:
+                if position - start >= batch_size:
+                    ranges.append((start, position))
+                    start = position
+                position = _find_tag(data, b'ReportHost', position + 11, end)
+            ranges.append((start, end))
+
+            # The hosts are wrapped in copies of the start tags of the root and the Report elements, which hold the
+            # namespace declarations, after the XML declaration for the same encoding.
+            prolog = data[:data.find(b'?>') + 2] if data[:5] == b'<?xml' else b''
+            root = _skip_markup(data, len(prolog))
+            report = _find_tag(data, b'Report', root, first)
+            if report < 0:
+                return b'', b'', []
+            root_name = data[root + 1:root + 1 + _NAME_END.search(data[root + 1:report]).start()]
+            head = prolog + data[root:_tag_end(data, root)] + data[report:_tag_end(data, report)]
+            return head, b'</Report></' + root_name + b'>', ranges
+        finally:
+            data.close()
+
+    @staticmethod
+    def _parse_expat(path, tag):
+        # Namespaced names are reported as `uri}local`, rewritten as ElementTree does to `{uri}local`.
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+        handler = _ExpatHandler(parser, tag)
 
+        fd = open(path, 'rb') if isinstance(path, six.string_types) else path
+        try:
+            while True:
+                data = fd.read(WorkbenchParser.READ_SIZE)
+                try:
+                    parser.Parse(data, not data)
+                except expat.ExpatError as e:
+                    # The results parsed before the error are yielded, as with ElementTree.
+                    for result in handler.pop():
+                        yield result
+                    logging.warn(u'Failed to parse Nessus XML: %s' % e)
+                    return
+                for result in handler.pop():
+                    yield result
+                if not data:
+                    return
+        finally:
+            if fd is not path:
+                fd.close()
+
+    @staticmethod
+    def _parse_etree(path, tag):
         report_host = None
         host_properties = None
         report_items = [] if tag == WorkbenchParser.REPORT_HOST else None
 
         try:
-            for event, elem in ET.iterparse(path, events=('start', 'end')):
-
-                if event == 'start':
-                    if elem.tag == 'ReportHost':
-                        report_host = WorkbenchParser._from_report_host(elem)
-
-                if event == 'end':
-
-                    if elem.tag == WorkbenchParser.REPORT_HOST:
-                        elem.clear()
-                        if tag == elem.tag:
-                            yield {
-                                'report_host': report_host,
-                                'host_properties': host_properties,
-                                'report_items': report_items,
-                            }
-                            report_items = []
-
-                    if elem.tag == WorkbenchParser.HOST_PROPERTIES:
-                        host_properties = WorkbenchParser._from_host_properties(elem)
-                        elem.clear()
-
-                    if elem.tag == WorkbenchParser.REPORT_ITEM:
-                        report_item = WorkbenchParser._from_report_item(elem)
-                        elem.clear()
-                        if tag == elem.tag:
-                            yield report_item
-                        elif tag == WorkbenchParser.REPORT_HOST:
-                            report_items.append(report_item)
+            # Only end events: the attributes of a ReportHost are still there until it is cleared.
+            for _, elem in ET.iterparse(path):
+                elem_tag = elem.tag
+
+                if elem_tag == WorkbenchParser.REPORT_ITEM:
+                    report_item = WorkbenchParser._from_report_item(elem)
+                    elem.clear()
+                    if tag == elem_tag:
+                        yield report_item
+                    else:
+                        report_items.append(report_item)
+
+                elif elem_tag == WorkbenchParser.HOST_PROPERTIES:
+                    host_properties = WorkbenchParser._from_host_properties(elem)
+                    elem.clear()
+
+                elif elem_tag == WorkbenchParser.REPORT_HOST:
+                    report_host = WorkbenchParser._from_report_host(elem)
+                    elem.clear()
+                    if tag == elem_tag:
+                        yield {
+                            'report_host': report_host,
+                            'host_properties': host_properties,
+                            'report_items': report_items,
+                        }
+                        report_items = []
         except ET.ParseError as e:
             logging.warn(u'Failed to parse Nessus XML: ' + e.msg)
             # TODO The service return malformed XML for empty set, for now we won't raise an exception for what should
@@ -76,14 +226,217 @@ class WorkbenchParser(object):
 
     @staticmethod
     def _from_report_item(elem):
-        d = dict()
-        for a in elem.attrib:
-            d[a] = elem.attrib[a]
-        for child in list(elem):
-            if child.tag in ['bid', 'cve', 'xref', 'see_also']:
-                if child.tag not in d:
-                    d[child.tag] = []
-                d[child.tag].append(child.text)
+        d = dict(elem.attrib)
+        for child in elem:
+            child_tag = child.tag
+            if child_tag in WorkbenchParser.LIST_TAGS:
+                if child_tag not in d:
+                    d[child_tag] = []
+                d[child_tag].append(child.text)
             else:
-                d[child.tag] = child.text
+                d[child_tag] = child.text
         return d
+
+
+def _parse_range(task):
+    """Parse a range of ReportHost elements of a file, in a process of :meth:`WorkbenchParser.parse_parallel`.
+
+    :param task: The (path, start, end, head, tail, tag, backend) of the range.
+    :return: The list of results.
+    """
+    path, start, end, head, tail, tag, backend = task
+    with open(path, 'rb') as fd:
+        fd.seek(start)
+        hosts = fd.read(end - start)
+    return list(WorkbenchParser.parse(io.BytesIO(head + hosts + tail), tag, backend))
+
+
+def _find_tag(data, name, start, end):
+    """
+    :return: The offset of the first start tag of an element named `name` in data[start:end], -1 if none.
+    """
+    tag = b'<' + name
+    position = data.find(tag, start, end)
+    # Skip the tags whose name only starts with the name, i.e. ReportHostList.
+    while position >= 0 and _NAME_END.match(data[position + len(tag):position + len(tag) + 1]) is None:
+        position = data.find(tag, position + len(tag), end)
+    return position
+
+
+def _skip_markup(data, position):
+    """
+    :return: The offset of the first element tag from `position`, skipping comments, processing instructions and
+        document type declarations.
+    """
+    while True:
+        position = data.find(b'<', position)
+        if data[position + 1:position + 4] == b'!--':
+            position = data.find(b'-->', position) + 3
+        elif data[position + 1:position + 2] in [b'?', b'!']:
+            position = data.find(b'>', position) + 1
+        else:
+            return position
+
+
+def _tag_end(data, position):
+    """
+    :return: The offset after the end of the tag at `position`, the attribute values may contain '>'.
+    """
+    quote = None
+    while True:
+        position += 1
+        char = data[position:position + 1]
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in [b'"', b"'"]:
+            quote = char
+        elif char == b'>':
+            return position + 1
+        elif not char:
+            return position
+
+
+class _ExpatHandler(object):
+
+    def __init__(self, parser, tag):
+        """Builds the dicts of :meth:`WorkbenchParser.parse` from the expat callbacks, with the same values as the
+            ElementTree backend: the text of a child is the text before its own first child, None if empty.
+
+        To keep the Python work per element minimal, the handlers are swapped while in a ReportItem or HostProperties
+            element, and the text is appended by `list.append` directly, only for the children the text is kept of.
+        """
+        self._parser = parser
+        self._tag = tag
+        self._results = []
+        self._report_host = None
+        self._host_properties = None
+        self._report_items = [] if tag == WorkbenchParser.REPORT_HOST else None
+        # The dict being built, of the current ReportItem or HostProperties, and the depth in it.
+        self._item = None
+        self._properties = None
+        self._depth = 0
+        # The text and the name attribute of the current child.
+        self._text = None
+        self._name = None
+        self._set_handlers(self._start, self._end)
+
+    def pop(self):
+        """
+        :return: The results parsed since the previous call.
+        """
+        results = self._results
+        self._results = []
+        return results
+
+    def _set_handlers(self, start, end):
+        parser = self._parser
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = None
+
+    def _start(self, name, attrs):
+        if name == WorkbenchParser.REPORT_ITEM:
+            self._item = _qualify_attrs(attrs)
+        elif name == WorkbenchParser.HOST_PROPERTIES:
+            self._properties = {}
+        elif name == WorkbenchParser.REPORT_HOST:
+            self._report_host = _qualify_attrs(attrs)
+            return
+        else:
+            return
+        self._depth = 0
+        self._set_handlers(self._child_start, self._child_end)
+
+    def _end(self, name):
+        if name == WorkbenchParser.REPORT_HOST and self._tag == WorkbenchParser.REPORT_HOST:
+            self._results.append({
+                'report_host': self._report_host,
+                'host_properties': self._host_properties,
+                'report_items': self._report_items,
+            })
+            self._report_items = []
+
+    def _child_start(self, name, attrs):
+        self._depth += 1
+        if self._depth == 1:
+            if self._properties is not None:
+                self._name = attrs.get('name')
+            self._text = []
+            self._parser.CharacterDataHandler = self._text.append
+        else:
+            # The text of a child stops at its first child.
+            self._parser.CharacterDataHandler = None
+
+    def _child_end(self, name):
+        depth = self._depth
+        self._depth = depth - 1
+        if depth == 1:
+            self._parser.CharacterDataHandler = None
+            text = u''.join(self._text) or None
+            item = self._item
+            if item is not None:
+                if u'}' in name:
+                    name = u'{' + name
+                if name in WorkbenchParser.LIST_TAGS:
+                    if name not in item:
+                        item[name] = []
+                    item[name].append(text)
+                else:
+                    item[name] = text
+            elif name == 'tag':
+                if self._name in ['mac-address']:
+                    self._properties[self._name] = text.split() if isinstance(text, six.string_types) else text
+                else:
+                    self._properties[self._name] = text
+        elif depth == 0:
+            if self._item is not None:
+                if self._tag == WorkbenchParser.REPORT_ITEM:
+                    self._results.append(self._item)
+                else:
+                    self._report_items.append(self._item)
+                self._item = None
+            else:
+                self._host_properties = self._properties
+                self._properties = None
+            self._set_handlers(self._start, self._end)
+
+
+def _qualify_attrs(attrs):
+    """
+    :return: The attributes of an expat element, the namespaced ones named `{uri}local` as with ElementTree.
+    """
+    for name in attrs:
+        if u'}' in name:
+            return dict((u'{' + name if u'}' in name else name, value) for name, value in attrs.items())
+    return attrs
+
+
+class _ChunksReader(object):
+
+    def __init__(self, chunks):
+        """File object reading from an iterable of bytes chunks, for the parsers that pull from a file.
+        """
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._position = 0
+
+    def read(self, size=-1):
+        """
+        :param size: The maximum number of bytes to read, a negative number to read everything.
+        :return: The bytes, possibly less than `size` but only empty at the end of the chunks.
+        """
+        if size is None or size < 0:
+            data = self._chunk[self._position:] + b''.join(self._chunks)
+            self._chunk, self._position = b'', 0
+            return data
+
+        while self._position >= len(self._chunk):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b''
+            self._chunk, self._position = chunk, 0
+
+        data = self._chunk[self._position:self._position + size]
+        self._position += len(data)
+        return data
@@ -0,0 +1,125 @@
+import six
+import threading
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+# Values of X-RateLimit-Reset above this are an absolute Unix time rather than a number of seconds.
+_EPOCH_THRESHOLD = 10 ** 9
+
+
+class RateLimiter(object):
+
+    _TOKENS = 0
+    _LAST = 1
+    _BLOCKED_UNTIL = 2
+
+    def __init__(self, rate, burst=None, shared=False):
+        """Token bucket limiting the rate of requests. A single instance can be shared by multiple clients and threads.
+            The bucket is also paused when the server asks to back off, through the `Retry-After` header on 429
+            responses, or when the `X-RateLimit-Remaining` header reaches 0.
+
+        :param rate: The sustained number of requests per second.
+        :param burst: The maximum number of requests sent at once after being idle. Default to `rate`, but at least 1.
+        :param shared: If True, the bucket is kept in shared memory so that it is also shared with processes forked
+            after its creation, i.e. by `multiprocessing`. Default to False.
+        """
+        assert rate > 0, u'Rate is positive.'
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        if shared:
+            # Imported only here, as multiprocessing is slow to import and rarely needed.
+            import multiprocessing
+            self._state = multiprocessing.RawArray('d', 3)
+            self._lock = multiprocessing.Lock()
+        else:
+            self._state = [0.0] * 3
+            self._lock = threading.Lock()
+        self._state[RateLimiter._TOKENS] = self.burst
+        self._state[RateLimiter._LAST] = time.time()
+
+    def acquire(self):
+        """Block until a request can be sent.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                blocked_until = self._state[RateLimiter._BLOCKED_UNTIL]
+                if now < blocked_until:
+                    wait = blocked_until - now
+                else:
+                    tokens = min(self.burst,
+                                 self._state[RateLimiter._TOKENS] + (now - self._state[RateLimiter._LAST]) * self.rate)
+                    self._state[RateLimiter._LAST] = now
+                    if tokens >= 1:
+                        self._state[RateLimiter._TOKENS] = tokens - 1
+                        return
+                    self._state[RateLimiter._TOKENS] = tokens
+                    wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold all requests for a number of seconds.
+
+        :param seconds: The number of seconds to wait before sending the next request.
+        """
+        with self._lock:
+            now = time.time()
+            self._state[RateLimiter._BLOCKED_UNTIL] = max(self._state[RateLimiter._BLOCKED_UNTIL], now + seconds)
+            # Do not let the next requests burst right after the pause.
+            self._state[RateLimiter._TOKENS] = min(self._state[RateLimiter._TOKENS], 1.0)
+
+    def update(self, response):
+        """Adapt to the rate limit headers of a response.
+
+        :param response: The response of a request sent after :meth:`acquire`.
+        """
+        delay = retry_after(response)
+        if delay is None:
+            delay = rate_limit_reset(response)
+        if delay:
+            self.pause(delay)
+
+
+def retry_after(response):
+    """
+    :param response: The response to read the `Retry-After` header from.
+    :return: The number of seconds to wait as requested by the server, None if not specified.
+    """
+    value = _header(response, u'Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, six.string_types):
+        date = parsedate_tz(value)
+        if date is not None:
+            return max(mktime_tz(date) - time.time(), 0.0)
+    return None
+
+
+def rate_limit_reset(response):
+    """
+    :param response: The response to read the `X-RateLimit-*` headers from.
+    :return: The number of seconds until the rate limit resets if no request remains, None otherwise.
+    """
+    try:
+        remaining = _header(response, u'X-RateLimit-Remaining')
+        if remaining is None or int(remaining) > 0:
+            return None
+        reset = float(_header(response, u'X-RateLimit-Reset'))
+    except (TypeError, ValueError):
+        return None
+    return max(reset - time.time(), 0.0) if reset > _EPOCH_THRESHOLD else reset
+
+
+def _header(response, name):
+    headers = getattr(response, u'headers', None)
+    return headers.get(name) if isinstance(headers, Mapping) else None
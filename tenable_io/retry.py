@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+
+from tenable_io.rate_limit import retry_after
+
+
+class RetryPolicy(object):
+
+    IDEMPOTENT_METHODS = {u'GET', u'PUT', u'DELETE', u'HEAD', u'OPTIONS'}
+    # The server did not process the request, so it is safe to retry whatever the method.
+    ALWAYS_RETRYABLE_STATUS_CODES = {429}
+
+    def __init__(self, max_retries=5, max_elapsed=None, retry_non_idempotent=True, budget=None):
+        """Decides whether and when :class:`tenable_io.client.TenableIOClient` retries a request that failed with a
+            retryable status code. Subclasses implement the backoff.
+
+        :param max_retries: The maximum number of retries of a request. Default to 5.
+        :param max_elapsed: The maximum number of seconds from the first attempt after which a request is not retried.
+            Default to None, for no limit.
+        :param retry_non_idempotent: If False, non-idempotent requests, i.e. POST, are only retried on 429 responses.
+            Default to True.
+        :param budget: An instance of :class:`RetryBudget` limiting the retries of all requests together. Default to
+            None, for no budget.
+        """
+        self.max_retries = max_retries
+        self.max_elapsed = max_elapsed
+        self.retry_non_idempotent = retry_non_idempotent
+        self.budget = budget
+
+    def backoff(self, attempt):
+        """
+        :param attempt: The retry attempt, starting at 1.
+        :return: The number of seconds to wait before the retry.
+        """
+        raise NotImplementedError()
+
+    def on_request(self):
+        """Called once per request, before the first attempt.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def next_delay(self, attempt, method, response, elapsed):
+        """
+        :param attempt: The retry attempt, starting at 1.
+        :param method: The HTTP method of the request, None if unknown.
+        :param response: The retryable response.
+        :param elapsed: The number of seconds since the first attempt.
+        :return: The number of seconds to wait before retrying, None if the request should not be retried.
+        """
+        if attempt > self.max_retries:
+            return None
+
+        status_code = getattr(response, u'status_code', None)
+        if not self.retry_non_idempotent and method is not None and method not in self.IDEMPOTENT_METHODS \
+                and status_code not in self.ALWAYS_RETRYABLE_STATUS_CODES:
+            return None
+
+        # Wait as long as the server asks to, i.e. on 429 responses.
+        delay = retry_after(response)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        return delay
+
+
+class LinearBackoffRetryPolicy(RetryPolicy):
+
+    def __init__(self, max_retries=5, sleep_milliseconds=500, **kwargs):
+        """Waits an increasing amount of time between retries: `sleep_milliseconds`, then 3 times that, 6 times, etc.
+
+        :param max_retries: The maximum number of retries of a request. Default to 5.
+        :param sleep_milliseconds: The wait before the first retry. Default to 500.
+        :param kwargs: Keyword arguments of :class:`RetryPolicy`.
+        """
+        super(LinearBackoffRetryPolicy, self).__init__(max_retries, **kwargs)
+        self.sleep_milliseconds = sleep_milliseconds
+
+    def backoff(self, attempt):
+        return self.sleep_milliseconds * attempt * (attempt + 1) / 2 / 1000.0
+
+
+class ExponentialBackoffRetryPolicy(RetryPolicy):
+
+    def __init__(self, max_retries=5, base=0.5, cap=30, max_elapsed=None, retry_non_idempotent=False, budget=None):
+        """Exponential backoff with full jitter: waits a random time between 0 and `base * 2 ^ (attempt - 1)` seconds,
+            capped at `cap`, so that concurrent clients do not retry in lockstep.
+
+        :param max_retries: The maximum number of retries of a request. Default to 5.
+        :param base: The upper bound of the wait before the first retry, in seconds. Default to 0.5.
+        :param cap: The maximum upper bound of the wait, in seconds. Default to 30.
+        :param max_elapsed: See :class:`RetryPolicy`.
+        :param retry_non_idempotent: See :class:`RetryPolicy`. Default to False.
+        :param budget: See :class:`RetryPolicy`.
+        """
+        super(ExponentialBackoffRetryPolicy, self).__init__(max_retries, max_elapsed, retry_non_idempotent, budget)
+        self.base = base
+        self.cap = cap
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+
+class RetryBudget(object):
+
+    def __init__(self, ratio=0.1, min_per_second=1.0, max_tokens=100):
+        """Limits the retries to a ratio of the requests, so that retries do not pile up when the service is down. Safe
+            to share among threads.
+
+        :param ratio: The number of retries allowed per request. Default to 0.1.
+        :param min_per_second: The number of retries allowed per second regardless of the number of requests, so that
+            a low traffic can still retry. Default to 1.
+        :param max_tokens: The maximum number of retries that can be saved up. Default to 100.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        :return: True if a retry is allowed.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _refill(self):
+        now = time.time()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._last) * self.min_per_second)
+        self._last = now
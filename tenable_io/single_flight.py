@@ -0,0 +1,69 @@
+import sys
+import threading
+
+import six
+
+from tenable_io.util import current_deadline
+
+
+class SingleFlight(object):
+
+    def __init__(self):
+        """Collapses concurrent identical calls into one: while a call is in flight, the calls with the same key wait
+            for it and share its result or exception instead of being made. Safe to share among threads and clients.
+        """
+        self._calls = {}
+        self._stats = {u'calls': 0, u'shared': 0}
+        self._lock = threading.Lock()
+
+    def do(self, key, f):
+        """Call `f`, unless a call with the same key is in flight, in which case wait for its result.
+
+        :param key: A hashable identifying the call.
+        :param f: The function to call without arguments.
+        :raise TenableIODeadlineExceededException: When the current deadline expires while waiting.
+        :return: The return value of `f`, possibly returned to other callers as well.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats[u'calls'] += 1
+            else:
+                self._stats[u'shared'] += 1
+
+        if leader:
+            try:
+                call.result = f()
+            except BaseException:
+                call.error = sys.exc_info()
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            deadline = current_deadline()
+            while not call.done.wait(deadline.remaining() if deadline is not None else None):
+                deadline.check()
+
+        if call.error is not None:
+            six.reraise(*call.error)
+        return call.result
+
+    def stats(self):
+        """
+        :return: The statistics, as a dict of:
+            `calls`: The number of calls made.
+            `shared`: The number of calls that waited for an identical call in flight instead of being made.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
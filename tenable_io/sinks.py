@@ -0,0 +1,259 @@
+import os
+
+from collections import OrderedDict
+
+import six
+
+from tenable_io.api.models import AssetsExport, VulnsExport
+from tenable_io.codec import dumps
+from tenable_io.columnar import TYPE_BOOL, TYPE_FLOAT, TYPE_INT, TYPE_STRING, field
+from tenable_io.exceptions import TenableIOException
+from tenable_io.helpers.sync import as_dict
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+FORMAT_PARQUET = u'parquet'
+FORMAT_ARROW = u'arrow'
+
+# Column types of the sinks besides the ones of tenable_io.columnar.
+TYPE_STRING_LIST = u'string_list'
+TYPE_JSON = u'json'
+
+# The types of the fields of the export models that are not strings, by column name.
+VULNS_TYPES = {
+    u'asset_tracked': TYPE_BOOL,
+    u'plugin_family_id': TYPE_INT,
+    u'plugin_has_patch': TYPE_BOOL,
+    u'plugin_id': TYPE_INT,
+    u'port_port': TYPE_INT,
+    u'severity_id': TYPE_INT,
+    u'severity_default_id': TYPE_INT,
+}
+ASSETS_TYPES = dict(
+    [(name, TYPE_BOOL) for name in [u'has_agent', u'has_plugin_results']] +
+    [(name, TYPE_STRING_LIST) for name in [
+        u'agent_names', u'ipv4s', u'ipv6s', u'fqdns', u'mac_addresses', u'netbios_names', u'operating_systems',
+        u'system_types', u'hostnames', u'ssh_fingerprints', u'qualys_asset_ids', u'qualys_host_ids',
+        u'manufacturer_tpm_ids', u'symantec_ep_hardware_keys']] +
+    [(name, TYPE_JSON) for name in [u'sources', u'tags', u'network_interfaces']]
+)
+
+
+def model_columns(model_class, types=None):
+    """Derive the columns of the records of a model, the fields of nested models being flattened as
+        `<field>_<nested field>`.
+
+    :param model_class: A subclass of :class:`tenable_io.api.models.BaseModel`, i.e. VulnsExport.
+    :param types: The types of the columns by name. Default to None, for strings. Lists of nested models are JSON.
+    :return: The columns, as a list of (name, path, type), see :class:`tenable_io.columnar.ColumnarBatch`.
+    """
+    types = types or {}
+    columns = []
+    for name in vars(model_class()):
+        field = name.lstrip(u'_')
+        setter = getattr(getattr(model_class, field, None), u'fset', None)
+        nested_class = getattr(setter, u'model_class', None)
+        if nested_class is not None:
+            for nested_name, path, _ in model_columns(nested_class):
+                column = u'%s_%s' % (field, nested_name)
+                columns.append((column, (field,) + path, types.get(column, TYPE_STRING)))
+        elif getattr(setter, u'model_list_class', None) is not None:
+            columns.append((field, (field,), types.get(field, TYPE_JSON)))
+        else:
+            columns.append((field, (field,), types.get(field, TYPE_STRING)))
+    return columns
+
+
+# The fields of the exported vulns that VulnsExport does not declare, as columns.
+VULNS_EXTRA_COLUMNS = [
+    (u'plugin_%s' % name, (u'plugin',) + path, type_) for name, path, type_ in [
+        (u'cve', (u'cve',), TYPE_STRING_LIST),
+        (u'cpe', (u'cpe',), TYPE_STRING_LIST),
+        (u'bid', (u'bid',), TYPE_STRING_LIST),
+        (u'see_also', (u'see_also',), TYPE_STRING_LIST),
+        (u'xrefs', (u'xrefs',), TYPE_JSON),
+        (u'cvss_base_score', (u'cvss_base_score',), TYPE_FLOAT),
+        (u'cvss_temporal_score', (u'cvss_temporal_score',), TYPE_FLOAT),
+        (u'cvss_vector', (u'cvss_vector', u'raw'), TYPE_STRING),
+        (u'cvss3_base_score', (u'cvss3_base_score',), TYPE_FLOAT),
+        (u'cvss3_temporal_score', (u'cvss3_temporal_score',), TYPE_FLOAT),
+        (u'cvss3_vector', (u'cvss3_vector', u'raw'), TYPE_STRING),
+        (u'vpr_score', (u'vpr', u'score'), TYPE_FLOAT),
+        (u'vpr_drivers', (u'vpr', u'drivers'), TYPE_JSON),
+        (u'vpr_updated', (u'vpr', u'updated'), TYPE_STRING),
+        (u'exploit_available', (u'exploit_available',), TYPE_BOOL),
+        (u'exploitability_ease', (u'exploitability_ease',), TYPE_STRING),
+        (u'exploited_by_malware', (u'exploited_by_malware',), TYPE_BOOL),
+        (u'in_the_news', (u'in_the_news',), TYPE_BOOL),
+        (u'unsupported_by_vendor', (u'unsupported_by_vendor',), TYPE_BOOL),
+        (u'stig_severity', (u'stig_severity',), TYPE_STRING),
+        (u'patch_publication_date', (u'patch_publication_date',), TYPE_STRING),
+        (u'vuln_publication_date', (u'vuln_publication_date',), TYPE_STRING),
+    ]
+] + [
+    (u'last_fixed', (u'last_fixed',), TYPE_STRING),
+]
+
+VULNS_SCHEMA = model_columns(VulnsExport, VULNS_TYPES) + VULNS_EXTRA_COLUMNS
+ASSETS_SCHEMA = model_columns(AssetsExport, ASSETS_TYPES)
+
+
+class ColumnarFileSink(object):
+
+    def __init__(self, path, columns, format=FORMAT_PARQUET, row_group_size=100000, partition_by=None,
+                 compression=u'snappy', max_open_files=16):
+        """Writes records to Parquet or Arrow IPC files, buffering them by row group. Requires pyarrow. Use it as a
+            context manager, or call :meth:`close` to write the last row groups.
+
+        At most `max_open_files` partitions have an open file and a buffer, so at most `max_open_files` times
+            `row_group_size` records are held in memory whatever the number of partitions. When a record of another
+            partition comes, the least recently written partition is flushed and its file closed, and a new file is
+            started if more of its records come later.
+
+        :param path: The directory to write the files to, created if missing.
+        :param columns: The columns, as a list of (name, path, type), i.e. VULNS_SCHEMA or ASSETS_SCHEMA. The types are
+            the ones of :mod:`tenable_io.columnar`, TYPE_STRING_LIST or TYPE_JSON for values encoded as JSON strings.
+        :param format: FORMAT_PARQUET or FORMAT_ARROW. Default to FORMAT_PARQUET.
+        :param row_group_size: The number of records per row group, or record batch for Arrow. Default to 100000.
+        :param partition_by: The name of a column to partition the files by, written in one directory per value named
+            `<column>=<value>`. Default to None, for no partitioning.
+        :param compression: The Parquet compression codec. Default to "snappy".
+        :param max_open_files: The maximum number of partitions written at once. Default to 16.
+        :raise TenableIOException: When pyarrow is not installed.
+        """
+        if pyarrow is None:
+            raise TenableIOException(u'Writing Parquet or Arrow files requires pyarrow.')
+        assert format in [FORMAT_PARQUET, FORMAT_ARROW], u'Invalid format %s.' % format
+        assert partition_by is None or partition_by in [column[0] for column in columns], \
+            u'Partition column %s is not a column.' % partition_by
+        assert max_open_files > 0, u'At least one file is open.'
+
+        self.path = path
+        self.columns = [(name, tuple(field_path), type_) for name, field_path, type_ in columns]
+        self.format = format
+        self.row_group_size = row_group_size
+        self.partition_by = partition_by
+        self.compression = compression
+        self.max_open_files = max_open_files
+        self.files = []
+        self.rows = 0
+        self.schema = pyarrow.schema([pyarrow.field(name, _arrow_type(type_)) for name, _, type_ in self.columns])
+        # The open partitions, the least recently written first.
+        self._partitions = OrderedDict()
+        self._partition_index = [column[0] for column in self.columns].index(partition_by) \
+            if partition_by is not None else None
+
+    def write(self, record):
+        """
+        :param record: A record, as a decoded JSON object or a model.
+        """
+        row = [_convert(field(record, field_path), type_) for _, field_path, type_ in self.columns]
+        key = row[self._partition_index] if self._partition_index is not None else None
+        partition = self._partitions.pop(key, None)
+        if partition is None:
+            if len(self._partitions) >= self.max_open_files:
+                self._partitions.popitem(last=False)[1].close()
+            partition = _Partition(self, key)
+        self._partitions[key] = partition
+        partition.append(row)
+        self.rows += 1
+
+    def write_all(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Write the buffered records and close the files.
+        """
+        for partition in self._partitions.values():
+            partition.close()
+        self._partitions = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class _Partition(object):
+
+    def __init__(self, sink, key):
+        self._sink = sink
+        self._key = key
+        self._buffer = [[] for _ in sink.columns]
+        self._writer = None
+
+    def append(self, row):
+        for values, value in zip(self._buffer, row):
+            values.append(value)
+        if len(self._buffer[0]) >= self._sink.row_group_size:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _flush(self):
+        if not self._buffer[0]:
+            return
+        sink = self._sink
+        table = pyarrow.Table.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(self._buffer, sink.schema)],
+            schema=sink.schema
+        )
+        self._buffer = [[] for _ in sink.columns]
+
+        if self._writer is None:
+            directory = sink.path
+            if sink.partition_by is not None:
+                directory = os.path.join(directory, u'%s=%s' % (sink.partition_by, self._key))
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            path = os.path.join(directory, u'part-%05d.%s' % (len(sink.files), sink.format))
+            if sink.format == FORMAT_PARQUET:
+                self._writer = pyarrow.parquet.ParquetWriter(path, sink.schema, compression=sink.compression)
+            else:
+                self._writer = pyarrow.ipc.new_file(path, sink.schema)
+            sink.files.append(path)
+
+        if sink.format == FORMAT_PARQUET:
+            self._writer.write_table(table, row_group_size=sink.row_group_size)
+        else:
+            self._writer.write_table(table, max_chunksize=sink.row_group_size)
+
+
+def _convert(value, type_):
+    if value is None:
+        return None
+    if type_ == TYPE_STRING:
+        return value if isinstance(value, six.text_type) else six.text_type(value)
+    if type_ == TYPE_INT:
+        return int(value)
+    if type_ == TYPE_FLOAT:
+        return float(value)
+    if type_ == TYPE_BOOL:
+        return bool(value)
+    if type_ == TYPE_STRING_LIST:
+        return [six.text_type(item) for item in value] if isinstance(value, list) else [six.text_type(value)]
+    if type_ == TYPE_JSON:
+        return dumps(as_dict(value))
+    raise TenableIOException(u'Invalid column type %s.' % type_)
+
+
+def _arrow_type(type_):
+    return {
+        TYPE_INT: pyarrow.int64(),
+        TYPE_FLOAT: pyarrow.float64(),
+        TYPE_BOOL: pyarrow.bool_(),
+        TYPE_STRING: pyarrow.string(),
+        TYPE_STRING_LIST: pyarrow.list_(pyarrow.string()),
+        TYPE_JSON: pyarrow.string(),
+    }[type_]
@@ -1,14 +1,21 @@
 import re
 import six
 import socket
+import sys
+import threading
 import time
 
+from contextlib import contextmanager
+
 from tenable_io.config import TenableIOConfig
+from tenable_io.exceptions import TenableIODeadlineExceededException
 
 POLLING_INTERVAL = int(TenableIOConfig.get('polling_interval'))
 MAX_POLLING_INTERVAL = int(TenableIOConfig.get('max_polling_interval'))
 RE_MAC = re.compile('[0-9a-f]{2}([-:])[0-9a-f]{2}(\\1[0-9a-f]{2}){4}$')
 
+_local = threading.local()
+
 
 def is_ipv4(value):
     """Utility function to detect if a value is a valid IPv4
@@ -47,21 +54,208 @@ def payload_filter(payload, filter_):
     return payload
 
 
-def wait_until(condition, context=None):
+def wait_until(condition, context=None, deadline=None):
     """Utility function to wait for a condition to become True.
 
         :param condition: The condition function that should evaluate to True if and only if the condition is met.
         :param context: If it is not None, it is passed to every call to the condition function.
+        :param deadline: The number of seconds or the :class:`Deadline` to give up waiting after. Default to None, for
+            the current deadline if any.
+        :raise TenableIODeadlineExceededException: When the deadline expires before the condition is met.
         :return: True when the condition function evaluates to True.
     """
-    interval = POLLING_INTERVAL
-    count = 0
-    while True:
-        count += 1
-
-        if context is not None and condition(context):
-            return True
-        elif context is None and condition():
-            return True
-        time.sleep(interval if interval < MAX_POLLING_INTERVAL else MAX_POLLING_INTERVAL)
-        interval += count * 10
+    with deadline_scope(deadline):
+        interval = POLLING_INTERVAL
+        count = 0
+        while True:
+            count += 1
+
+            if context is not None and condition(context):
+                return True
+            elif context is None and condition():
+                return True
+            sleep(interval if interval < MAX_POLLING_INTERVAL else MAX_POLLING_INTERVAL)
+            interval += count * 10
+
+
+def sleep(seconds):
+    """Utility function to sleep without outliving the current deadline.
+
+        :param seconds: The number of seconds to sleep, cut short when the current deadline expires first.
+        :raise TenableIODeadlineExceededException: When the current deadline has already expired.
+    """
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check()
+        seconds = min(seconds, deadline.remaining())
+    time.sleep(seconds)
+
+
+class Deadline(object):
+
+    def __init__(self, seconds):
+        """Point in time after which an operation is abandoned, shared by all the requests, polls and downloads the
+            operation is made of.
+
+        :param seconds: The number of seconds from now the deadline expires in.
+        """
+        self.seconds = seconds
+        self.expires_at = time.time() + seconds
+
+    @staticmethod
+    def of(value):
+        """
+        :param value: A number of seconds, a :class:`Deadline` or None.
+        :return: An instance of :class:`Deadline`, None if value is None.
+        """
+        if value is None or isinstance(value, Deadline):
+            return value
+        return Deadline(value)
+
+    def remaining(self):
+        """
+        :return: The number of seconds left, 0 once expired.
+        """
+        return max(self.expires_at - time.time(), 0.0)
+
+    def expired(self):
+        return time.time() >= self.expires_at
+
+    def check(self):
+        """
+        :raise TenableIODeadlineExceededException: When the deadline has expired.
+        """
+        if self.expired():
+            raise TenableIODeadlineExceededException(u'Deadline of %ss exceeded.' % self.seconds)
+
+    def timeout(self, timeout=None):
+        """
+        :param timeout: A requests timeout, i.e. None, a number of seconds or a `(connect, read)` tuple.
+        :return: The requests timeout capped to the remaining time.
+        """
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+def current_deadline():
+    """
+    :return: The innermost :class:`Deadline` set on the current thread by :func:`deadline_scope`, None if not any.
+    """
+    return getattr(_local, 'deadline', None)
+
+
+def check_deadline():
+    """Utility function to fail fast once the current deadline expires, i.e. between the chunks of a download.
+
+        :raise TenableIODeadlineExceededException: When the current deadline has expired.
+    """
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def deadline_scope(deadline):
+    """Context manager setting the deadline of the calls made on the current thread within its block. Nested scopes
+        cannot extend the deadline of the outer ones.
+
+        :param deadline: A number of seconds, a :class:`Deadline` or None for the current deadline.
+        :return: The deadline in effect within the block, None if not any.
+    """
+    previous = current_deadline()
+    deadline = Deadline.of(deadline)
+    if deadline is None or (previous is not None and previous.expires_at <= deadline.expires_at):
+        deadline = previous
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+class Prefetcher(object):
+
+    # The number of seconds between the checks of the producer that the iteration was closed, while the queue is full.
+    POLL_INTERVAL = 0.1
+
+    _ITEM = 0
+    _END = 1
+    _ERROR = 2
+
+    def __init__(self, iterable, size):
+        """Iterator consuming an iterable in a background thread, up to `size` items ahead, so that producing the items
+            overlaps with consuming them in bounded memory. The exceptions of the iterable are raised to the consumer,
+            and the iterable is consumed within the current deadline. Call :meth:`close` when the iteration is
+            abandoned to stop the background thread.
+
+        :param iterable: The iterable to consume, i.e. a generator of pages.
+        :param size: The maximum number of items produced ahead.
+        """
+        self.size = size
+        self._iterator = iter(iterable)
+        self._queue = six.moves.queue.Queue(size)
+        self._closed = threading.Event()
+        self._deadline = current_deadline()
+        self._thread = None
+        self._done = False
+
+    def backlog(self):
+        """
+        :return: The number of items produced and waiting for the consumer.
+        """
+        return self._queue.qsize()
+
+    def close(self):
+        """Stop the background thread, waiting for it to produce the current item, then close the iterable if it has
+            a `close` method, i.e. a generator.
+        """
+        self._closed.set()
+        self._done = True
+        if self._thread is not None:
+            self._thread.join()
+        close = getattr(self._iterator, u'close', None)
+        if close is not None:
+            close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce)
+            self._thread.daemon = True
+            self._thread.start()
+
+        kind, value = self._queue.get()
+        if kind == Prefetcher._ITEM:
+            return value
+        self._done = True
+        if kind == Prefetcher._ERROR:
+            six.reraise(*value)
+        raise StopIteration()
+
+    next = __next__
+
+    def _produce(self):
+        try:
+            with deadline_scope(self._deadline):
+                for item in self._iterator:
+                    if not self._put((Prefetcher._ITEM, item)):
+                        return
+        except BaseException:
+            self._put((Prefetcher._ERROR, sys.exc_info()))
+        else:
+            self._put((Prefetcher._END, None))
+
+    def _put(self, entry):
+        while not self._closed.is_set():
+            try:
+                self._queue.put(entry, timeout=Prefetcher.POLL_INTERVAL)
+                return True
+            except six.moves.queue.Full:
+                pass
+        return False
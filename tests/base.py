@@ -1,8 +1,58 @@
 from time import sleep, time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.api.models import ExportsVulnsStatus
 from tests.config import TenableIOTestConfig
 
 WAIT_TIMEOUT = int(TenableIOTestConfig.get('wait_timeout'))
 
+# Vuln export records, as decoded JSON objects.
+VULNS = [
+    {u'asset': {u'uuid': u'a1'}, u'plugin': {u'id': 1, u'cvss_base_score': 5.0}, u'port': {u'port': 443},
+     u'severity': u'medium', u'state': u'OPEN'},
+    {u'asset': {u'uuid': u'a2'}, u'plugin': {u'id': 2}, u'severity': u'high', u'state': u'OPEN'},
+    {u'asset': {u'uuid': u'a1'}, u'plugin': {u'id': 1, u'cvss_base_score': u'7.5'}, u'state': u'FIXED'},
+]
+
+# A Nessus report of the Workbench API with two hosts.
+NESSUS = b'''<?xml version="1.0" ?>
+<NessusClientData_v2>
+<Report name="Workbench">
+<ReportHost name="10.0.0.1">
+<HostProperties><tag name="host-ip">10.0.0.1</tag><tag name="hostname">web</tag></HostProperties>
+<ReportItem port="443" protocol="tcp" severity="2" pluginID="104743" pluginName="TLS 1.0" pluginFamily="Misc.">
+<cve>CVE-2011-3389</cve><cve>CVE-2015-0204</cve><plugin_output>TLSv1 is enabled.</plugin_output>
+</ReportItem>
+</ReportHost>
+<ReportHost name="10.0.0.2">
+<HostProperties><tag name="host-ip">10.0.0.2</tag><tag name="mac-address">00:01 00:02</tag><tag name="os"/>
+</HostProperties>
+<ReportItem port="22" protocol="tcp" severity="0" pluginID="10267" pluginName="SSH" pluginFamily="Service">
+<description></description><see_also>a<b>b</b>c</see_also><see_also>&lt;d&gt; \xc3\xa9</see_also>
+</ReportItem>
+</ReportHost>
+</Report>
+</NessusClientData_v2>
+'''
+
+
+def mock_export_client(chunks_available):
+    """
+    :param chunks_available: The chunks of the finished vulns export.
+    :return: A mock client whose vulns export is finished.
+    """
+    client = Mock()
+    client.exports_api.vulns_request_export.return_value = u'export-uuid'
+    client.exports_api.vulns_export_status.return_value = ExportsVulnsStatus(
+        status=ExportsVulnsStatus.STATUS_FINISHED,
+        chunks_available=chunks_available
+    )
+    return client
+
 
 class BaseTest(object):
 
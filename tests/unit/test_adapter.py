@@ -0,0 +1,74 @@
+import socket
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+
+from tenable_io.adapter import tcp_keepalive_socket_options
+from tenable_io.client import TenableIOClient
+from tests.base import BaseTest
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"status": "ready", "code": 200}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAdapter(BaseTest):
+
+    def setup_method(self, method):
+        super(TestAdapter, self).setup_method(method)
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.endpoint = u'http://127.0.0.1:%s/' % self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def teardown_method(self, method):
+        self.server.shutdown()
+        self.server.server_close()
+        super(TestAdapter, self).teardown_method(method)
+
+    def test_pool_options(self):
+        client = TenableIOClient(endpoint=self.endpoint, pool_connections=3, pool_maxsize=50, pool_block=True)
+        adapter = client._session.get_adapter(self.endpoint)
+        assert adapter is client._adapter, u'Adapter is mounted for the endpoint.'
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 50
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+
+    def test_pool_stats_with_keep_alive(self):
+        client = TenableIOClient(endpoint=self.endpoint, socket_options=tcp_keepalive_socket_options())
+        for _ in range(5):
+            client.server_api.status()
+
+        stats = client.pool_stats()
+        assert stats[u'requests'] == 5
+        assert stats[u'connections'] == 1, u'Connection is kept alive.'
+        assert stats[u'reused'] == 4
+
+    def test_pool_stats_without_keep_alive(self):
+        client = TenableIOClient(endpoint=self.endpoint, keep_alive=False)
+        for _ in range(3):
+            client.server_api.status()
+
+        stats = client.pool_stats()
+        assert stats[u'connections'] == 3, u'A connection is opened per request.'
+        assert stats[u'reused'] == 0
+
+    def test_tcp_keepalive_socket_options(self):
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in tcp_keepalive_socket_options()
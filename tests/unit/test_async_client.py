@@ -0,0 +1,113 @@
+import pytest
+import threading
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.api.models import ServerStatus
+from tenable_io.exceptions import TenableIOApiException
+from tests.base import BaseTest
+
+asyncio = pytest.importorskip('asyncio')
+
+from tenable_io.async_client import AsyncTenableIOClient  # noqa: E402
+
+
+def mock_response(status_code=200, text=u'{"status": "ready", "code": 200}'):
+    response = Mock(status_code=status_code, text=text, reason=u'', headers={})
+    response.request.method = u'GET'
+    response.request.path_url = u'/server/status'
+    return response
+
+
+class Ref(object):
+
+    def __init__(self, client, id):
+        self._client = client
+        self.id = id
+
+    def thread(self):
+        return threading.current_thread()
+
+    def refs(self):
+        return [Ref(self._client, 1), Ref(self._client, 2)]
+
+    def threads(self):
+        for _ in range(2):
+            yield threading.current_thread()
+
+
+class TestAsyncClient(BaseTest):
+
+    def test_api_calls_run_concurrently(self):
+        loop = asyncio.new_event_loop()
+        client = AsyncTenableIOClient(max_workers=10, loop=loop)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def request(*args, **kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return mock_response()
+
+        client.client._session.request = Mock(side_effect=request)
+
+        try:
+            results = loop.run_until_complete(asyncio.gather(*[client.server_api.status() for _ in range(10)]))
+        finally:
+            loop.close()
+            client.close()
+
+        assert all(isinstance(result, ServerStatus) for result in results), u'Results are the same as the sync API.'
+        assert max(peak) > 1, u'Requests are in flight concurrently.'
+
+    def test_api_errors_are_raised_when_awaited(self):
+        loop = asyncio.new_event_loop()
+        client = AsyncTenableIOClient(max_workers=2, loop=loop)
+        client.client._session.request = Mock(return_value=mock_response(404, u'Not Found'))
+
+        try:
+            with pytest.raises(TenableIOApiException):
+                loop.run_until_complete(client.server_api.status())
+        finally:
+            loop.close()
+            client.close()
+
+    def test_returned_objects_do_not_block(self):
+        loop = asyncio.new_event_loop()
+        client = AsyncTenableIOClient(max_workers=2, loop=loop)
+        client.client.ref_helper = Ref(client.client, 0)
+
+        try:
+            refs = loop.run_until_complete(client.ref_helper.refs())
+            assert [ref.id for ref in refs] == [1, 2]
+            assert loop.run_until_complete(refs[0].thread()) is not threading.current_thread(), \
+                u'Methods of returned refs run in the pool.'
+
+            threads = loop.run_until_complete(client.ref_helper.threads())
+            assert threads.__aiter__() is threads
+            assert loop.run_until_complete(threads.__anext__()) is not threading.current_thread(), \
+                u'Returned iterators fetch their items in the pool.'
+            loop.run_until_complete(threads.close())
+            with pytest.raises(StopAsyncIteration):
+                loop.run_until_complete(threads.__anext__())
+        finally:
+            loop.close()
+            client.close()
+
+    def test_pool_sized_to_workers(self):
+        client = AsyncTenableIOClient(max_workers=None)
+        try:
+            assert client._executor._max_workers == AsyncTenableIOClient.DEFAULT_MAX_WORKERS
+            assert client.client._pool_maxsize == AsyncTenableIOClient.DEFAULT_MAX_WORKERS, \
+                u'Every worker keeps its connection open.'
+        finally:
+            client.close()
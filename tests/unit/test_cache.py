@@ -0,0 +1,84 @@
+import json
+import pickle
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from requests import Response
+
+from tenable_io.cache import DiskCacheBackend, MemoryCacheBackend, ResponseCache
+from tenable_io.client import TenableIOClient
+from tests.base import BaseTest
+
+
+def mock_response(status_code=200, body=None, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.url = u'https://cloud.tenable.com/plugins/families'
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode(u'utf-8') if body is not None else b''
+    return response
+
+
+class TestCache(BaseTest):
+
+    def test_ttl_patterns(self):
+        cache = ResponseCache(ttls={u'editor/*/templates': 60, u'scanners': 10})
+        assert cache.ttl(u'https://cloud.tenable.com/editor/scan/templates') == 60
+        assert cache.ttl(u'https://cloud.tenable.com/scanners') == 10
+        assert cache.ttl(u'https://cloud.tenable.com/scanners/1/scans') is None, u'Other endpoints are not cached.'
+
+    def test_client_cache_hits(self):
+        cache = ResponseCache()
+        client = TenableIOClient(cache=cache)
+        client._session.request = Mock(return_value=mock_response(body={u'families': []}))
+
+        for _ in range(3):
+            assert client.plugins_api.families().families == []
+        client.scans_api.list()
+        client.scans_api.list()
+
+        assert client._session.request.call_count == 3, u'Only uncached endpoints are requested more than once.'
+        assert cache.stats()[u'hits'] == 2 and cache.stats()[u'misses'] == 1
+
+        # Clients of another user do not share the cached responses.
+        other_client = TenableIOClient(access_key=u'other', cache=cache)
+        other_client._session.request = client._session.request
+        other_client.plugins_api.families()
+        assert cache.stats()[u'misses'] == 2
+
+    def test_client_cache_revalidation(self):
+        cache = ResponseCache(ttls={u'plugins/families': 0})
+        client = TenableIOClient(cache=cache)
+        client._session.request = Mock(return_value=mock_response(body={u'families': []}, headers={u'ETag': u'"1"'}))
+        client.plugins_api.families()
+
+        client._session.request.return_value = mock_response(304)
+        assert client.plugins_api.families().families == [], u'The cached response is served after a 304.'
+        assert client._session.request.call_args[1][u'headers'][u'If-None-Match'] == u'"1"'
+        assert cache.stats() == {u'hits': 0, u'revalidated': 1, u'misses': 1, u'hit_rate': 0.5}
+
+    def test_memory_backend_lru(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set(u'a', {u'v': 1})
+        backend.set(u'b', {u'v': 2})
+        backend.get(u'a')
+        backend.set(u'c', {u'v': 3})
+        assert backend.get(u'b') is None, u'The least recently used entry is evicted.'
+        assert backend.get(u'a') == {u'v': 1} and backend.get(u'c') == {u'v': 3}
+
+    def test_disk_backend(self, tmpdir):
+        backend = DiskCacheBackend(str(tmpdir.join(u'cache')))
+        entry = {u'expires_at': time.time(), u'url': u'https://cloud.tenable.com/scanners', u'encoding': None,
+                 u'headers': {u'ETag': u'"1"'}, u'content': b'\xff{}'}
+        backend.set(u'key', entry)
+        assert DiskCacheBackend(str(tmpdir.join(u'cache'))).get(u'key') == entry, u'Entries survive the backend.'
+        backend.clear()
+        assert backend.get(u'key') is None
+
+        for content in [pickle.dumps(entry), b'{"content": 1}', b'{"content": "a"}', b'[]']:
+            tmpdir.join(u'cache', u'key.cache').write_binary(content)
+            assert backend.get(u'key') is None, u'Files that are not JSON entries are misses.'
@@ -1,4 +1,6 @@
 import pytest
+import subprocess
+import sys
 
 try:
     from unittest.mock import Mock
@@ -22,3 +24,20 @@ class TestClient(BaseTest):
         assert mock_error.call_count == int(TenableIOClient._TOTAL_RETRIES) + 1, \
             u'Invalid retry  count: ' + str(mock_error.call_count)
         mock_error.assert_called_with(headers=retry_header)
+
+    def test_client_lazy_attributes(self):
+        # Import in a fresh interpreter, so modules imported by other tests do not interfere.
+        code = (u'import sys\n'
+                u'from tenable_io.client import TenableIOClient\n'
+                u'assert u"multiprocessing" not in sys.modules\n'
+                u'assert u"tenable_io.codec" not in sys.modules\n'
+                u'client = TenableIOClient()\n'
+                u'assert u"tenable_io.api.scans" not in sys.modules\n'
+                u'assert client.scans_api is client.scans_api\n'
+                u'assert u"tenable_io.api.scans" in sys.modules\n'
+                u'assert u"tenable_io.api.users" not in sys.modules\n')
+        subprocess.check_call([sys.executable, u'-c', code])
+
+        client = TenableIOClient()
+        assert client.scan_helper._client is client
+        assert 'scan_helper' in vars(client), u'The helper is cached on the client after the first access.'
@@ -0,0 +1,81 @@
+import json
+import pytest
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io import codec
+from tenable_io.api.models import VulnsExport
+from tenable_io.client import TenableIOClient
+from tests.base import BaseTest
+
+
+@pytest.fixture(params=codec.available_backends())
+def backend(request):
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend()
+
+
+class TestCodec(BaseTest):
+
+    def test_round_trip(self, backend):
+        value = {u'name': u'café', u'ids': [1, 2], u'score': 7.5, u'tracked': True, u'tags': None}
+        assert codec.backend() == backend
+        assert codec.loads(codec.dumps(value)) == value
+        assert codec.loads(json.dumps(value).encode(u'utf-8')) == value, u'UTF-8 bytes are decoded.'
+
+    def test_default_backend(self):
+        codec.set_backend()
+        assert codec.backend() == codec.BACKEND_STDLIB, u'Installed backends are only used when selected.'
+        assert codec.loads(b'[123456789012345678901234567890]') == [123456789012345678901234567890], \
+            u'Integers over 64 bits are not rounded.'
+        assert codec.loads(u'[NaN]')[0] != codec.loads(u'[NaN]')[0]
+
+    def test_models(self, backend):
+        vulns = VulnsExport.from_json_list(b'[{"asset": {"uuid": "a"}, "plugin": {"id": 1}, "state": "OPEN"}]')
+        assert vulns[0].asset.uuid == u'a' and vulns[0].plugin.id == 1 and vulns[0].state == u'OPEN'
+
+    def test_iter_array(self):
+        value = [{u'name': u'caf\xe9 ]",', u'ids': [1, {}]}, 12345, -1.5e-3, u'', True, None, [], {}]
+        document = json.dumps(value, ensure_ascii=False).encode(u'utf-8')
+        for size in range(1, len(document) + 1):
+            chunks = [document[i:i + size] for i in range(0, len(document), size)]
+            assert list(codec.iter_array(chunks)) == value, u'Elements split across chunks are decoded.'
+        assert list(codec.iter_array([u' [ ', u']'])) == []
+
+        for invalid in [b'{}', b'[1 2]', b'[1,', b'[{"a": 1}', b'[1.]', b'']:
+            with pytest.raises(ValueError):
+                list(codec.iter_array([invalid]))
+
+    def test_streamed_chunk(self):
+        client = TenableIOClient()
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b'[{"asset": {"uuid": "a"}, "sta', b'te": "OPEN"}, {"st',
+                                                   b'ate": "FIXED"}]'])
+        client._session.request = Mock(return_value=response)
+
+        vulns = client.exports_api.vulns_chunk(u'uuid', 1, stream=True)
+        assert client._session.request.call_args[1][u'stream'] is True
+        vuln = next(vulns)
+        assert vuln.asset.uuid == u'a' and vuln.state == u'OPEN'
+        assert [v.state for v in vulns] == [u'FIXED']
+        assert response.close.called, u'The response is closed once the chunk is read.'
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            codec.set_backend(u'simdjson')
+
+    def test_client_payload(self, backend):
+        client = TenableIOClient()
+        client._session.request = Mock(return_value=Mock(status_code=200, text=u'{}', headers={}))
+
+        client.post(u'scans', payload={u'uuid': u'template'})
+        kwargs = client._session.request.call_args[1]
+        assert json.loads(kwargs[u'data'].decode(u'utf-8')) == {u'uuid': u'template'}
+        assert kwargs[u'headers'][u'Content-Type'] == u'application/json'
+
+        client.post(u'scans/1/launch')
+        assert u'data' not in client._session.request.call_args[1], u'No body without payload.'
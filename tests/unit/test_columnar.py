@@ -0,0 +1,55 @@
+import json
+import pytest
+
+from tenable_io import columnar
+from tenable_io.api.models import VulnsExport
+from tenable_io.columnar import ColumnarBatch, TYPE_BOOL, TYPE_FLOAT, TYPE_INT, TYPE_STRING
+from tenable_io.exceptions import TenableIOException
+from tenable_io.helpers.export import ExportHelper
+from tests.base import BaseTest, VULNS, mock_export_client
+
+
+class TestColumnar(BaseTest):
+
+    def test_records_to_columns(self):
+        batch = ColumnarBatch.from_records(VULNS)
+        assert len(batch) == 3
+        assert batch[u'asset_uuid'].dictionary == [u'a1', u'a2'], u'Strings are held once.'
+        assert list(batch[u'asset_uuid'].codes) == [0, 1, 0]
+        assert batch[u'state'].code(u'FIXED') == 1 and batch[u'state'].code(u'REOPENED') == -1
+        assert batch[u'cvss_base_score'].to_list() == [5.0, None, 7.5], u'Values are converted, missing are None.'
+        assert batch[u'port'].to_list() == [443, None, None]
+        assert batch.to_dicts()[1][u'severity'] == u'high'
+
+        models = ColumnarBatch.from_records(VulnsExport.from_list(VULNS))
+        assert models.to_dicts() == batch.to_dicts(), u'Models and decoded JSON give the same columns.'
+
+    def test_custom_columns(self):
+        batch = ColumnarBatch([(u'id', [u'id'], TYPE_INT), (u'patched', [u'patch'], TYPE_BOOL),
+                               (u'score', [u'score'], TYPE_FLOAT), (u'name', [u'name'], TYPE_STRING)])
+        batch.extend([{u'id': 1, u'patch': True, u'name': u'n'}, {u'id': 2, u'patch': False, u'score': 1}])
+        assert batch.to_dicts() == [{u'id': 1, u'patched': True, u'score': None, u'name': u'n'},
+                                    {u'id': 2, u'patched': False, u'score': 1.0, u'name': None}]
+
+        with pytest.raises(TenableIOException):
+            ColumnarBatch([(u'id', [u'id'], u'date')])
+
+    def test_to_numpy(self, monkeypatch):
+        batch = ColumnarBatch.from_records(VULNS)
+        if columnar.numpy is not None:
+            arrays = batch.to_numpy()
+            assert list(arrays[u'plugin_id']) == [1, 2, 1]
+            assert (arrays[u'state'] == batch[u'state'].code(u'OPEN')).sum() == 2
+
+        monkeypatch.setattr(columnar, u'numpy', None)
+        with pytest.raises(TenableIOException):
+            batch.to_numpy()
+
+    def test_vulns_batch(self):
+        client = mock_export_client([1, 2])
+        client.exports_api.vulns_download_chunk.side_effect = \
+            lambda export_uuid, chunk_id, **kwargs: iter([json.dumps(VULNS[chunk_id - 1:chunk_id]).encode(u'utf-8')])
+
+        batch = ExportHelper(client).vulns_batch(columns=[(u'plugin_id', [u'plugin', u'id'], TYPE_INT)])
+        assert batch[u'plugin_id'].to_list() == [1, 2]
+        assert client.exports_api.vulns_chunk.call_count == 0, u'Chunks are not loaded as models.'
@@ -0,0 +1,61 @@
+import json
+
+from tenable_io.api.models import CompactAssetsExport, CompactVulnsExport, CompactVulnsPlugin, VulnsExport
+from tenable_io.helpers.sync import as_dict
+from tests.base import BaseTest
+
+VULN = {
+    u'asset': {u'uuid': u'a', u'hostname': u'host', u'device_type': u'general-purpose'},
+    u'plugin': {u'id': 1, u'name': u'plugin', u'cvss_base_score': 5.0},
+    u'port': {u'port': 443, u'protocol': u'TCP'},
+    u'state': u'OPEN',
+    u'severity': u'medium',
+}
+
+
+class TestCompactModels(BaseTest):
+
+    def test_same_fields_as_models(self):
+        vuln = CompactVulnsExport.from_json(json.dumps(VULN))
+        regular = VulnsExport.from_dict(VULN)
+        assert not hasattr(vuln, u'__dict__'), u'Compact models have no per-instance dict.'
+        assert vuln.asset.uuid == regular.asset.uuid and vuln.plugin.id == regular.plugin.id
+        assert vuln.port.port == 443 and vuln.state == u'OPEN'
+        assert vuln.scan is None and vuln.output is None, u'Missing fields default to None.'
+
+    def test_extra_keys(self):
+        vuln = CompactVulnsExport.from_dict(VULN)
+        assert vuln.extra is None
+        assert vuln.plugin.extra == {u'cvss_base_score': 5.0}, u'Unknown keys are kept.'
+        assert vuln.plugin.cvss_base_score == 5.0, u'Unknown keys are readable as attributes.'
+        assert vuln.asset.device_type == u'general-purpose'
+        record = as_dict(vuln)
+        assert record[u'plugin'][u'cvss_base_score'] == 5.0 and record[u'asset'][u'device_type'] == u'general-purpose'
+
+    def test_as_dict(self):
+        plugin = CompactVulnsPlugin(id=1, name=u'plugin')
+        plugin.extra = {u'cvss_base_score': 5.0}
+        result = plugin.as_dict()
+        assert result[u'id'] == 1 and result[u'cvss_base_score'] == 5.0 and result[u'family'] is None
+
+    def test_nested_lists(self):
+        asset = CompactAssetsExport.from_dict({
+            u'id': u'a',
+            u'sources': [{u'name': u'NESSUS_SCAN', u'first_seen': u'2018-01-01'}],
+            u'tags': [{u'key': u'env', u'value': u'prod'}],
+        })
+        assert asset.sources[0].name == u'NESSUS_SCAN' and asset.tags[0].value == u'prod'
+        assert asset.as_dict()[u'tags'][0][u'key'] == u'env'
+
+    def test_list_shares_strings(self):
+        vulns = CompactVulnsExport.from_json_list(json.dumps([VULN, VULN]))
+        assert vulns[0].plugin.name == vulns[1].plugin.name
+        assert vulns[0].plugin.name is vulns[1].plugin.name, u'Equal strings of a list are held once.'
+
+    def test_from_dict_signature(self):
+        vuln = CompactVulnsExport.from_dict(VULN, True)
+        assert vuln.plugin.id == 1, u'The second positional argument is lazy, as for the other models.'
+        strings = {}
+        first = CompactVulnsExport.from_dict(dict(VULN), strings=strings)
+        second = CompactVulnsExport.from_dict(json.loads(json.dumps(VULN)), strings=strings)
+        assert first.state is second.state
@@ -0,0 +1,81 @@
+import pytest
+import requests
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import tenable_io.util as util
+from tenable_io.client import TenableIOClient
+from tenable_io.exceptions import TenableIODeadlineExceededException
+from tenable_io.retry import LinearBackoffRetryPolicy
+from tests.base import BaseTest
+
+
+class TestDeadline(BaseTest):
+
+    def test_deadline_scope_nesting(self):
+        assert util.current_deadline() is None
+        with util.deadline_scope(10) as outer:
+            assert util.current_deadline() is outer
+            with util.deadline_scope(100) as inner:
+                assert inner is outer, u'Nested deadlines cannot extend the outer ones.'
+            with util.deadline_scope(1) as inner:
+                assert inner is not outer and util.current_deadline() is inner
+            with util.deadline_scope(None) as inner:
+                assert inner is outer
+            assert util.current_deadline() is outer
+        assert util.current_deadline() is None
+
+    def test_timeout_capped_to_remaining(self):
+        deadline = util.Deadline(5)
+        connect, read = deadline.timeout((10, None))
+        assert 4 < connect <= 5 and 4 < read <= 5
+        assert deadline.timeout(1) == 1
+
+    def test_wait_until_deadline(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr('tenable_io.util.time.time', lambda: now[0])
+        monkeypatch.setattr('tenable_io.util.time.sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+        condition = Mock(return_value=False)
+
+        with pytest.raises(TenableIODeadlineExceededException):
+            util.wait_until(condition, deadline=25)
+        assert now[0] == 1025, u'Sleeps are cut short at the deadline.'
+        assert condition.call_count == 3, u'The condition is polled one last time at the deadline.'
+
+    def test_client_request_timeout(self):
+        client = TenableIOClient(connect_timeout=3, read_timeout=30)
+        client._session.request = Mock(return_value=Mock(status_code=200, text=u'', headers={}))
+
+        client.get(u'scans')
+        assert client._session.request.call_args[1]['timeout'] == (3, 30)
+
+        with client.deadline(5):
+            client.get(u'scans')
+        connect, read = client._session.request.call_args[1]['timeout']
+        assert connect == 3 and 4 < read <= 5, u'Timeouts are capped to the deadline.'
+
+    def test_client_request_deadline_exceeded(self):
+        client = TenableIOClient()
+        client._session.request = Mock(side_effect=requests.exceptions.ReadTimeout())
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.get(u'scans')
+
+        with pytest.raises(TenableIODeadlineExceededException):
+            with client.deadline(0):
+                client.get(u'scans')
+        assert client._session.request.call_count == 1, u'No request is sent once the deadline expired.'
+
+    def test_client_no_retry_past_deadline(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr('tenable_io.client.sleep', sleeps.append)
+        client = TenableIOClient(retry_policy=LinearBackoffRetryPolicy(max_retries=3, sleep_milliseconds=2000))
+        client._session.request = Mock(return_value=Mock(status_code=503, text=u'', headers={}))
+
+        with pytest.raises(TenableIODeadlineExceededException):
+            with client.deadline(5):
+                client.get(u'scans')
+        assert sleeps == [2], u'The second retry would wait past the deadline.'
@@ -0,0 +1,168 @@
+import os
+import pytest
+import threading
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.api.models import ExportsVulnsStatus
+from tenable_io.client import TenableIOClient
+from tenable_io.exceptions import TenableIOException
+from tenable_io.helpers.export import ExportHelper, ExportManifest
+from tests.base import BaseTest, mock_export_client
+
+
+class TestExportHelper(BaseTest):
+
+    def test_download_vulns_parallel_keeps_chunk_order(self):
+        client = mock_export_client([1, 2, 3, 4])
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def vulns_chunk(export_uuid, chunk_id, compact=False, lazy=False):
+            with lock:
+                active.append(chunk_id)
+                peak.append(len(active))
+            time.sleep(0.05 * (5 - chunk_id))
+            with lock:
+                active.remove(chunk_id)
+            return [u'%s_%s' % (chunk_id, i) for i in range(2)]
+
+        client.exports_api.vulns_chunk.side_effect = vulns_chunk
+
+        vulns = ExportHelper(client).download_vulns(max_workers=2)
+
+        assert vulns == [u'1_0', u'1_1', u'2_0', u'2_1', u'3_0', u'3_1', u'4_0', u'4_1'], \
+            u'Records are returned in the order of the available chunks.'
+        assert max(peak) == 2, u'Chunks are downloaded concurrently, up to max_workers.'
+
+    def test_download_vulns_parallel_to_disk(self, tmpdir):
+        client = mock_export_client([1, 2, 3])
+        client.exports_api.vulns_download_chunk.side_effect = \
+            lambda export_uuid, chunk_id: iter([b'[', str(chunk_id).encode('utf-8'), b']'])
+        path = str(tmpdir.join(u'vulns_%(chunk_id)s.json'))
+
+        chunks = ExportHelper(client).download_vulns(path=path, max_workers=3)
+
+        assert chunks == [1, 2, 3], u'The list of chunk IDs is returned.'
+        for chunk_id in chunks:
+            with open(path % {'chunk_id': chunk_id}, 'rb') as fd:
+                assert fd.read() == (u'[%s]' % chunk_id).encode('utf-8'), u'Chunk is written to its own file.'
+            os.remove(path % {'chunk_id': chunk_id})
+
+    def test_iter_vulns_yields_chunks_while_processing(self, monkeypatch):
+        monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+        client = mock_export_client(None)
+        client.exports_api.vulns_export_status.side_effect = [
+            ExportsVulnsStatus(status=ExportsVulnsStatus.STATUS_QUEUED, chunks_available=[]),
+            ExportsVulnsStatus(status=ExportsVulnsStatus.STATUS_PROCESSING, chunks_available=[1]),
+            ExportsVulnsStatus(status=ExportsVulnsStatus.STATUS_PROCESSING, chunks_available=[1]),
+            ExportsVulnsStatus(status=ExportsVulnsStatus.STATUS_FINISHED, chunks_available=[1, 2]),
+        ]
+        client.exports_api.vulns_chunk.side_effect = \
+            lambda export_uuid, chunk_id, **kwargs: iter([chunk_id * 10, chunk_id * 10 + 1])
+
+        vulns_iter = ExportHelper(client).iter_vulns()
+        assert next(vulns_iter) == 10, u'First record is yielded before the export is finished.'
+        assert client.exports_api.vulns_export_status.call_count == 2, u'Chunk is fetched as soon as it is available.'
+        assert list(vulns_iter) == [11, 20, 21], u'Every chunk is retrieved exactly once.'
+        assert client.exports_api.vulns_chunk.call_count == 2
+
+    def test_iter_vulns_closes_abandoned_chunk(self):
+        closed = []
+        # Referenced by the test, so that they are not closed by the garbage collector.
+        chunks = []
+
+        def iter_chunk(chunk_id, raw):
+            try:
+                for part in [b'[{"id": 1}, ', b'{"id": 2}]']:
+                    yield part if raw else {u'id': chunk_id}
+            finally:
+                closed.append(chunk_id)
+
+        def chunk(export_uuid, chunk_id, **kwargs):
+            chunks.append(iter_chunk(chunk_id, u'chunk_size' in kwargs))
+            return chunks[-1]
+
+        client = mock_export_client([1, 2])
+        client.exports_api.vulns_chunk.side_effect = chunk
+        client.exports_api.vulns_download_chunk.side_effect = chunk
+        for raw in [False, True]:
+            vulns_iter = ExportHelper(client).iter_vulns(raw=raw)
+            next(vulns_iter)
+            vulns_iter.close()
+            assert closed == [1], u'The chunk being read is closed when the iteration is abandoned.'
+            del closed[:]
+
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b'[', b']'])
+        client = TenableIOClient()
+        client._session.request = Mock(return_value=response)
+        chunks = client.exports_api.vulns_download_chunk(u'uuid', 1)
+        next(chunks)
+        chunks.close()
+        assert response.close.called, u'The response of a closed download is closed.'
+
+    def test_iter_vulns_raises_on_export_error(self):
+        client = mock_export_client(None)
+        client.exports_api.vulns_export_status.return_value = ExportsVulnsStatus(
+            status=ExportsVulnsStatus.STATUS_ERROR, chunks_available=[])
+
+        with pytest.raises(TenableIOException):
+            list(ExportHelper(client).iter_vulns())
+
+    def test_download_vulns_resumes_from_manifest(self, tmpdir):
+        client = mock_export_client([1, 2, 3])
+        path = str(tmpdir.join(u'vulns_%(chunk_id)s.json'))
+        manifest = str(tmpdir.join(u'vulns.manifest'))
+
+        def interrupted(export_uuid, chunk_id):
+            if chunk_id == 2:
+                raise IOError(u'Interrupted.')
+            return iter([b'[]'])
+
+        client.exports_api.vulns_download_chunk.side_effect = interrupted
+        with pytest.raises(IOError):
+            ExportHelper(client).download_vulns(path=path, severity=[u'high'], manifest=manifest)
+        assert os.path.isfile(manifest), u'Manifest is kept when the download is interrupted.'
+
+        client.exports_api.vulns_download_chunk.reset_mock()
+        client.exports_api.vulns_download_chunk.side_effect = lambda export_uuid, chunk_id: iter([b'[]'])
+        chunks = ExportHelper(client).download_vulns(path=path, severity=[u'high'], manifest=manifest)
+
+        assert chunks == [1, 2, 3], u'All chunk IDs are returned on resume.'
+        assert client.exports_api.vulns_request_export.call_count == 1, u'The recorded export is resumed.'
+        assert [c[0][1] for c in client.exports_api.vulns_download_chunk.call_args_list] == [2, 3], \
+            u'Only the missing chunks are downloaded.'
+        assert not os.path.isfile(manifest), u'Manifest is removed once the export is downloaded.'
+
+    def test_download_vulns_resumed_export_error(self, tmpdir):
+        client = mock_export_client([1])
+        manifest = str(tmpdir.join(u'vulns.manifest'))
+        path = str(tmpdir.join(u'vulns_%(chunk_id)s.json'))
+        client.exports_api.vulns_download_chunk.side_effect = IOError(u'Interrupted.')
+        with pytest.raises(IOError):
+            ExportHelper(client).download_vulns(path=path, manifest=manifest)
+
+        client.exports_api.vulns_export_status.return_value = ExportsVulnsStatus(
+            status=ExportsVulnsStatus.STATUS_ERROR, chunks_available=[])
+
+        with pytest.raises(TenableIOException):
+            ExportHelper(client).download_vulns(path=path, manifest=manifest)
+        assert client.exports_api.vulns_request_export.call_count == 1, u'The recorded export is resumed.'
+        assert not os.path.isfile(manifest), u'Manifest of a failed export is removed.'
+
+    def test_download_vulns_manifest_ignored_for_different_request(self, tmpdir):
+        client = mock_export_client([1])
+        client.exports_api.vulns_download_chunk.side_effect = lambda export_uuid, chunk_id: iter([b'[]'])
+        manifest = str(tmpdir.join(u'vulns.manifest'))
+        ExportManifest(manifest).start(u'other-export-uuid', {u'num_assets': 50, u'filters': {u'state': [u'fixed']}})
+
+        ExportHelper(client).download_vulns(path=str(tmpdir.join(u'vulns')), manifest=manifest)
+
+        assert client.exports_api.vulns_request_export.call_count == 1, u'A new export is requested.'
+        client.exports_api.vulns_download_chunk.assert_called_with(u'export-uuid', 1)
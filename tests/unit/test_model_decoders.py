@@ -0,0 +1,92 @@
+import inspect
+import sys
+
+import pytest
+
+from tenable_io.api import models
+from tenable_io.api.models import (
+    BaseModel, CompactModel, LazyValue, PolicySettings, ScanDetails, ScanInfo, UserKeys, VulnsAsset, VulnsExport,
+    VulnsPlugin
+)
+from tenable_io.exceptions import TenableIOException
+from tests.base import BaseTest
+
+sys.path.insert(0, u'benchmarks')
+
+from payloads import vulns_chunk  # noqa: E402
+
+
+def from_dict_setattr(cls, dict_):
+    instance = cls()
+    for key in dict_:
+        setattr(instance, key, dict_[key])
+    return instance
+
+
+def as_plain(value):
+    if isinstance(value, BaseModel):
+        return dict((key, as_plain(item)) for key, item in vars(value).items())
+    if isinstance(value, list):
+        return [as_plain(item) for item in value]
+    return value
+
+
+class TestModelDecoders(BaseTest):
+
+    def test_decoders_match_setattr(self):
+        for record in models.loads(vulns_chunk(50)):
+            decoded = VulnsExport.from_dict(record)
+            assert as_plain(decoded) == as_plain(from_dict_setattr(VulnsExport, record))
+            assert isinstance(decoded.asset, VulnsAsset) and isinstance(decoded.plugin, VulnsPlugin)
+
+    def test_all_models_decode_empty_dict(self):
+        for _, cls in inspect.getmembers(models, inspect.isclass):
+            if issubclass(cls, BaseModel) and not issubclass(cls, CompactModel) and \
+                    cls not in (BaseModel, models.ScanSettings, models.TagValueFilters):
+                assert as_plain(cls.from_dict({})) == as_plain(cls()), cls.__name__
+
+    def test_unknown_keys_and_overrides(self):
+        info = ScanInfo.from_dict({u'pci-can-upload': True, u'unknown': 1})
+        assert info.pci_can_upload is True and info.unknown == 1
+
+        keys = UserKeys.from_dict({u'accessKey': u'a', u'secretKey': u's'})
+        assert keys.access_key == u'a' and keys.secret_key == u's'
+
+        settings = PolicySettings.from_dict({u'name': u'policy', u'acls': [{u'permissions': 16}]})
+        assert settings.name == u'policy' and settings.acls == [{u'permissions': 16}], \
+            u'Classes with mutable defaults fall back to setting attributes.'
+
+    def test_nested_models(self):
+        asset = VulnsAsset()
+        export = VulnsExport.from_dict({u'asset': asset, u'plugin': None})
+        assert export.asset is asset and export.plugin is None
+
+        with pytest.raises(TenableIOException):
+            VulnsExport.from_dict({u'asset': u'invalid'})
+
+        details = models.ScanDetails.from_dict({u'hosts': [{u'host_id': 1}], u'history': None})
+        assert details.hosts[0].host_id == 1 and details.history == []
+        with pytest.raises(TenableIOException):
+            models.ScanDetails.from_dict({u'hosts': [1]})
+
+    def test_lazy_hydration(self):
+        record = models.loads(vulns_chunk(1))[0]
+        vuln = VulnsExport.from_dict(record, lazy=True)
+        assert isinstance(vuln._asset, LazyValue) and isinstance(vuln._plugin, LazyValue), \
+            u'Nested models are kept as decoded JSON.'
+        assert vuln.severity == record[u'severity']
+
+        assert isinstance(vuln.asset, VulnsAsset) and vuln.asset.uuid == record[u'asset'][u'uuid']
+        assert vuln.asset is vuln.asset, u'Nested models are hydrated once.'
+        assert isinstance(vuln._plugin, LazyValue), u'Other nested models are not hydrated.'
+        assert as_plain(vuln.plugin) == as_plain(VulnsExport.from_dict(record).plugin)
+
+        details = ScanDetails.from_json(
+            u'{"info": {"status": "completed", "pci-can-upload": false}, "hosts": [{"host_id": 1}], "history": null}',
+            lazy=True)
+        assert details.info.status == u'completed' and details.info.pci_can_upload is False
+        assert isinstance(details._hosts, LazyValue) and details.hosts[0].host_id == 1
+        assert details.history == []
+
+        with pytest.raises(TenableIOException):
+            VulnsExport.from_dict({u'asset': u'invalid'}, lazy=True).asset
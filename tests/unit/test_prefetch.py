@@ -0,0 +1,87 @@
+import threading
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import pytest
+
+from tenable_io.api.workbenches import WorkbenchesApi
+from tenable_io.helpers import workbench
+from tenable_io.helpers.workbench import WorkbenchHelper
+from tenable_io.util import current_deadline, deadline_scope, Prefetcher
+from tests.base import BaseTest, NESSUS
+
+
+class TestPrefetch(BaseTest):
+
+    def test_prefetcher_is_bounded(self):
+        produced = []
+
+        def items():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        prefetcher = Prefetcher(items(), 3)
+        assert next(prefetcher) == 0
+        time.sleep(0.2)
+        # The queue holds 3 items, and the producer waits to put the next one.
+        assert len(produced) <= 5, u'Items are produced up to the size of the queue ahead.'
+        assert list(prefetcher) == list(range(1, 20))
+
+    def test_prefetcher_raises_and_closes(self):
+        def failing():
+            yield 1
+            raise ValueError()
+
+        prefetcher = Prefetcher(failing(), 2)
+        assert next(prefetcher) == 1
+        with pytest.raises(ValueError):
+            next(prefetcher)
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+        closed = []
+
+        def items():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.append(True)
+
+        prefetcher = Prefetcher(items(), 1)
+        next(prefetcher)
+        prefetcher.close()
+        assert not prefetcher._thread.is_alive(), u'The background thread is stopped once closed.'
+        assert closed == [True], u'The source generator is closed.'
+
+    def test_prefetcher_keeps_deadline(self):
+        deadlines = []
+
+        def items():
+            deadlines.append(current_deadline())
+            yield threading.current_thread()
+
+        with deadline_scope(60) as deadline:
+            thread = next(Prefetcher(items(), 1))
+        assert thread is not threading.current_thread()
+        assert deadlines == [deadline], u'The items are produced within the deadline of the consumer.'
+
+    def test_adaptive_page_size(self):
+        pages = workbench._paginate(range(30), 2, 8, lambda: 2, 2)
+        assert [len(page) for page in pages] == [2, 4, 8, 8, 8], u'Pages grow while the queue is full.'
+        pages = workbench._paginate(range(10), 2, 8, lambda: 0, 2)
+        assert [len(page) for page in pages] == [2, 2, 2, 2, 2], u'Pages do not grow while the consumer waits.'
+        assert [len(page) for page in workbench._paginate(range(5), 0)] == [5]
+
+    def test_helper_prefetches_pages(self):
+        client = Mock()
+        client.workbenches_api.export_status.return_value = WorkbenchesApi.STATUS_EXPORT_READY
+        client.workbenches_api.export_download.return_value = iter([NESSUS])
+
+        pages = list(WorkbenchHelper(client).vulnerabilities(page_size=1, prefetch=2, max_page_size=4))
+        assert [v.plugin_id for page in pages for v in page] == [u'104743', u'10267']
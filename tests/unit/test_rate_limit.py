@@ -0,0 +1,61 @@
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from requests.structures import CaseInsensitiveDict
+
+from tenable_io.client import TenableIOClient
+from tenable_io.exceptions import TenableIORetryableApiException
+from tenable_io.rate_limit import RateLimiter, rate_limit_reset, retry_after
+from tests.base import BaseTest
+
+
+def mock_response(headers):
+    return Mock(headers=CaseInsensitiveDict(headers))
+
+
+class TestRateLimiter(BaseTest):
+
+    def test_acquire_limits_rate_after_burst(self):
+        limiter = RateLimiter(rate=50, burst=5)
+        start = time.time()
+        for _ in range(10):
+            limiter.acquire()
+        elapsed = time.time() - start
+        assert 0.08 <= elapsed < 0.5, u'Requests beyond the burst are spaced out by the rate (%ss).' % elapsed
+
+    def test_shared_limiter(self):
+        limiter = RateLimiter(rate=1000, burst=2, shared=True)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.pause(0.1)
+        start = time.time()
+        limiter.acquire()
+        assert time.time() - start >= 0.09, u'Pause holds the next request.'
+
+    def test_update_pauses_on_retry_after(self):
+        limiter = RateLimiter(rate=1000)
+        limiter.update(mock_response({u'retry-after': u'0.1'}))
+        start = time.time()
+        limiter.acquire()
+        assert time.time() - start >= 0.09, u'Retry-After holds the next request.'
+
+    def test_headers(self):
+        assert retry_after(mock_response({u'Retry-After': u'120'})) == 120
+        assert retry_after(mock_response({u'Retry-After': u'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0, \
+            u'Retry-After dates in the past do not wait.'
+        assert retry_after(mock_response({})) is None
+        assert rate_limit_reset(mock_response({u'X-RateLimit-Remaining': u'0', u'X-RateLimit-Reset': u'30'})) == 30
+        assert rate_limit_reset(mock_response({u'X-RateLimit-Remaining': u'3', u'X-RateLimit-Reset': u'30'})) is None
+
+    def test_client_retry_honors_retry_after(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr('tenable_io.client.sleep', sleeps.append)
+        response = Mock(status_code=429, text=u'', headers=CaseInsensitiveDict({u'Retry-After': u'7'}))
+        mock_error = Mock(side_effect=[TenableIORetryableApiException(response), u'ok'])
+
+        assert TenableIOClient._retry(mock_error)() == u'ok'
+        assert sleeps == [7], u'Waits as long as requested by the server.'
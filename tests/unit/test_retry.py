@@ -0,0 +1,68 @@
+import pytest
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.client import TenableIOClient
+from tenable_io.exceptions import TenableIOApiException, TenableIORetryableApiException
+from tenable_io.retry import ExponentialBackoffRetryPolicy, LinearBackoffRetryPolicy, RetryBudget
+from tests.base import BaseTest
+
+
+def mock_response(status_code):
+    return Mock(status_code=status_code, text=u'', headers={})
+
+
+class TestRetryPolicy(BaseTest):
+
+    def test_linear_backoff_is_cumulative(self):
+        policy = LinearBackoffRetryPolicy(max_retries=3, sleep_milliseconds=500)
+        delays = [policy.next_delay(attempt, u'GET', mock_response(500), 0) for attempt in range(1, 5)]
+        assert delays == [0.5, 1.5, 3.0, None], u'Same waits as the original retries, up to max_retries.'
+
+    def test_exponential_backoff_full_jitter(self):
+        policy = ExponentialBackoffRetryPolicy(max_retries=10, base=1, cap=8)
+        for attempt in range(1, 11):
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= d <= min(8, 2 ** (attempt - 1)) for d in delays), u'Waits are bounded and capped.'
+            assert len(set(delays)) > 1, u'Waits are jittered.'
+
+    def test_non_idempotent_requests(self):
+        policy = ExponentialBackoffRetryPolicy()
+        assert policy.next_delay(1, u'POST', mock_response(500), 0) is None, u'POST is not retried on 500.'
+        assert policy.next_delay(1, u'POST', mock_response(429), 0) is not None, u'POST is retried on 429.'
+        assert policy.next_delay(1, u'GET', mock_response(500), 0) is not None, u'GET is retried on 500.'
+
+    def test_max_elapsed(self):
+        policy = LinearBackoffRetryPolicy(sleep_milliseconds=1000, max_elapsed=10)
+        assert policy.next_delay(1, u'GET', mock_response(500), 8.5) == 1
+        assert policy.next_delay(1, u'GET', mock_response(500), 9.5) is None, u'No retry past the max elapsed time.'
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+        policy = LinearBackoffRetryPolicy(budget=budget)
+        assert policy.next_delay(1, u'GET', mock_response(500), 0) is not None
+        assert policy.next_delay(1, u'GET', mock_response(500), 0) is not None
+        assert policy.next_delay(1, u'GET', mock_response(500), 0) is None, u'No retry once the budget is spent.'
+        policy.on_request()
+        policy.on_request()
+        assert policy.next_delay(1, u'GET', mock_response(500), 0) is not None, u'Requests refill the budget.'
+
+    def test_client_uses_its_retry_policy(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr('tenable_io.client.sleep', sleeps.append)
+        client = TenableIOClient(retry_policy=ExponentialBackoffRetryPolicy(max_retries=2))
+        client._session.request = Mock(return_value=mock_response(503))
+        client._session.request.return_value.request.method = u'GET'
+
+        with pytest.raises(TenableIOApiException):
+            client.get(u'server/status')
+        assert client._session.request.call_count == 3
+        assert len(sleeps) == 2
+
+        client._session.request.reset_mock()
+        with pytest.raises(TenableIOApiException):
+            client.post(u'scans')
+        assert client._session.request.call_count == 1, u'POST is not retried on 503 by default.'
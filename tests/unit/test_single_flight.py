@@ -0,0 +1,80 @@
+import threading
+import time
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.client import TenableIOClient
+from tenable_io.single_flight import SingleFlight
+from tests.base import BaseTest
+
+
+def call_concurrently(f, count=8):
+    results = [None] * count
+    barrier = threading.Event()
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = f()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(BaseTest):
+
+    def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results = call_concurrently(lambda: single_flight.do(u'key', slow))
+        assert len(calls) == 1, u'Only one call is made.'
+        assert all(result is results[0] for result in results), u'All callers share the result.'
+        assert single_flight.stats() == {u'calls': 1, u'shared': 7}
+
+        single_flight.do(u'key', slow)
+        assert len(calls) == 2, u'Calls are not cached once completed.'
+
+    def test_concurrent_calls_share_exception(self):
+        single_flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError()
+
+        results = call_concurrently(lambda: single_flight.do(u'key', fail))
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_client_coalesces_identical_gets(self):
+        client = TenableIOClient(single_flight=SingleFlight())
+
+        def request(*args, **kwargs):
+            time.sleep(0.2)
+            return Mock(status_code=200, text=u'{"families": []}', headers={})
+
+        client._session.request = Mock(side_effect=request)
+
+        call_concurrently(lambda: client.plugins_api.families())
+        assert client._session.request.call_count == 1
+
+        call_concurrently(lambda: client.get(u'plugins/families', params={u'all': True}), 2)
+        call_concurrently(lambda: client.get(u'plugins/families/1'), 2)
+        assert client._session.request.call_count == 3, u'Requests with different URIs or params are not coalesced.'
+
+        call_concurrently(lambda: client.post(u'plugins'), 2)
+        assert client._session.request.call_count == 5, u'Only GETs are coalesced.'
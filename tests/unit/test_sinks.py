@@ -0,0 +1,126 @@
+import json
+import pytest
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io import sinks
+from tenable_io.api.models import AssetsExport
+from tenable_io.columnar import VULNS_COLUMNS, field
+from tenable_io.exceptions import TenableIOException
+from tenable_io.helpers.export import ExportHelper
+from tenable_io.sinks import ASSETS_SCHEMA, ColumnarFileSink, FORMAT_ARROW, FORMAT_PARQUET, TYPE_JSON, \
+    TYPE_STRING_LIST, VULNS_SCHEMA, model_columns
+from tests.base import BaseTest, VULNS, mock_export_client
+
+
+class RecordingSink(object):
+
+    def __init__(self):
+        self.records = []
+        self.files = [u'part-00000.parquet']
+        self.closed = False
+
+    def write_all(self, records):
+        self.records.extend(records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.closed = True
+
+
+class TestSinks(BaseTest):
+
+    def test_model_columns(self):
+        vulns = {name: (path, type_) for name, path, type_ in VULNS_SCHEMA}
+        assert vulns[u'plugin_id'] == ((u'plugin', u'id'), sinks.TYPE_INT), u'Nested models are flattened.'
+        assert vulns[u'asset_uuid'] == ((u'asset', u'uuid'), sinks.TYPE_STRING)
+        assert vulns[u'state'] == ((u'state',), sinks.TYPE_STRING)
+
+        assets = {name: type_ for name, _, type_ in ASSETS_SCHEMA}
+        assert assets[u'ipv4s'] == TYPE_STRING_LIST
+        assert assets[u'tags'] == TYPE_JSON
+        assert len(model_columns(AssetsExport)) == len(ASSETS_SCHEMA)
+
+    def test_convert(self):
+        assert sinks._convert(443, sinks.TYPE_STRING) == u'443'
+        assert sinks._convert(u'7.5', sinks.TYPE_FLOAT) == 7.5
+        assert sinks._convert(u'10.0.0.1', TYPE_STRING_LIST) == [u'10.0.0.1']
+        assert json.loads(sinks._convert([{u'key': u'k'}], TYPE_JSON)) == [{u'key': u'k'}]
+        assert sinks._convert(None, sinks.TYPE_INT) is None
+        assert field(VULNS[1], (u'port', u'port')) is None, u'Missing nested fields are None.'
+
+    def test_vulns_schema_has_plugin_fields(self):
+        names = [name for name, _, _ in VULNS_SCHEMA]
+        assert len(names) == len(set(names))
+        paths = {path: type_ for _, path, type_ in VULNS_SCHEMA}
+        for _, path, type_ in VULNS_COLUMNS:
+            assert paths[path] == type_, u'The fields of the columnar batches are in the schema.'
+
+        vuln = {u'plugin': {u'id': 1, u'cve': [u'CVE-2011-3389'], u'cvss3_base_score': u'7.5', u'vpr': {u'score': 5.9},
+                            u'cvss3_vector': {u'raw': u'AV:N/AC:H'}, u'exploit_available': True}}
+        row = dict((name, sinks._convert(field(vuln, path), type_)) for name, path, type_ in VULNS_SCHEMA)
+        assert row[u'plugin_cve'] == [u'CVE-2011-3389']
+        assert row[u'plugin_cvss3_base_score'] == 7.5 and row[u'plugin_cvss_base_score'] is None
+        assert row[u'plugin_vpr_score'] == 5.9 and row[u'plugin_cvss3_vector'] == u'AV:N/AC:H'
+        assert row[u'plugin_exploit_available'] is True
+
+    def test_requires_pyarrow(self, monkeypatch, tmpdir):
+        monkeypatch.setattr(sinks, u'pyarrow', None)
+        with pytest.raises(TenableIOException):
+            ColumnarFileSink(str(tmpdir), VULNS_SCHEMA)
+
+    def test_write_vulns(self):
+        client = mock_export_client([1, 2])
+        client.exports_api.vulns_download_chunk.side_effect = \
+            lambda export_uuid, chunk_id, **kwargs: iter([json.dumps(VULNS[chunk_id - 1:chunk_id]).encode(u'utf-8')])
+        sink = RecordingSink()
+
+        files = ExportHelper(client).write_vulns(sink)
+        assert files == sink.files
+        assert sorted(record[u'plugin'][u'id'] for record in sink.records) == [1, 2]
+        assert sink.closed, u'The sink is closed once the export is written.'
+        assert client.exports_api.vulns_chunk.call_count == 0, u'Chunks are not loaded as models.'
+
+    @pytest.mark.parametrize(u'format_', [FORMAT_PARQUET, FORMAT_ARROW])
+    def test_write_files(self, tmpdir, format_):
+        pyarrow = pytest.importorskip(u'pyarrow')
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        with ColumnarFileSink(str(tmpdir), VULNS_SCHEMA, format=format_, row_group_size=2,
+                              partition_by=u'state') as sink:
+            sink.write_all(VULNS)
+        assert sink.rows == 3
+        assert len(sink.files) == 2, u'One file is written per partition.'
+
+        tables = [pyarrow.parquet.read_table(path) if format_ == FORMAT_PARQUET else
+                  pyarrow.ipc.open_file(path).read_all() for path in sink.files]
+        assert sorted(id_ for table in tables for id_ in table.column(u'plugin_id').to_pylist()) == [1, 1, 2]
+
+    def test_max_open_files(self, monkeypatch, tmpdir):
+        closed = []
+
+        class Partition(object):
+
+            def __init__(self, sink, key):
+                self.key = key
+
+            def append(self, row):
+                pass
+
+            def close(self):
+                closed.append(self.key)
+
+        monkeypatch.setattr(sinks, u'pyarrow', Mock())
+        monkeypatch.setattr(sinks, u'_Partition', Partition)
+        sink = ColumnarFileSink(str(tmpdir), VULNS_SCHEMA, partition_by=u'plugin_id', max_open_files=2)
+        for plugin_id in [1, 2, 1, 3, 2]:
+            sink.write({u'plugin': {u'id': plugin_id}})
+        assert closed == [2, 1], u'The least recently written partition is closed when too many are open.'
+        sink.close()
+        assert sorted(closed) == [1, 2, 2, 3]
@@ -0,0 +1,130 @@
+import pytest
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.api.models import AssetsExport, VulnsExport
+from tenable_io.helpers.sync import MemorySyncStore, SqliteSyncStore, SyncHelper
+from tests.base import BaseTest
+
+
+def vuln(asset_uuid, plugin_id, state=u'OPEN', severity=u'high', cve=None):
+    return VulnsExport.from_dict({
+        u'asset': {u'uuid': asset_uuid},
+        u'plugin': {u'id': plugin_id, u'name': u'Plugin %s' % plugin_id, u'cve': cve or []},
+        u'port': {u'port': 0, u'protocol': u'TCP'},
+        u'severity': severity,
+        u'state': state,
+    })
+
+
+class TestSyncHelper(BaseTest):
+
+    def test_sync_assets_applies_deltas_from_watermark(self):
+        client = Mock()
+        client.export_helper.iter_assets.return_value = iter([AssetsExport(id=u'a1'), AssetsExport(id=u'a2')])
+        store = MemorySyncStore()
+
+        result = SyncHelper(client).sync_assets(store, tenant=u'acme')
+
+        assert result.since is None, u'First sync is a full export.'
+        assert sorted(result.upserted) == [u'a1', u'a2']
+        client.export_helper.iter_assets.assert_called_once_with()
+        watermark = store.watermark(u'acme', SyncHelper.KIND_ASSETS)
+        assert watermark == result.watermark, u'Watermark is kept per tenant.'
+        assert store.watermark(u'other', SyncHelper.KIND_ASSETS) is None
+
+        deltas = {
+            u'updated_at': [AssetsExport(id=u'a3'), AssetsExport(id=u'a1', deleted_at=u'2020-01-01T00:00:00Z')],
+            u'deleted_at': [],
+            u'terminated_at': [AssetsExport(id=u'a2', terminated_at=u'2020-01-01T00:00:00Z')],
+        }
+        client.export_helper.iter_assets.side_effect = lambda **kwargs: iter(deltas[list(kwargs)[0]])
+
+        result = SyncHelper(client).sync_assets(store, tenant=u'acme')
+
+        assert result.since == watermark, u'Next sync exports deltas since the previous watermark.'
+        assert result.upserted == [u'a3']
+        assert sorted(result.deleted) == [u'a1', u'a2'], u'Deleted and terminated assets are removed.'
+        assert list(store.records[u'acme'][SyncHelper.KIND_ASSETS]) == [u'a3']
+
+    def test_sync_vulns_removes_fixed_and_persists(self, tmpdir):
+        path = str(tmpdir.join(u'store.json'))
+        client = Mock()
+        client.export_helper.iter_vulns.return_value = iter([vuln(u'a1', 1), vuln(u'a1', 2)])
+        SyncHelper(client).sync_vulns(MemorySyncStore(path))
+
+        client.export_helper.iter_vulns.return_value = iter([vuln(u'a1', 1, state=u'FIXED')])
+        store = MemorySyncStore(path)
+        result = SyncHelper(client).sync_vulns(store)
+
+        assert result.deleted == [u'a1:1:0:TCP'], u'Fixed vulns are removed.'
+        assert list(MemorySyncStore(path).records[u'default'][SyncHelper.KIND_VULNS]) == [u'a1:2:0:TCP'], \
+            u'Store is persisted on commit.'
+        assert client.export_helper.iter_vulns.call_args[1][u'since'] == result.since
+        assert client.export_helper.iter_vulns.call_args[1][u'state'] == SyncHelper.VULNS_STATES, \
+            u'Next syncs export the fixed vulns to remove them.'
+
+    def test_first_sync_vulns_skips_fixed(self):
+        client = Mock()
+        client.export_helper.iter_vulns.return_value = iter([])
+        SyncHelper(client).sync_vulns(MemorySyncStore())
+        client.export_helper.iter_vulns.assert_called_once_with(state=[u'open', u'reopened'], since=None)
+
+    @pytest.mark.parametrize(u'store', [MemorySyncStore, SqliteSyncStore])
+    def test_stores_remove_vulns_with_asset(self, store):
+        store = store()
+        client = Mock()
+        client.export_helper.iter_assets.return_value = iter([AssetsExport(id=u'a1'), AssetsExport(id=u'a2')])
+        client.export_helper.iter_vulns.return_value = iter([vuln(u'a1', 1), vuln(u'a1', 2), vuln(u'a2', 1)])
+        SyncHelper(client).sync(store)
+
+        client.export_helper.iter_assets.side_effect = lambda **kwargs: iter(
+            [AssetsExport(id=u'a1', deleted_at=u'2020-01-01T00:00:00Z')] if u'deleted_at' in kwargs else [])
+        client.export_helper.iter_vulns.return_value = iter([])
+        result = SyncHelper(client).sync(store)
+
+        assert result[0].deleted == [u'a1']
+        if isinstance(store, SqliteSyncStore):
+            vulns = store.findings()
+        else:
+            vulns = store.records[u'default'][SyncHelper.KIND_VULNS].values()
+        assert [(v[u'asset'][u'uuid'], v[u'plugin'][u'id']) for v in vulns] == [(u'a2', 1)], \
+            u'The vulns of a removed asset are removed with it.'
+
+    def test_sqlite_store_indexes_records(self, tmpdir):
+        path = str(tmpdir.join(u'store.db'))
+        client = Mock()
+        client.export_helper.iter_assets.return_value = iter([
+            AssetsExport.from_dict({u'id': u'a1', u'tags': [{u'key': u'Location', u'value': u'Paris'}]}),
+            AssetsExport.from_dict({u'id': u'a2', u'tags': [{u'key': u'Location', u'value': u'Berlin'}]}),
+        ])
+        client.export_helper.iter_vulns.return_value = iter([
+            vuln(u'a1', 1, severity=u'critical', cve=[u'CVE-2014-0160']),
+            vuln(u'a1', 2, state=u'REOPENED'),
+            vuln(u'a2', 1, severity=u'critical', cve=[u'CVE-2014-0160']),
+        ])
+        SyncHelper(client).sync(SqliteSyncStore(path))
+
+        store = SqliteSyncStore(path)
+        assert store.watermark(u'default', SyncHelper.KIND_VULNS) is not None, u'Store is persisted on commit.'
+        criticals = store.findings(severity=u'CRITICAL', state=[u'open', u'reopened'], tag=(u'Location', u'Paris'))
+        assert [f[u'asset'][u'uuid'] for f in criticals] == [u'a1']
+        assert sorted(a[u'id'] for a in store.assets(plugin_id=1)) == [u'a1', u'a2']
+        assert [f[u'plugin'][u'id'] for f in store.findings(cve=u'CVE-2014-0160', asset_uuid=u'a2')] == [1]
+        assert store.findings(state=u'reopened')[0][u'plugin'][u'name'] == u'Plugin 2', u'Plugins are joined back.'
+        assert store.plugin(2)[u'cve'] == []
+        assert store.findings(tenant=u'other') == []
+
+        client.export_helper.iter_assets.side_effect = lambda **kwargs: iter(
+            [AssetsExport(id=u'a2', terminated_at=u'2020-01-01T00:00:00Z')] if u'terminated_at' in kwargs else [])
+        client.export_helper.iter_vulns.return_value = iter([vuln(u'a1', 1, state=u'FIXED'),
+                                                             vuln(u'a1', 2, severity=u'medium')])
+        result = SyncHelper(client).sync(store)
+
+        assert result[0].deleted == [u'a2'] and result[1].deleted == [u'a1:1:0:TCP']
+        assert [a[u'id'] for a in store.assets(tag=(u'Location', u'Berlin'))] == [], u'Tags of removed assets go.'
+        assert [f[u'severity'] for f in store.findings()] == [u'medium'], \
+            u'Findings are upserted, and removed with their asset.'
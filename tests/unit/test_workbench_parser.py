@@ -0,0 +1,127 @@
+import os
+
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from tenable_io.api.workbenches import WorkbenchesApi
+from tenable_io.helpers.workbench import Finding, PluginTable, Vulnerability, WorkbenchHelper
+from tenable_io.parser.workbenches import WorkbenchParser
+from tests.base import BaseTest, NESSUS
+
+# Compliance items have children in the cm namespace, declared on the Report element.
+NESSUS_CM = NESSUS.replace(
+    b'<Report name="Workbench">', b'<Report name="Workbench" xmlns:cm="http://www.nessus.org/cm">'
+).replace(
+    b'<plugin_output>', b'<cm:compliance-result>PASSED</cm:compliance-result><plugin_output>'
+).replace(
+    b'pluginFamily="Service"', b'pluginFamily="Service" cm:audit="1"'
+)
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestWorkbenchParser(BaseTest):
+
+    def test_parse_stream_matches_file(self, tmpdir):
+        path = str(tmpdir.join(u'workbench.nessus'))
+        with open(path, 'wb') as fd:
+            fd.write(NESSUS)
+
+        for tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM]:
+            expected = list(WorkbenchParser.parse(path, tag))
+            # Chunks split the tags and attributes at arbitrary places, some are empty.
+            chunks = [b''] + chunked(NESSUS, 7) + [b'']
+            assert list(WorkbenchParser.parse_stream(iter(chunks), tag, WorkbenchParser.BACKEND_ETREE)) == expected
+
+        reports = list(WorkbenchParser.parse_stream(chunked(NESSUS, 64), backend=WorkbenchParser.BACKEND_ETREE))
+        assert [report[u'report_host'][u'name'] for report in reports] == [u'10.0.0.1', u'10.0.0.2']
+        assert reports[0][u'report_items'][0][u'cve'] == [u'CVE-2011-3389', u'CVE-2015-0204']
+
+    def test_backends_give_same_dicts(self):
+        for document in [NESSUS, NESSUS_CM]:
+            for tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM]:
+                expected = list(WorkbenchParser.parse_stream([document], tag, WorkbenchParser.BACKEND_ETREE))
+                assert list(WorkbenchParser.parse_stream(chunked(document, 5), tag,
+                                                         WorkbenchParser.BACKEND_EXPAT)) == expected
+
+        expat_ = WorkbenchParser.BACKEND_EXPAT
+        items = list(WorkbenchParser.parse_stream([NESSUS_CM], WorkbenchParser.REPORT_ITEM, expat_))
+        assert items[0][u'{http://www.nessus.org/cm}compliance-result'] == u'PASSED', u'Names are namespaced.'
+        assert items[1][u'{http://www.nessus.org/cm}audit'] == u'1'
+        item = list(WorkbenchParser.parse_stream([NESSUS], WorkbenchParser.REPORT_ITEM, expat_))[1]
+        assert item[u'description'] is None, u'Empty text is None.'
+        assert item[u'see_also'] == [u'a', u'<d> \xe9'], u'Text stops at the first child.'
+        report = list(WorkbenchParser.parse_stream([NESSUS], backend=expat_))[1]
+        assert report[u'host_properties'] == {u'host-ip': u'10.0.0.2', u'mac-address': [u'00:01', u'00:02'],
+                                              u'os': None}
+
+    def test_malformed_xml(self):
+        truncated = NESSUS[:NESSUS.index(b'<ReportHost name="10.0.0.2">') + 40]
+        for backend in WorkbenchParser.BACKENDS:
+            reports = list(WorkbenchParser.parse_stream([truncated], backend=backend))
+            assert [report[u'report_host'][u'name'] for report in reports] == [u'10.0.0.1'], \
+                u'Hosts parsed before the error are returned.'
+            assert list(WorkbenchParser.parse_stream([b''], backend=backend)) == []
+
+    def test_parse_parallel(self, tmpdir):
+        directory = str(tmpdir)
+        path = os.path.join(directory, u'workbench.nessus')
+        for document in [NESSUS, NESSUS_CM.replace(b'name="Workbench"', b'name="Work > bench"')]:
+            hosts = document[document.index(b'<ReportHost'):document.index(b'</Report>')]
+            with open(path, 'wb') as fd:
+                fd.write(document.replace(hosts, hosts * 5).replace(b'<Report ', b'<ReportHostList/><Report '))
+
+            for tag in [WorkbenchParser.REPORT_HOST, WorkbenchParser.REPORT_ITEM]:
+                expected = list(WorkbenchParser.parse(path, tag))
+                assert len(expected) == 10
+                # One range per host.
+                assert list(WorkbenchParser.parse_parallel(path, tag, processes=2, batch_size=1)) == expected, \
+                    u'The ranges are parsed within the namespace declarations of the report.'
+                unordered = list(WorkbenchParser.parse_parallel(path, tag, processes=2, ordered=False, batch_size=1))
+                assert sorted(unordered, key=repr) == sorted(expected, key=repr)
+            assert len(list(WorkbenchParser.parse_parallel(path, processes=2))) == 10, u'One range for a small file.'
+
+        empty = os.path.join(directory, u'empty.nessus')
+        open(empty, 'wb').close()
+        assert list(WorkbenchParser.parse_parallel(empty)) == []
+
+    def test_vulnerabilities_parse_streams_download(self):
+        client = Mock()
+        client.workbenches_api.export_status.return_value = WorkbenchesApi.STATUS_EXPORT_READY
+        client.workbenches_api.export_download.return_value = iter(chunked(NESSUS, 100))
+
+        pages = list(WorkbenchHelper(client).vulnerabilities_parse(page_size=1))
+        assert [[v.plugin_id for v in page] for page in pages] == [[u'104743'], [u'10267']]
+
+        client.workbenches_api.export_download.return_value = iter(chunked(NESSUS, 100))
+        pages = list(WorkbenchHelper(client).assets_parse())
+        assert [asset.asset.host_ip for asset in pages[0]] == [u'10.0.0.1', u'10.0.0.2']
+
+        client.workbenches_api.export_download.return_value = iter(chunked(NESSUS, 100))
+        pages = list(WorkbenchHelper(client).assets_parse(processes=2))
+        assert [asset.asset.host_ip for asset in pages[0]] == [u'10.0.0.1', u'10.0.0.2'], u'Parsed in parallel.'
+
+    def test_findings_share_plugins(self):
+        hosts = NESSUS[NESSUS.index(b'<ReportHost'):NESSUS.index(b'</Report>')]
+        document = NESSUS.replace(hosts, hosts * 3)
+        client = Mock()
+        client.workbenches_api.export_status.return_value = WorkbenchesApi.STATUS_EXPORT_READY
+        client.workbenches_api.export_download.return_value = iter([document])
+        plugins = PluginTable()
+
+        findings = [f for page in WorkbenchHelper(client).vulnerabilities_parse(plugins=plugins) for f in page]
+        assert len(findings) == 6 and len(plugins) == 2, u'Plugins are held once.'
+        assert findings[0].plugin is findings[2].plugin is plugins[u'104743']
+
+        items = list(WorkbenchParser.parse_stream([NESSUS], WorkbenchParser.REPORT_ITEM))
+        for finding, item in zip(findings, items):
+            vulnerability = Vulnerability().from_report_item(item)
+            for attribute in vars(vulnerability):
+                assert getattr(finding, attribute) == getattr(vulnerability, attribute), \
+                    u'Findings have the same attributes as vulnerabilities.'
+        assert not hasattr(findings[0], u'__dict__')
+        assert Finding().description is None